@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Persistent catalog of every KBYG.ai brand asset (SQLite)
+
+One row per file: format, byte size, dimensions, sha256 and the prompts
+manifest entry that produced it. Scans are incremental - files whose size
+and mtime match their row are skipped without being opened, so only new
+or changed files are parsed and hashed. Dimensions come from the file
+headers (PNG, JPEG, GIF, WebP, SVG), no image library needed.
+
+Generators record() what they write, and consumers call refresh() before
+querying: it stats directories only and rescans just those whose mtime
+moved (a file was added, removed or atomically replaced). scan() is the
+full walk, behind the consumers' --rescan flag.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import re
+import sqlite3
+import struct
+import time
+
+from fileutil import sha256_file
+from manifest import manifest_outputs
+
+BASE_DIR = Path(__file__).parent
+CATALOG_PATH = BASE_DIR / ".asset-catalog.sqlite"
+ASSET_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico",
+                  ".ttf", ".otf", ".woff", ".woff2"}
+SKIP_DIRS = {"__pycache__", "node_modules"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    format TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    sha256 TEXT NOT NULL,
+    manifest_entry TEXT
+);
+CREATE INDEX IF NOT EXISTS assets_dir ON assets (dir);
+CREATE INDEX IF NOT EXISTS assets_sha256 ON assets (sha256);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+_SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.S)
+_SVG_ATTR = re.compile(rb"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""")
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+def _svg_length(value):
+    match = re.match(rb"\s*([\d.]+)\s*(px)?\s*$", value)
+    return round(float(match.group(1))) if match else None
+
+def _svg_size(head):
+    tag = _SVG_TAG.search(head)
+    if not tag:
+        return None, None
+    attrs = dict(_SVG_ATTR.findall(tag.group(0)))
+    width = _svg_length(attrs.get(b"width", b""))
+    height = _svg_length(attrs.get(b"height", b""))
+    if (width is None or height is None) and b"viewBox" in attrs:
+        box = attrs[b"viewBox"].replace(b",", b" ").split()
+        if len(box) == 4:
+            width, height = round(float(box[2])), round(float(box[3]))
+    return width, height
+
+def _jpeg_size(handle):
+    handle.seek(2)
+    while True:
+        marker = handle.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None, None
+        if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+            continue
+        length = struct.unpack(">H", handle.read(2))[0]
+        if marker[1] in _JPEG_SOF:
+            height, width = struct.unpack(">xHH", handle.read(5))
+            return width, height
+        handle.seek(length - 2, os.SEEK_CUR)
+
+def read_header(path):
+    """(format, width, height) from the file header; dimensions are None when unknown"""
+    suffix = Path(path).suffix.lower().lstrip(".")
+    with open(path, "rb") as handle:
+        head = handle.read(4096)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+            return ("png",) + struct.unpack(">II", head[16:24])
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return ("gif",) + struct.unpack("<HH", head[6:10])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", head[26:30])
+                return "webp", width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                bits = int.from_bytes(head[21:25], "little")
+                return "webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return ("webp", int.from_bytes(head[24:27], "little") + 1,
+                        int.from_bytes(head[27:30], "little") + 1)
+            return "webp", None, None
+        if head[:2] == b"\xff\xd8":
+            return ("jpeg",) + _jpeg_size(handle)
+        if suffix == "svg" or _SVG_TAG.search(head):
+            return ("svg",) + _svg_size(head)
+    return (suffix or "unknown"), None, None
+
+def catalog_name(path):
+    """Catalog key for a path: relative to brand-assets/ when inside it"""
+    path = Path(path).absolute()
+    try:
+        return path.relative_to(BASE_DIR.absolute()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+def _catalog_path(name, directory=None, prefix=None):
+    """Filesystem path for a catalog name, joined onto directory as given when one is passed"""
+    if directory is not None and prefix not in ("", "."):
+        return Path(directory) / name[len(prefix) + 1:]
+    if directory is not None:
+        return Path(directory) / name
+    path = Path(name)
+    return path if path.is_absolute() else BASE_DIR / path
+
+def manifest_entries():
+    """{catalog name: "category/filename"} for every output the prompts manifest can produce"""
+    return {catalog_name(path): f"{category}/{filename}" for category, filename, path in manifest_outputs()}
+
+def _describe(path):
+    stat = path.stat()
+    fmt, width, height = read_header(path)
+    return stat.st_size, stat.st_mtime_ns, fmt, width, height, sha256_file(path)
+
+def _walk(root):
+    """Yield (path, stat) for asset files under root, skipping hidden files and directories"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or entry.name in SKIP_DIRS:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif Path(entry.name).suffix.lower() in ASSET_SUFFIXES:
+                    yield Path(entry.path), entry.stat()
+
+def _walk_dirs(root):
+    """Yield (directory, stat) for root and its subdirectories; files are listed but never stat'ed"""
+    stack = [Path(root)]
+    while stack:
+        directory = stack.pop()
+        yield directory, directory.stat()
+        with os.scandir(directory) as entries:
+            stack.extend(Path(entry.path) for entry in entries
+                         if entry.is_dir(follow_symlinks=False)
+                         and not entry.name.startswith(".") and entry.name not in SKIP_DIRS)
+
+def _files_in(directory):
+    """(path, stat) for the asset files directly inside directory"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (not entry.name.startswith(".") and entry.is_file(follow_symlinks=False)
+                    and Path(entry.name).suffix.lower() in ASSET_SUFFIXES):
+                yield Path(entry.path), entry.stat()
+
+def _dir_key(directory):
+    """Catalog name of a directory: the dir column of the files directly inside it ("" for brand-assets/)"""
+    name = catalog_name(directory)
+    return "" if name == "." else name
+
+def _subtree(column, key):
+    """SQL condition and params matching the directory key and everything below it"""
+    if key == "":
+        # Everything inside brand-assets/; paths outside it are cataloged absolute
+        return f"{column} NOT LIKE '/%'", []
+    # Range scan instead of LIKE so the primary key index is used
+    return f"({column} = ? OR ({column} >= ? AND {column} < ?))", [key, key + "/", key + "0"]
+
+class AssetCatalog:
+    """SQLite-backed asset catalog; use as a context manager or call close()"""
+
+    def __init__(self, path=CATALOG_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self._manifest = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def _manifest_entry(self, name):
+        # Loaded on the first lookup and kept until the next scan/refresh
+        if self._manifest is None:
+            self._manifest = manifest_entries()
+        return self._manifest.get(name)
+
+    def _upsert(self, name, described):
+        size, mtime_ns, fmt, width, height, checksum = described
+        self.db.execute(
+            "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (name, name.rpartition("/")[0], fmt, size, mtime_ns, width, height, checksum,
+             self._manifest_entry(name))
+        )
+
+    def _sync(self, files, known, workers):
+        """Upsert files whose size/mtime differ from known {name: (bytes, mtime_ns)}, delete rows not seen.
+        Returns (seen, updated, removed)"""
+        seen = 0
+        stale = []
+        for path, stat in files:
+            name = catalog_name(path)
+            seen += 1
+            if known.pop(name, None) != (stat.st_size, stat.st_mtime_ns):
+                stale.append((name, path))
+        # Parse and hash only what changed; hashing releases the GIL
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for (name, _), described in zip(stale, pool.map(lambda item: _describe(item[1]), stale)):
+                self._upsert(name, described)
+        self.db.executemany("DELETE FROM assets WHERE path = ?", ((name,) for name in known))
+        return seen, len(stale), len(known)
+
+    def _record_dirs(self, root):
+        condition, params = _subtree("path", _dir_key(root))
+        self.db.execute(f"DELETE FROM dirs WHERE {condition}", params)
+        self.db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?)",
+                            ((_dir_key(directory), stat.st_mtime_ns) for directory, stat in _walk_dirs(root)))
+
+    def scan(self, roots=(BASE_DIR,), workers=8):
+        """Full walk: bring the catalog up to date for roots; returns (files seen, files updated, rows removed)"""
+        self._manifest = None
+        seen = updated = removed = 0
+        for root in roots:
+            root = Path(root)
+            known = {row["path"]: (row["bytes"], row["mtime_ns"]) for row in self._under(_dir_key(root))}
+            counts = self._sync(_walk(root) if root.is_dir() else (), known, workers)
+            seen, updated, removed = seen + counts[0], updated + counts[1], removed + counts[2]
+            if root.is_dir():
+                self._record_dirs(root)
+        self.db.commit()
+        return seen, updated, removed
+
+    def refresh(self, roots, workers=8):
+        """Cheap freshness check before a query: rescan only the directories under roots whose
+        mtime changed since they were cataloged; returns the number of directories rescanned"""
+        self._manifest = None
+        rescanned = 0
+        for root in map(Path, roots):
+            if not root.is_dir():
+                continue
+            condition, params = _subtree("path", _dir_key(root))
+            known_dirs = dict(self.db.execute(f"SELECT path, mtime_ns FROM dirs WHERE {condition}", params).fetchall())
+            for directory, stat in _walk_dirs(root):
+                name = _dir_key(directory)
+                if known_dirs.pop(name, None) == stat.st_mtime_ns:
+                    continue
+                known = {row["path"]: (row["bytes"], row["mtime_ns"]) for row in
+                         self.db.execute("SELECT * FROM assets WHERE dir = ?", (name,))}
+                self._sync(_files_in(directory), known, workers)
+                self.db.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?)", (name, stat.st_mtime_ns))
+                rescanned += 1
+            # Directories that were removed
+            for name in known_dirs:
+                self.db.execute("DELETE FROM assets WHERE dir = ?", (name,))
+                self.db.execute("DELETE FROM dirs WHERE path = ?", (name,))
+        self.db.commit()
+        return rescanned
+
+    def record(self, path):
+        """Catalog a file a generator just wrote, without rescanning its directory"""
+        path = Path(path)
+        self._upsert(catalog_name(path), _describe(path))
+
+    def current(self, path):
+        """Row for path, re-read first if the file's size/mtime no longer match it (e.g. edited in place)"""
+        row = self.get(path)
+        stat = Path(path).stat()
+        if row is None or (row["bytes"], row["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            self.record(path)
+            row = self.get(path)
+        return row
+
+    def _under(self, prefix, suffix=None):
+        condition, params = _subtree("path", prefix)
+        query = f"SELECT * FROM assets WHERE {condition}"
+        if suffix:
+            query += " AND path LIKE ?"
+            params.append(f"%{suffix}")
+        return self.db.execute(query + " ORDER BY path", params)
+
+    def get(self, path):
+        row = self.db.execute("SELECT * FROM assets WHERE path = ?", (catalog_name(path),)).fetchone()
+        return dict(row) if row else None
+
+    def files(self, directory, suffix=None, recursive=True):
+        """Cataloged paths under directory (optionally only one suffix), in path order, joined onto directory"""
+        prefix = _dir_key(directory)
+        if recursive:
+            rows = self._under(prefix, suffix)
+        else:
+            query, params = "SELECT * FROM assets WHERE dir = ?", [prefix]
+            if suffix:
+                query += " AND path LIKE ?"
+                params.append(f"%{suffix}")
+            rows = self.db.execute(query + " ORDER BY path", params)
+        return [_catalog_path(row["path"], directory, prefix) for row in rows]
+
+    def count(self, directory, suffix=None, recursive=True):
+        return len(self.files(directory, suffix, recursive))
+
+    def with_checksum(self, checksum):
+        return [_catalog_path(row[0]) for row in
+                self.db.execute("SELECT path FROM assets WHERE sha256 = ? ORDER BY path", (checksum,))]
+
+    def summary(self):
+        """[(format, files, bytes)] across the catalog, largest first"""
+        return self.db.execute(
+            "SELECT format, COUNT(*), SUM(bytes) FROM assets GROUP BY format ORDER BY SUM(bytes) DESC"
+        ).fetchall()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Catalog KBYG.ai brand assets")
+    parser.add_argument("roots", nargs="*", type=Path, help="directories to scan (default: brand-assets/)")
+    parser.add_argument("--list", type=Path, metavar="DIR", help="list cataloged files under DIR after scanning")
+    args = parser.parse_args(argv)
+
+    print("🗂️  KBYG.ai Asset Catalog")
+    print("=" * 70)
+    started = time.monotonic()
+    with AssetCatalog() as catalog:
+        seen, updated, removed = catalog.scan(args.roots or [BASE_DIR])
+        print(f"📋 {seen} files scanned, {updated} updated, {removed} removed "
+              f"({time.monotonic() - started:.2f}s)")
+        if args.list:
+            for path in catalog.files(args.list):
+                row = catalog.get(path)
+                size = f"{row['width']}x{row['height']}" if row["width"] else "-"
+                entry = f"  ← {row['manifest_entry']}" if row["manifest_entry"] else ""
+                print(f"   {row['path']}  {row['format']} {size} {row['bytes'] / 1024:.0f} KB{entry}")
+        print("\n📊 By format:")
+        for fmt, files, size in catalog.summary():
+            print(f"   {fmt:6s} {files:5d} files {size / 1024 / 1024:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Compose platform banners from generated hero imagery
+Requires: Pillow
+
+Each hero is smart-cropped to every size in create_banners.BANNERS: the
+crop keeps the target aspect ratio at the largest possible size and
+slides along the free axis to the window with the most edge detail.
+A brand gradient tint, the logo mark, wordmark and tagline are laid
+over it with the same geometry as the SVG banners.
+
+Decoded sources, their detail profiles and the resized crops are held in
+in-process LRU caches keyed by path and mtime, and each worker composes
+every banner for one hero, so a hero is decoded once however many
+platforms it feeds. Outputs whose bytes would not change are left alone.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
+import os
+from pathlib import Path
+import sys
+import time
+
+try:
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+except ImportError:
+    Image = None
+
+from asset_catalog import AssetCatalog
+from create_banners import BANNERS, BANNERS_DIR
+from fileutil import write_if_changed
+from palette import load_palette
+from png_writer import hex_to_rgb
+
+BASE_DIR = Path(__file__).parent
+# Landscape heroes crop well to every banner; pass square/mobile ones explicitly
+HERO_ROOTS = [
+    BASE_DIR / "images" / "heroes" / "desktop",
+    BASE_DIR / "images" / "ai-generated" / "heroes",
+    BASE_DIR / "images" / "ai-generated" / "landing-page" / "heroes",
+]
+OUTPUT_DIR = BANNERS_DIR / "composed"
+FONTS_DIR = BASE_DIR / "fonts"
+TAGLINE = "Intelligence Extraction for Revenue Teams"
+ANALYSIS_SIZE = 256  # long edge of the image the crop search runs on
+TINT_OPACITY = (0.75, 0.25)  # brand gradient opacity at the left and right edges
+SUPERSAMPLE = 4  # the logo mark is drawn this much larger, then downsampled for anti-aliasing
+FORMATS = {"png": {}, "jpeg": {"quality": 90}, "webp": {"quality": 90, "method": 6}}
+# Static fallbacks when the variable font or its weight axis is unavailable
+STATIC_FONTS = {300: "Inter-Light.ttf", 600: "Inter-SemiBold.ttf", 800: "Inter-ExtraBold.ttf"}
+
+@lru_cache(maxsize=4)
+def load_source(path, mtime_ns):
+    """Decoded RGB hero; mtime_ns only keys the cache"""
+    with Image.open(path) as image:
+        return image.convert("RGB")
+
+@lru_cache(maxsize=8)
+def detail_profile(path, mtime_ns, axis):
+    """Mean edge energy per column (axis 0) or row (axis 1) of a downscaled copy, and its scale"""
+    source = load_source(path, mtime_ns)
+    scale = ANALYSIS_SIZE / max(source.size)
+    small = source.resize((max(1, round(source.width * scale)), max(1, round(source.height * scale))),
+                          Image.Resampling.BOX)
+    edges = small.convert("L").filter(ImageFilter.FIND_EDGES)
+    line = edges.resize((edges.width, 1) if axis == 0 else (1, edges.height), Image.Resampling.BOX)
+    return list(line.tobytes()), scale
+
+def crop_box(path, mtime_ns, width, height):
+    """Largest box with the target aspect ratio, placed over the most detailed stretch of the image"""
+    source = load_source(path, mtime_ns)
+    if source.width * height > source.height * width:
+        # Source is wider than the target: full height, slide horizontally
+        axis, full, crop = 0, source.width, source.height * width / height
+    else:
+        axis, full, crop = 1, source.height, source.width * height / width
+    profile, scale = detail_profile(path, mtime_ns, axis)
+    window = max(1, min(len(profile), round(crop * scale)))
+    total = best = sum(profile[:window])
+    best_start = 0
+    for start in range(1, len(profile) - window + 1):
+        total += profile[start + window - 1] - profile[start - 1]
+        if total > best:
+            best, best_start = total, start
+    offset = min(best_start / scale, full - crop)
+    if axis == 0:
+        return (offset, 0, offset + crop, source.height)
+    return (0, offset, source.width, offset + crop)
+
+@lru_cache(maxsize=32)
+def smart_crop(path, mtime_ns, width, height):
+    """The hero cropped and resized to width x height"""
+    source = load_source(path, mtime_ns)
+    return source.resize((width, height), Image.Resampling.LANCZOS, box=crop_box(path, mtime_ns, width, height))
+
+@lru_cache(maxsize=None)
+def _font(weight, size):
+    try:
+        font = ImageFont.truetype(str(FONTS_DIR / "InterVariable.ttf"), size)
+        # Axes are optical size (14-32) then weight
+        font.set_variation_by_axes([min(max(size, 14), 32), weight])
+        return font
+    except (OSError, ValueError):
+        pass
+    try:
+        return ImageFont.truetype(str(FONTS_DIR / STATIC_FONTS[weight]), size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+def brand_stops():
+    """Brand palette colors as RGB tuples, loaded once per run and passed to every worker"""
+    return tuple(hex_to_rgb(token["value"]) for token in load_palette()["brand"].values())
+
+def _gradient_tint(width, height, stops):
+    """Brand gradient (left to right) with opacity fading from TINT_OPACITY[0] to [1]"""
+    colors = Image.new("RGB", (len(stops), 1))
+    colors.putdata(stops)
+    colors = colors.resize((width, 1), Image.Resampling.BILINEAR).resize((width, height))
+    left, right = (round(opacity * 255) for opacity in TINT_OPACITY)
+    alpha = Image.linear_gradient("L").rotate(90, expand=True).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    alpha = alpha.point(lambda value: left + (right - left) * value // 255).resize((width, height))
+    colors.putalpha(alpha)
+    return colors
+
+def _logo_mark(size):
+    """The 40x40 network mark from create_banners at size px, anti-aliased by supersampling"""
+    unit = size * SUPERSAMPLE / 40
+    mark = Image.new("RGBA", (round(40 * unit),) * 2, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(mark)
+
+    def dot(x, y, r, opacity=1.0):
+        draw.ellipse([(x - r) * unit, (y - r) * unit, (x + r) * unit, (y + r) * unit],
+                     fill=(255, 255, 255, round(255 * opacity)))
+
+    for x1, y1 in ((12, 15), (28, 15), (12, 25), (28, 25)):
+        draw.line([x1 * unit, y1 * unit, 20 * unit, 25 * unit], fill=(255, 255, 255, 153), width=round(1.5 * unit))
+    draw.ellipse([2 * unit, 2 * unit, 38 * unit, 38 * unit], outline="white", width=round(2.5 * unit))
+    for x, y in ((12, 15), (28, 15), (20, 25)):
+        dot(x, y, 2.5)
+    for x, y in ((12, 25), (28, 25)):
+        dot(x, y, 2, 0.7)
+    return mark.resize((size, size), Image.Resampling.LANCZOS)
+
+def compose_banner(hero, width, height, stops, logo=True):
+    """RGB banner: smart-cropped hero, brand tint, then logo and tagline laid out like create_banner_svg"""
+    hero = Path(hero)
+    banner = smart_crop(str(hero), hero.stat().st_mtime_ns, width, height).convert("RGBA")
+    banner.alpha_composite(_gradient_tint(width, height, stops))
+    if logo:
+        scale = min(height / 60 * 0.6, 1)
+        x, middle = 40, height // 2
+        top = middle - 30 * scale
+        banner.alpha_composite(_logo_mark(round(40 * scale)), (x, round(top)))
+
+        text = Image.new("RGBA", banner.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(text)
+        baseline = top + 30 * scale
+        wordmark = _font(800, round(24 * scale))
+        draw.text((x + 45 * scale, baseline), "kbyg", font=wordmark, fill="white", anchor="ls")
+        # Measured rather than the SVG's fixed x=95, which assumes the browser's Inter metrics
+        suffix_x = x + 45 * scale + draw.textlength("kbyg", font=wordmark)
+        suffix = _font(300, round(24 * scale))
+        draw.text((suffix_x, baseline), ".ai", font=suffix, fill="white", anchor="ls")
+        tagline_x = max(x + 130 * scale, suffix_x + draw.textlength(".ai", font=suffix) + 16 * scale)
+        draw.text((tagline_x, middle + 5), TAGLINE, font=_font(600, round(14 * scale)),
+                  fill=(255, 255, 255, 230), anchor="ls")
+        banner.alpha_composite(text)
+    return banner.convert("RGB")
+
+def output_path(hero, banner, fmt, output_dir=OUTPUT_DIR):
+    """composed/<hero>/<banner>.<fmt>"""
+    return Path(output_dir) / Path(hero).stem / f"{Path(banner).stem}.{fmt}"
+
+def compose_hero(hero, banners, stops, fmt="png", logo=True, output_dir=OUTPUT_DIR):
+    """Every banner for one hero (runs in a worker); returns ([(path, changed, ms)], source decodes)"""
+    decodes = load_source.cache_info().misses
+    results = []
+    for banner in banners:
+        started = time.monotonic()
+        width, height, _ = BANNERS[banner]
+        buffer = io.BytesIO()
+        compose_banner(hero, width, height, stops, logo).save(buffer, format=fmt.upper(), **FORMATS[fmt])
+        path = output_path(hero, banner, fmt, output_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        changed = write_if_changed(path, buffer.getvalue())
+        results.append((path, changed, (time.monotonic() - started) * 1000))
+    return results, load_source.cache_info().misses - decodes
+
+def find_heroes(roots, rescan=False):
+    """PNG files given directly, plus every cataloged PNG under the given directories"""
+    heroes = [Path(root) for root in roots if not Path(root).is_dir()]
+    roots = [Path(root) for root in roots if Path(root).is_dir()]
+    with AssetCatalog() as catalog:
+        if rescan:
+            catalog.scan(roots)
+        else:
+            catalog.refresh(roots)
+        return heroes + [path for root in roots for path in catalog.files(root, ".png")]
+
+def _relative(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compose KBYG.ai platform banners from hero imagery")
+    parser.add_argument("heroes", nargs="*", type=Path,
+                        help="hero PNGs or directories (default: images/heroes/desktop and the AI-generated heroes)")
+    parser.add_argument("--platforms", default=None,
+                        help="comma-separated platforms, e.g. linkedin,youtube (default: all)")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="output format (default: png)")
+    parser.add_argument("--no-logo", action="store_true", help="leave out the logo and tagline")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="output directory (default: banners/composed/)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--rescan", action="store_true",
+                        help="walk the hero directories instead of trusting the asset catalog")
+    args = parser.parse_args(argv)
+
+    print("🖼️  KBYG.ai Banner Composer")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+
+    heroes = find_heroes(args.heroes or [root for root in HERO_ROOTS if root.exists()], args.rescan)
+    platforms = args.platforms.split(",") if args.platforms else None
+    banners = [name for name in BANNERS if platforms is None or name.split("/")[0] in platforms]
+    if not heroes or not banners:
+        print("⚠️  Nothing to compose (no heroes or no matching platforms)")
+        return
+
+    print(f"📋 {len(heroes)} heroes x {len(banners)} banner sizes = {len(heroes) * len(banners)} banners")
+    started = time.monotonic()
+    stops = brand_stops()
+    written = decodes = 0
+    # One hero per task, so each worker decodes its hero once for every size
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count()) as pool:
+        futures = {hero: pool.submit(compose_hero, hero, banners, stops, args.format, not args.no_logo,
+                                     args.output)
+                   for hero in heroes}
+        for hero, future in futures.items():
+            results, hero_decodes = future.result()
+            decodes += hero_decodes
+            print(f"\n   {_relative(hero)}")
+            for path, changed, ms in results:
+                written += changed
+                print(f"   {'✅' if changed else '⏭️ '} {_relative(path)} ({ms:.0f} ms)")
+
+    total = len(heroes) * len(banners)
+    print(f"\n✅ Composed {total} banners in {time.monotonic() - started:.1f}s "
+          f"({written} written, {total - written} unchanged)")
+    print(f"   Source decodes: {decodes} for {len(heroes)} heroes")
+
+if __name__ == "__main__":
+    main()
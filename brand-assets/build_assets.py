@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Incremental build of every generated KBYG.ai brand asset
+
+Each output is a build_graph Target that declares what it is made from:
+the template function that renders it, palette.json and the modules that
+compile it, and - for image prompts - the manifest entries themselves.
+Only targets whose inputs or outputs changed since the last run are
+rebuilt, independent targets build in parallel, and outputs whose bytes
+come out identical are left untouched. A no-op rebuild only stats files.
+
+Imagen output is not part of the graph: generate_images_with_imagen.py
+already skips entries through its own cache and journal.
+"""
+
+import argparse
+import os
+from pathlib import Path
+import time
+
+from build_graph import STATE_PATH, BuildGraph, Target
+import create_banners
+import create_logo_variations
+from fileutil import write_if_changed
+import generate_assets
+import manifest
+import palette
+import png_writer
+import svg_model
+import swatches
+import theme_matrix
+
+BASE_DIR = Path(__file__).parent
+
+def _module_path(module):
+    return Path(module.__file__)
+
+def _write_svg(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(path, content.encode("utf-8"))
+
+def color_targets():
+    colors_dir = BASE_DIR / "colors"
+    palette_inputs = [palette.PALETTE_PATH, _module_path(palette)]
+    tokens = palette.load_palette()
+    swatch_names = list(palette.swatch_colors(tokens))
+    swatch_files = ([f"swatch-{name}.png" for name in swatch_names] + ["swatch-all-colors.png"]
+                    + [f"swatch-{name}-ramp.png" for name in tokens["brand"]])
+    return [
+        Target("colors:exports",
+               [colors_dir / filename for filename in palette.COMPILERS] + [colors_dir / "README.md"],
+               generate_assets.create_color_files,
+               palette_inputs + [generate_assets.create_color_files]),
+        Target("colors:swatches",
+               [colors_dir / filename for filename in swatch_files],
+               generate_assets.generate_color_swatches,
+               palette_inputs + [_module_path(swatches), _module_path(png_writer),
+                                 generate_assets.generate_color_swatches]),
+    ]
+
+def document_targets():
+    readmes = ["README.md", "logos/README.md", "heroes/README.md", "banners/README.md", "clip-art/README.md"]
+    manifests = ["IMAGEN_PROMPTS_MANIFEST.json", "IMAGEN_PROMPTS_MANIFEST.jsonl", "IMAGEN_PROMPTS_MANIFEST.md"]
+    prompts = {name: getattr(generate_assets, name) for name in dir(generate_assets) if name.endswith("_PROMPTS")}
+    return [
+        Target("docs:readmes", [BASE_DIR / path for path in readmes],
+               generate_assets.create_readme_files, [generate_assets.create_readme_files]),
+        Target("docs:fonts", [BASE_DIR / "fonts" / "README.md", BASE_DIR / "fonts" / "SPECIMEN.md"],
+               generate_assets.create_font_package, [generate_assets.create_font_package]),
+        Target("docs:prompts-manifest", [BASE_DIR / path for path in manifests],
+               generate_assets.create_prompts_manifest,
+               [generate_assets.create_prompts_manifest, _module_path(manifest), prompts]),
+    ]
+
+def logo_targets():
+    targets = []
+    for combination in theme_matrix.expand(theme_matrix.LAYOUTS, theme_matrix.PALETTES,
+                                           theme_matrix.SIZES, theme_matrix.FORMATS):
+        path = theme_matrix.output_path(combination)
+        recolor = theme_matrix.PALETTES[combination.palette]
+
+        def build(combination=combination, path=path, recolor=recolor):
+            _write_svg(path, theme_matrix._document(combination.layout).render(recolor, combination.scale))
+
+        targets.append(Target(f"logo:{path.stem}", [path], build,
+                              [theme_matrix.LAYOUTS[combination.layout], recolor, combination.scale,
+                               palette.PALETTE_PATH, _module_path(svg_model)]))
+
+    icons_dir = theme_matrix.LOGOS_DIR / "icon-only"
+
+    def build_icons():
+        for name, content in create_logo_variations.create_icon_svgs().items():
+            _write_svg(icons_dir / name, content)
+
+    targets.append(Target("logo:icon-only", [icons_dir / name for name in create_logo_variations.create_icon_svgs()],
+                          build_icons, [create_logo_variations.create_icon_svgs, palette.PALETTE_PATH]))
+    return targets
+
+def banner_targets():
+    targets = []
+    for filename, (width, height, platform) in create_banners.BANNERS.items():
+        path = create_banners.BANNERS_DIR / filename
+
+        def build(path=path, width=width, height=height, platform=platform):
+            _write_svg(path, create_banners.create_banner_svg(width, height, platform))
+
+        targets.append(Target(f"banner:{path.stem}", [path], build,
+                              [create_banners.create_banner_svg, [width, height, platform], palette.PALETTE_PATH]))
+    return targets
+
+def all_targets():
+    return color_targets() + document_targets() + logo_targets() + banner_targets()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the KBYG.ai brand assets whose inputs changed")
+    parser.add_argument("targets", nargs="*",
+                        help="target names or prefixes such as logo: or banner: (default: everything)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="parallel builds (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="rebuild every selected target")
+    parser.add_argument("--dry-run", action="store_true", help="list stale targets without building them")
+    parser.add_argument("--list", action="store_true", help="list targets and their outputs")
+    args = parser.parse_args(argv)
+
+    started = time.monotonic()
+    graph = BuildGraph(all_targets(), STATE_PATH)
+
+    if args.list:
+        for name in sorted(graph.selected(args.targets)):
+            outputs = ", ".join(path.relative_to(BASE_DIR).as_posix() for path in graph.targets[name].outputs)
+            print(f"{name}: {outputs}")
+        return
+
+    print("🔨 KBYG.ai Asset Build")
+    print("=" * 70)
+    label = "Stale" if args.dry_run else "Built"
+    built, up_to_date = graph.build(args.targets, args.jobs, args.force, args.dry_run,
+                                    on_built=lambda name: print(f"   ✅ {label}: {name}"))
+    print(f"\n✅ {built} {label.lower()}, {up_to_date} up to date in {time.monotonic() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Make-style incremental build graph for the brand-asset generators
+
+A Target declares its outputs, a build function and its inputs: files
+(hashed by content), functions (hashed by source) and plain values such
+as a manifest entry (hashed as canonical JSON). The combined input hash
+and each output's size/mtime are stored in .build-state.json; a target
+is rebuilt only when its input hash changed or an output was modified or
+deleted. File hashes are cached by stat, so a no-op build reads no file
+contents and writes nothing.
+
+Targets that consume another target's output files run after it; all
+other targets build in parallel on a thread pool.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import hashlib
+import inspect
+import json
+from pathlib import Path
+
+from fileutil import atomic_write_text, sha256_file
+
+BASE_DIR = Path(__file__).parent
+STATE_PATH = BASE_DIR / ".build-state.json"
+
+class Target:
+    def __init__(self, name, outputs, build, inputs=()):
+        self.name = name
+        self.outputs = [Path(path) for path in outputs]
+        self.build = build
+        self.inputs = list(inputs)
+
+def _key(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+def _stat(path):
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+class BuildGraph:
+    def __init__(self, targets, state_path=STATE_PATH):
+        self.targets = {target.name: target for target in targets}
+        self.state_path = Path(state_path)
+        self.state = {"targets": {}, "files": {}}
+        if self.state_path.exists():
+            self.state = json.loads(self.state_path.read_text())
+        self.dirty = False
+        producers = {_key(path): target.name for target in targets for path in target.outputs}
+        self.deps = {
+            target.name: {producers[_key(item)] for item in target.inputs
+                          if isinstance(item, Path) and _key(item) in producers} - {target.name}
+            for target in targets
+        }
+
+    def _file_hash(self, path):
+        """Content hash, reusing the cached one while size and mtime are unchanged"""
+        key = _key(path)
+        stat = _stat(path)
+        if stat is None:
+            return "missing"
+        cached = self.state["files"].get(key)
+        if cached and cached[:2] == stat:
+            return cached[2]
+        digest = sha256_file(path)
+        self.state["files"][key] = stat + [digest]
+        self.dirty = True
+        return digest
+
+    def input_hash(self, target):
+        digest = hashlib.sha256()
+        for item in target.inputs:
+            if isinstance(item, Path):
+                part = f"file:{_key(item)}:{self._file_hash(item)}"
+            elif callable(item):
+                part = f"source:{item.__module__}.{item.__qualname__}:{inspect.getsource(item)}"
+            else:
+                part = "value:" + json.dumps(item, sort_keys=True, default=str)
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def is_stale(self, target, input_hash):
+        record = self.state["targets"].get(target.name)
+        if record is None or record["inputs"] != input_hash:
+            return True
+        return any(record["outputs"].get(_key(path)) != _stat(path) for path in target.outputs)
+
+    def _run(self, target, force, dry_run):
+        input_hash = self.input_hash(target)
+        if not force and not self.is_stale(target, input_hash):
+            return False
+        if not dry_run:
+            target.build()
+            self.dirty = True
+            self.state["targets"][target.name] = {
+                "inputs": input_hash,
+                "outputs": {_key(path): _stat(path) for path in target.outputs},
+            }
+        return True
+
+    def selected(self, names=None):
+        """The named targets (or prefixes like "logo:") plus everything they depend on"""
+        if not names:
+            return set(self.targets)
+        pending = [name for name in self.targets if any(name == n or name.startswith(n) for n in names)]
+        closure = set()
+        while pending:
+            name = pending.pop()
+            if name not in closure:
+                closure.add(name)
+                pending.extend(self.deps[name])
+        return closure
+
+    def build(self, names=None, jobs=8, force=False, dry_run=False, on_built=None):
+        """Build stale targets, dependencies first; returns (built, up_to_date)"""
+        todo = self.selected(names)
+        waiting = {name: self.deps[name] & todo for name in todo}
+        built = up_to_date = 0
+        running = {}
+        try:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                while waiting or running:
+                    for name in [name for name, deps in waiting.items() if not deps]:
+                        del waiting[name]
+                        running[pool.submit(self._run, self.targets[name], force, dry_run)] = name
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        if future.result():
+                            built += 1
+                            if on_built is not None:
+                                on_built(name)
+                        else:
+                            up_to_date += 1
+                        for deps in waiting.values():
+                            deps.discard(name)
+        finally:
+            if self.dirty and not dry_run:
+                atomic_write_text(self.state_path, json.dumps(self.state, indent=1, sort_keys=True))
+        return built, up_to_date
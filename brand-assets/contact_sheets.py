@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Thumbnail cache and per-category contact sheets for KBYG.ai imagery
+Requires: Pillow
+
+Images stream through decode -> downscale -> composite one at a time per
+worker: each full-resolution decode is reduced (draft/reduce) and closed
+before the next one starts, so memory is bounded by the worker count and
+the sheet canvases, never by the library size. Thumbnails are cached in
+.thumb-cache/ keyed by source path, size and mtime.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import io
+import json
+import math
+import os
+from pathlib import Path
+import sys
+import time
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    Image = None
+
+from asset_catalog import AssetCatalog
+from fileutil import atomic_write_bytes, atomic_write_text
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_ROOTS = [BASE_DIR / "images" / "clip-art", BASE_DIR / "images" / "heroes"]
+THUMB_CACHE_DIR = BASE_DIR / ".thumb-cache"
+SHEETS_DIR = BASE_DIR / "contact-sheets"
+THUMB_SIZE = 256
+COLUMNS = 6
+LABEL_HEIGHT = 20
+BACKGROUND = (243, 244, 246)
+LABEL_COLOR = (17, 24, 39)
+
+def _relative(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+def thumb_key(path, size):
+    """Cache key that changes whenever the source file changes"""
+    stat = Path(path).stat()
+    raw = f"{_relative(path)}:{stat.st_size}:{stat.st_mtime_ns}:{size}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+def render_thumbnail(path, size=THUMB_SIZE):
+    """Decode one image at reduced scale and return (PNG bytes, seconds)"""
+    started = time.monotonic()
+    with Image.open(path) as image:
+        # JPEG decodes straight to a smaller scale; other formats reduce while loading
+        image.draft("RGB", (size, size))
+        image.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue(), time.monotonic() - started
+
+class ThumbnailCache:
+    """Thumbnails stored as .thumb-cache/<key>.png, with stale files removed on change"""
+
+    def __init__(self, root=THUMB_CACHE_DIR, size=THUMB_SIZE):
+        self.root = Path(root)
+        self.size = size
+        self.index_path = self.root / "index.json"
+        self.index = {"thumbs": {}, "sheets": {}}
+        if self.index_path.exists():
+            self.index.update(json.loads(self.index_path.read_text()))
+        self.hits = 0
+        self.rendered = 0
+        self.render_seconds = 0.0
+
+    def lookup(self, path):
+        """(key, cached bytes or None) for a source"""
+        key = thumb_key(path, self.size)
+        thumb_path = self.root / f"{key}.png"
+        if thumb_path.exists():
+            self.hits += 1
+            return key, thumb_path.read_bytes()
+        return key, None
+
+    def store(self, path, key, data, seconds):
+        self.root.mkdir(parents=True, exist_ok=True)
+        name = _relative(path)
+        previous = self.index["thumbs"].get(name)
+        if previous and previous != key:
+            (self.root / f"{previous}.png").unlink(missing_ok=True)
+        atomic_write_bytes(self.root / f"{key}.png", data)
+        self.index["thumbs"][name] = key
+        self.rendered += 1
+        self.render_seconds += seconds
+
+    def save(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.index_path, json.dumps(self.index, indent=2, sort_keys=True))
+
+def find_categories(roots, rescan=False):
+    """{category: [png paths]} - one category per directory that holds images"""
+    categories = {}
+    with AssetCatalog() as catalog:
+        if rescan:
+            catalog.scan(roots)
+        else:
+            catalog.refresh(roots)
+        for root in map(Path, roots):
+            for path in catalog.files(root, ".png"):
+                directory = path.parent.relative_to(root.parent).as_posix()
+                categories.setdefault(directory, []).append(path)
+    return categories
+
+def iter_thumbnails(paths, cache, pool):
+    """Yield (path, thumbnail bytes) in order, rendering cache misses on the pool"""
+    pending = {}
+    keys = {}
+    for path in paths:
+        key, data = cache.lookup(path)
+        keys[path] = key
+        if data is None:
+            pending[path] = pool.submit(render_thumbnail, path, cache.size)
+        else:
+            pending[path] = data
+    for path in paths:
+        result = pending.pop(path)
+        if not isinstance(result, bytes):
+            data, seconds = result.result()
+            cache.store(path, keys[path], data, seconds)
+            result = data
+        yield path, result
+
+def build_sheet(category, paths, cache, pool, output_dir=SHEETS_DIR, columns=COLUMNS):
+    """Composite one category's thumbnails into a labelled grid PNG; returns (path, rebuilt)"""
+    output_path = output_dir / f"{category.replace('/', '--')}.png"
+    signature = hashlib.sha256(
+        f"{columns}:".encode("utf-8") + b"".join(thumb_key(path, cache.size).encode("utf-8") for path in paths)
+    ).hexdigest()
+    if output_path.exists() and cache.index["sheets"].get(category) == signature:
+        cache.hits += len(paths)
+        return output_path, False
+    
+    cell = cache.size
+    rows = math.ceil(len(paths) / columns)
+    sheet = Image.new("RGB", (min(columns, len(paths)) * cell, rows * (cell + LABEL_HEIGHT)), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+    
+    for index, (path, data) in enumerate(iter_thumbnails(paths, cache, pool)):
+        x = (index % columns) * cell
+        y = (index // columns) * (cell + LABEL_HEIGHT)
+        with Image.open(io.BytesIO(data)) as thumb:
+            offset = (x + (cell - thumb.width) // 2, y + (cell - thumb.height) // 2)
+            sheet.paste(thumb, offset, thumb if thumb.mode == "RGBA" else None)
+        draw.text((x + 4, y + cell + 4), path.name[:40], fill=LABEL_COLOR)
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    buffer = io.BytesIO()
+    sheet.save(buffer, format="PNG")
+    atomic_write_bytes(output_path, buffer.getvalue())
+    cache.index["sheets"][category] = signature
+    return output_path, True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build thumbnail contact sheets for KBYG.ai imagery")
+    parser.add_argument("roots", nargs="*", type=Path,
+                        help="directories to scan (default: images/clip-art, images/heroes)")
+    parser.add_argument("--size", type=int, default=THUMB_SIZE, help=f"thumbnail size (default: {THUMB_SIZE})")
+    parser.add_argument("--columns", type=int, default=COLUMNS, help=f"sheet columns (default: {COLUMNS})")
+    parser.add_argument("--workers", type=int, default=None, help="decode processes (default: all cores)")
+    parser.add_argument("--rescan", action="store_true", help="walk the roots instead of trusting the asset catalog")
+    args = parser.parse_args(argv)
+    
+    print("🗂️  KBYG.ai Contact Sheets")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+    
+    cache = ThumbnailCache(size=args.size)
+    categories = find_categories(args.roots or DEFAULT_ROOTS, args.rescan)
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count()) as pool:
+        for category, paths in categories.items():
+            output_path, rebuilt = build_sheet(category, paths, cache, pool, columns=args.columns)
+            status = "✅" if rebuilt else "⏭️ "
+            print(f"   {status} {category}: {len(paths)} images -> {_relative(output_path)}")
+    cache.save()
+    elapsed = time.monotonic() - started
+    
+    total = cache.hits + cache.rendered
+    print(f"\n✅ {len(categories)} contact sheets, {total} thumbnails in {elapsed:.1f}s")
+    print(f"   Cache: {cache.hits} hits, {cache.rendered} rendered")
+    if cache.rendered:
+        print(f"   Render throughput: {cache.rendered / cache.render_seconds:.1f} thumbnails/s per worker, "
+              f"{cache.rendered / elapsed:.1f} thumbnails/s overall")
+
+if __name__ == "__main__":
+    main()
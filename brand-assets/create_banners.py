@@ -3,11 +3,49 @@
 Create KBYG.ai platform-specific banners
 """
 
+import argparse
 from pathlib import Path
 
+from asset_catalog import AssetCatalog
+from palette import color_values, load_palette
+
 BASE_DIR = Path(__file__).parent
 BANNERS_DIR = BASE_DIR / "banners"
 
+# Gradient stops from palette.json
+COLORS = color_values(load_palette())
+GTM_BLUE = COLORS["gtm-blue"]
+CONFERENCE_PURPLE = COLORS["conference-purple"]
+REVENUE_CYAN = COLORS["revenue-cyan"]
+
+PLATFORMS = ["linkedin", "twitter", "facebook", "youtube", "email", "website", "mobile"]
+
+# {path under banners/: (width, height, platform label)}
+BANNERS = {
+    # LinkedIn
+    "linkedin/linkedin-cover-1584x396.svg": (1584, 396, "LinkedIn"),
+    
+    # Twitter/X
+    "twitter/twitter-header-1500x500.svg": (1500, 500, "Twitter/X"),
+    
+    # Facebook
+    "facebook/facebook-cover-820x312.svg": (820, 312, "Facebook"),
+    
+    # YouTube
+    "youtube/youtube-banner-2560x1440.svg": (2560, 1440, "YouTube"),
+    
+    # Email headers
+    "email/email-header-600x200.svg": (600, 200, "Email"),
+    "email/email-header-800x200.svg": (800, 200, "Email"),
+    
+    # Website hero banners
+    "website/website-hero-1920x600.svg": (1920, 600, "Website"),
+    "website/website-hero-2560x800.svg": (2560, 800, "Website"),
+    
+    # Mobile banners
+    "mobile/mobile-banner-750x300.svg": (750, 300, "Mobile"),
+}
+
 def create_banner_svg(width, height, platform, has_logo=True):
     """Create banner with gradient background and optional logo"""
     
@@ -54,9 +92,9 @@ def create_banner_svg(width, height, platform, has_logo=True):
     return f'''<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <linearGradient id="banner-gradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#3b82f6;stop-opacity:1" />
-      <stop offset="50%" style="stop-color:#8b5cf6;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#06b6d4;stop-opacity:1" />
+      <stop offset="0%" style="stop-color:{GTM_BLUE};stop-opacity:1" />
+      <stop offset="50%" style="stop-color:{CONFERENCE_PURPLE};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{REVENUE_CYAN};stop-opacity:1" />
     </linearGradient>
   </defs>
   
@@ -70,48 +108,29 @@ def create_banner_svg(width, height, platform, has_logo=True):
   <text x="{width - 10}" y="{height - 10}" text-anchor="end" font-family="'Inter', sans-serif" font-size="10" fill="white" opacity="0.4">{platform.upper()} {width}x{height}</text>
 </svg>'''
 
-def main():
+def main(argv=None):
+    argparse.ArgumentParser(description="Create the KBYG.ai platform-specific banner SVGs").parse_args(argv)
+    
     print("🎨 Creating platform-specific banners...")
     
     # Create subdirectories
-    platforms = ["linkedin", "twitter", "facebook", "youtube", "email", "website", "mobile"]
-    for platform in platforms:
+    for platform in PLATFORMS:
         (BANNERS_DIR / platform).mkdir(exist_ok=True)
     
-    banners = {
-        # LinkedIn
-        "linkedin/linkedin-cover-1584x396.svg": (1584, 396, "LinkedIn"),
-        
-        # Twitter/X
-        "twitter/twitter-header-1500x500.svg": (1500, 500, "Twitter/X"),
-        
-        # Facebook
-        "facebook/facebook-cover-820x312.svg": (820, 312, "Facebook"),
+    with AssetCatalog() as catalog:
+        for filename, (width, height, platform) in BANNERS.items():
+            content = create_banner_svg(width, height, platform)
+            (BANNERS_DIR / filename).write_text(content)
+            catalog.record(BANNERS_DIR / filename)
+            print(f"   ✅ {filename}")
         
-        # YouTube
-        "youtube/youtube-banner-2560x1440.svg": (2560, 1440, "YouTube"),
-        
-        # Email headers
-        "email/email-header-600x200.svg": (600, 200, "Email"),
-        "email/email-header-800x200.svg": (800, 200, "Email"),
-        
-        # Website hero banners
-        "website/website-hero-1920x600.svg": (1920, 600, "Website"),
-        "website/website-hero-2560x800.svg": (2560, 800, "Website"),
-        
-        # Mobile banners
-        "mobile/mobile-banner-750x300.svg": (750, 300, "Mobile"),
-    }
-    
-    for filename, (width, height, platform) in banners.items():
-        content = create_banner_svg(width, height, platform)
-        (BANNERS_DIR / filename).write_text(content)
-        print(f"   ✅ {filename}")
+        counts = {platform: catalog.count(BANNERS_DIR / platform, ".svg", recursive=False)
+                  for platform in PLATFORMS}
     
-    print(f"\n✅ Created {len(banners)} platform-specific banners")
+    print(f"\n✅ Created {len(BANNERS)} platform-specific banners")
     print("\n📂 Organized by platform:")
-    for platform in platforms:
-        count = len(list((BANNERS_DIR / platform).glob("*.svg")))
+    for platform in PLATFORMS:
+        count = counts[platform]
         if count > 0:
             print(f"   - banners/{platform}/ ({count} banner{'s' if count > 1 else ''})")
 
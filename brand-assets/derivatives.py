@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Responsive WebP/AVIF derivatives for KBYG.ai imagery
+Requires: Pillow (AVIF needs Pillow >= 11.2 built with libavif, or pillow-avif-plugin)
+
+Every source PNG is encoded at each width of the ladder that does not
+upscale it. derivatives/index.json maps each source to its derivatives
+(path, format, width, height, bytes) for srcset generation. Sources whose
+size/mtime and settings are unchanged since the last pass are skipped.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+from asset_catalog import AssetCatalog
+from fileutil import atomic_write_text, sha256_file, temp_path_for
+from manifest import manifest_outputs
+
+BASE_DIR = Path(__file__).parent
+DERIVATIVES_DIR = BASE_DIR / "derivatives"
+INDEX_PATH = DERIVATIVES_DIR / "index.json"
+HERO_ROOT = BASE_DIR / "images" / "heroes"
+WIDTHS = (320, 640, 960, 1280, 1920)
+QUALITY = {"webp": 80, "avif": 55}
+
+def avif_supported():
+    if Image is None:
+        return False
+    try:
+        if features.check("avif"):
+            return True
+    except ValueError:
+        pass
+    try:
+        import pillow_avif  # noqa: F401 - registers the AVIF plugin
+    except ImportError:
+        return False
+    return True
+
+def ladder_for(source_width, widths=WIDTHS):
+    """Widths to emit for a source: every ladder step below it, plus its own width capped at the top step"""
+    ladder = {w for w in widths if w < source_width}
+    ladder.add(min(source_width, max(widths)))
+    return sorted(ladder)
+
+def relative_name(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return Path(path).resolve().as_posix().lstrip("/")
+
+def encode_derivatives(source, formats, widths=WIDTHS, output_dir=DERIVATIVES_DIR):
+    """Encode one source at every ladder width and format; returns its index entry"""
+    source = Path(source)
+    stem = Path(relative_name(source)).with_suffix("")
+    entry = {"sha256": sha256_file(source), "derivatives": []}
+    
+    with Image.open(source) as image:
+        image.load()
+        entry["width"], entry["height"] = image.size
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        
+        for width in ladder_for(image.width, widths):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                out_path = output_dir / f"{stem}-{width}w.{fmt}"
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                options = {"quality": QUALITY[fmt]}
+                if fmt == "webp":
+                    options["method"] = 6
+                tmp_path = temp_path_for(out_path)
+                resized.save(tmp_path, format=fmt.upper(), **options)
+                os.replace(tmp_path, out_path)
+                entry["derivatives"].append({
+                    "path": relative_name(out_path),
+                    "format": fmt,
+                    "width": width,
+                    "height": height,
+                    "bytes": out_path.stat().st_size,
+                })
+    return str(source), entry
+
+def manifest_sources():
+    """Existing output files (including _vN variants) for every manifest entry"""
+    for _, _, path in manifest_outputs():
+        if path.exists():
+            yield path
+
+def default_sources(rescan=False):
+    sources = list(manifest_sources())
+    with AssetCatalog() as catalog:
+        if rescan:
+            catalog.scan([HERO_ROOT])
+        else:
+            catalog.refresh([HERO_ROOT])
+        sources.extend(catalog.files(HERO_ROOT, ".png"))
+    return sources
+
+def encode_or_skip(source, formats, widths=WIDTHS, output_dir=DERIVATIVES_DIR):
+    """encode_derivatives() that reports a failure instead of raising, so one bad file cannot stop the pool"""
+    try:
+        return encode_derivatives(source, formats, widths, output_dir), None
+    except Exception as e:
+        return (str(source), None), f"{type(e).__name__}: {e}"
+
+def build_derivatives(sources, formats, widths=WIDTHS, workers=None, index_path=INDEX_PATH, force=False,
+                      output_dir=DERIVATIVES_DIR):
+    """Encode stale sources in parallel and update the index; returns (encoded, skipped, failed)"""
+    index = {}
+    if index_path.exists() and not force:
+        index = json.loads(index_path.read_text())
+    settings = {"formats": list(formats), "widths": list(widths), "quality": QUALITY}
+    if index.get("settings") != settings:
+        index = {"settings": settings, "sources": {}}
+    entries = index["sources"]
+    
+    sources = list(dict.fromkeys(Path(s) for s in sources))
+    stale = []
+    failed = 0
+    for source in sources:
+        name = relative_name(source)
+        stat = source.stat()
+        entry = entries.get(name)
+        if entry and all((BASE_DIR / d["path"]).exists() for d in entry["derivatives"]):
+            if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                continue
+            if entry["sha256"] == sha256_file(source):
+                # Touched but unchanged - refresh the stat fingerprint only
+                entry.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+                continue
+        stale.append(source)
+    
+    # The index is written even if the run is interrupted, keeping every source already encoded
+    try:
+        if stale:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                futures = [pool.submit(encode_or_skip, source, formats, widths, output_dir) for source in stale]
+                for future in futures:
+                    (source, entry), error = future.result()
+                    if error is not None:
+                        failed += 1
+                        print(f"   ⚠️  Skipped {relative_name(source)}: {error}")
+                        continue
+                    stat = Path(source).stat()
+                    entry.update({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+                    entries[relative_name(source)] = entry
+                    print(f"   ✅ {relative_name(source)}: {len(entry['derivatives'])} derivatives")
+    finally:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, json.dumps(index, indent=2, sort_keys=True))
+    return len(stale) - failed, len(sources) - len(stale), failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build responsive WebP/AVIF derivatives for srcset")
+    parser.add_argument("sources", nargs="*", type=Path,
+                        help="PNG files or directories (default: manifest outputs + images/heroes)")
+    parser.add_argument("--widths", default=",".join(str(w) for w in WIDTHS),
+                        help="comma-separated width ladder (default: %(default)s)")
+    parser.add_argument("--no-avif", action="store_true", help="only emit WebP")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="re-encode every source")
+    parser.add_argument("--rescan", action="store_true",
+                        help="walk images/heroes instead of trusting the asset catalog")
+    args = parser.parse_args(argv)
+    
+    print("🖼️  KBYG.ai Responsive Derivatives")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+    
+    formats = ["webp"]
+    if not args.no_avif:
+        if avif_supported():
+            formats.append("avif")
+        else:
+            print("⚠️  AVIF encoder not available, emitting WebP only")
+    widths = tuple(int(w) for w in args.widths.split(","))
+    
+    sources = []
+    for source in args.sources:
+        sources.extend(sorted(source.rglob("*.png")) if source.is_dir() else [source])
+    sources = sources or default_sources(args.rescan)
+    
+    started = time.monotonic()
+    encoded, skipped, failed = build_derivatives(sources, formats, widths, args.workers, force=args.force)
+    print(f"\n✅ {encoded} sources encoded, {skipped} up to date, {failed} failed "
+          f"({time.monotonic() - started:.1f}s)")
+    print(f"   Index: {relative_name(INDEX_PATH)}")
+
+if __name__ == "__main__":
+    main()
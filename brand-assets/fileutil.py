@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Small filesystem helpers shared by the brand-asset scripts
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import threading
+
+def temp_path_for(path):
+    """Hidden sibling path for writing `path` atomically (keeps the suffix for format sniffing)"""
+    path = Path(path)
+    return path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{path.suffix}")
+
+def atomic_write_bytes(path, data):
+    """Write via a temp file + rename so readers never see a partial file"""
+    path = Path(path)
+    tmp_path = temp_path_for(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+def atomic_write_text(path, text):
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+def write_if_changed(path, data):
+    """Atomically write bytes unless the file already holds them; returns True if written"""
+    path = Path(path)
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    atomic_write_bytes(path, data)
+    return True
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Subset the Inter web fonts to the glyphs and weights KBYG.ai actually uses
+Requires: fonttools, brotli
+
+Scans the HTML/CSS templates and generated SVGs for text and font-weight
+declarations, subsets the matching static Inter weights (or InterVariable)
+to those codepoints plus printable ASCII, and writes WOFF2 files with an
+@font-face stylesheet whose unicode-range lists exactly what each file
+covers.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+import os
+from pathlib import Path
+import re
+import sys
+import time
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = None
+
+from fileutil import atomic_write_text, temp_path_for
+
+BASE_DIR = Path(__file__).parent
+FONTS_DIR = BASE_DIR / "fonts"
+SUBSET_DIR = FONTS_DIR / "subset"
+TEXT_ROOTS = [BASE_DIR / "templates", BASE_DIR / "logos", BASE_DIR / "banners"]
+TEXT_SUFFIXES = {".html", ".css", ".svg"}
+
+STATIC_WEIGHTS = {300: "Light", 400: "Regular", 500: "Medium", 600: "SemiBold", 700: "Bold", 800: "ExtraBold"}
+WEIGHT_KEYWORDS = {"normal": 400, "bold": 700, "lighter": 300, "bolder": 700}
+# Tags browsers render bold by default
+BOLD_TAGS = {"b", "strong", "th", "h1", "h2", "h3", "h4", "h5", "h6"}
+# Always kept so templated/dynamic copy still renders
+BASELINE = set(range(0x20, 0x7F))
+# Contextual alternates (calt) pull in ~90 extra glyphs for arrows and case forms; not worth it here
+LAYOUT_FEATURES = ["kern", "liga"]
+
+_WEIGHT_DECL = re.compile(r"""font-weight\s*[:=]\s*["']?\s*(\d{3}|normal|bold|lighter|bolder)""", re.I)
+
+class _TextCollector(HTMLParser):
+    """Collect visible text, text-bearing attributes and implied bold weights from HTML/SVG"""
+
+    ATTRIBUTES = {"alt", "title", "placeholder", "aria-label", "value", "content"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+        self.weights = set()
+
+    def handle_starttag(self, tag, attrs):
+        if tag in BOLD_TAGS:
+            self.weights.add(700)
+        self.text.extend(value for name, value in attrs if name in self.ATTRIBUTES and value)
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+def scan_usage(roots=TEXT_ROOTS):
+    """(codepoints, weights) used across the HTML/CSS/SVG files under roots"""
+    codepoints = set()
+    weights = {400}
+    for root in roots:
+        for path in sorted(Path(root).rglob("*")):
+            if path.suffix.lower() not in TEXT_SUFFIXES:
+                continue
+            source = path.read_text(encoding="utf-8", errors="ignore")
+            weights.update(WEIGHT_KEYWORDS.get(value.lower()) or int(value)
+                           for value in _WEIGHT_DECL.findall(source))
+            if path.suffix.lower() == ".css":
+                continue
+            collector = _TextCollector()
+            collector.feed(source)
+            weights.update(collector.weights)
+            codepoints.update(ord(char) for char in "".join(collector.text) if char.isprintable())
+    return codepoints, weights
+
+def static_font_for(weight):
+    """Nearest shipped static weight"""
+    nearest = min(STATIC_WEIGHTS, key=lambda available: abs(available - weight))
+    return nearest, FONTS_DIR / f"Inter-{STATIC_WEIGHTS[nearest]}.ttf"
+
+def unicode_range(codepoints):
+    """Collapse codepoints into a CSS unicode-range value"""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ", ".join(f"U+{start:X}" if start == end else f"U+{start:X}-{end:X}" for start, end in ranges)
+
+def subset_font(source, output, codepoints):
+    """Write a WOFF2 subset of source; returns (output, bytes, codepoints the font covers)"""
+    font = TTFont(source)
+    covered = sorted(set(codepoints) & set(font.getBestCmap()))
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = LAYOUT_FEATURES
+    options.hinting = False
+    options.desubroutinize = True
+    options.name_IDs = [1, 2, 4, 6]
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=covered)
+    subsetter.subset(font)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = temp_path_for(output)
+    try:
+        font.save(tmp_path)
+        os.replace(tmp_path, output)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return output, output.stat().st_size, covered
+
+def font_face(filename, weight, covered):
+    return f"""@font-face {{
+  font-family: 'Inter';
+  font-style: normal;
+  font-weight: {weight};
+  font-display: swap;
+  src: url('{filename}') format('woff2');
+  unicode-range: {unicode_range(covered)};
+}}
+"""
+
+def build_subsets(codepoints, weights, variable=False, output_dir=SUBSET_DIR, workers=None):
+    """Subset every needed font in parallel and write inter-subset.css; returns [(file, bytes, original bytes)]"""
+    codepoints = set(codepoints) | BASELINE
+    if variable:
+        jobs = {"100 900": (FONTS_DIR / "InterVariable.ttf", output_dir / "InterVariable.subset.woff2")}
+    else:
+        jobs = {}
+        for weight in sorted(weights):
+            nearest, source = static_font_for(weight)
+            jobs[nearest] = (source, output_dir / f"Inter-{STATIC_WEIGHTS[nearest]}.subset.woff2")
+
+    css = ["/* Generated by font_subset.py - do not edit */\n"]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or min(len(jobs), os.cpu_count())) as pool:
+        futures = {weight: pool.submit(subset_font, source, output, codepoints)
+                   for weight, (source, output) in jobs.items()}
+        for weight, future in futures.items():
+            output, size, covered = future.result()
+            source = jobs[weight][0]
+            full = source.with_suffix(".woff2")
+            results.append((output, size, (full if full.exists() else source).stat().st_size))
+            css.append(font_face(output.name, weight, covered))
+    atomic_write_text(output_dir / "inter-subset.css", "\n".join(css))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Subset the Inter web fonts to the glyphs KBYG.ai uses")
+    parser.add_argument("roots", nargs="*", type=Path,
+                        help="directories to scan for text (default: templates/, logos/, banners/)")
+    parser.add_argument("--variable", action="store_true",
+                        help="emit one InterVariable subset covering every weight instead of static weights")
+    parser.add_argument("--output", type=Path, default=SUBSET_DIR, help="output directory (default: fonts/subset/)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: one per font)")
+    args = parser.parse_args(argv)
+
+    print("🔤 KBYG.ai Font Subsetter")
+    print("=" * 70)
+    if subset is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install fonttools brotli")
+        sys.exit(1)
+
+    started = time.monotonic()
+    codepoints, weights = scan_usage(args.roots or TEXT_ROOTS)
+    print(f"🔍 {len(codepoints)} codepoints, weights {', '.join(map(str, sorted(weights)))}")
+    results = build_subsets(codepoints, weights, args.variable, args.output, args.workers)
+    before = after = 0
+    for output, size, original in results:
+        before += original
+        after += size
+        print(f"   ✅ {output.name}: {original / 1024:.0f} KB -> {size / 1024:.1f} KB")
+    print(f"\n✅ Subset {len(results)} fonts in {time.monotonic() - started:.1f}s")
+    print(f"   Font bytes: {before / 1024:.0f} KB -> {after / 1024:.1f} KB")
+    print(f"   Stylesheet: {args.output / 'inter-subset.css'}")
+
+if __name__ == "__main__":
+    main()
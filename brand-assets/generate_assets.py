@@ -4,56 +4,41 @@ KBYG.ai Brand Asset Generator
 Uses Google Imagen 3 to generate comprehensive brand assets
 """
 
+import argparse
 import os
 import sys
 import json
 import base64
 from pathlib import Path
-import subprocess
+
+from manifest import write_jsonl_manifest
+from palette import compile_palette, load_palette, write_palette_swatches
 
 # Brand colors
-COLORS = {
-    "gtm_blue": "#3b82f6",
-    "conference_purple": "#8b5cf6",
-    "revenue_cyan": "#06b6d4"
-}
+COLORS = {name.replace("-", "_"): token["value"] for name, token in load_palette()["brand"].items()}
 
 # Base directory
 BASE_DIR = Path(__file__).parent
 
-def generate_image_with_imagen(prompt, output_path, aspect_ratio="1:1", model="imagen-3.0-generate-001"):
-    """Generate image using Google Imagen 3 via gcloud CLI"""
-    
-    print(f"🎨 Generating: {output_path.name}")
-    print(f"   Prompt: {prompt[:80]}...")
-    
-    # Build gcloud command
-    cmd = [
-        "gcloud", "ai", "models", "predict",
-        f"projects/YOUR_PROJECT/locations/us-central1/models/{model}",
-        "--json-request", "-"
-    ]
-    
-    request = {
-        "instances": [{
-            "prompt": prompt
-        }],
-        "parameters": {
-            "sampleCount": 1,
-            "aspectRatio": aspect_ratio,
-            "safetySetting": "block_some",
-            "personGeneration": "allow_adult"
-        }
-    }
+# (backend, options): model cache, so repeated calls reuse loaded models
+_MODELS = {}
+
+def backend_models(backend="vertex", **backend_options):
+    """Model cache for a backend, created on first use and shared by every later call"""
+    key = (backend, tuple(sorted(backend_options.items())))
+    if key not in _MODELS:
+        from imagen_backends import create_models
+        _MODELS[key] = create_models(backend, **backend_options)
+    return _MODELS[key]
+
+def generate_image_with_imagen(prompt, output_path, aspect_ratio="1:1", model="imagen-3.0-generate-001",
+                               backend="vertex", models=None, **backend_options):
+    """Generate image using Google Imagen 3 (or backend="local" for offline placeholders)"""
+    from generate_images_with_imagen import generate_image
     
-    try:
-        # For now, create a placeholder since we need proper GCP project setup
-        print(f"   ⚠️  Would generate with Imagen 3")
-        print(f"   📝 Prompt saved for manual generation")
-        return False
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        return False
+    if models is None:
+        models = backend_models(backend, **backend_options)
+    return generate_image(prompt, Path(output_path), aspect_ratio, model_name=model, models=models)
 
 # Hero Images - Desktop 16:9
 HERO_DESKTOP_PROMPTS = {
@@ -977,275 +962,8 @@ def create_color_files():
     
     colors_dir = BASE_DIR / "colors"
     
-    # CSS Variables
-    css_vars = """/* KBYG.ai Brand Colors - CSS Variables */
-
-:root {
-  /* Primary Brand Colors */
-  --kbyg-blue-gtm: #3b82f6;
-  --kbyg-purple-conference: #8b5cf6;
-  --kbyg-cyan-revenue: #06b6d4;
-  
-  /* RGB Values (for rgba usage) */
-  --kbyg-blue-gtm-rgb: 59, 130, 246;
-  --kbyg-purple-conference-rgb: 139, 92, 246;
-  --kbyg-cyan-revenue-rgb: 6, 182, 212;
-  
-  /* Semantic Naming */
-  --color-primary: var(--kbyg-blue-gtm);
-  --color-secondary: var(--kbyg-purple-conference);
-  --color-accent: var(--kbyg-cyan-revenue);
-  
-  /* Neutrals */
-  --color-dark: #111827;
-  --color-gray: #6b7280;
-  --color-light-gray: #f3f4f6;
-  --color-white: #ffffff;
-  
-  /* Gradients */
-  --gradient-primary: linear-gradient(135deg, var(--kbyg-blue-gtm) 0%, var(--kbyg-purple-conference) 100%);
-  --gradient-full: linear-gradient(135deg, var(--kbyg-blue-gtm) 0%, var(--kbyg-purple-conference) 50%, var(--kbyg-cyan-revenue) 100%);
-  --gradient-command: linear-gradient(180deg, var(--kbyg-blue-gtm) 0%, var(--kbyg-purple-conference) 100%);
-  
-  /* Alpha Variants */
-  --kbyg-blue-10: rgba(var(--kbyg-blue-gtm-rgb), 0.1);
-  --kbyg-blue-20: rgba(var(--kbyg-blue-gtm-rgb), 0.2);
-  --kbyg-blue-50: rgba(var(--kbyg-blue-gtm-rgb), 0.5);
-  
-  --kbyg-purple-10: rgba(var(--kbyg-purple-conference-rgb), 0.1);
-  --kbyg-purple-20: rgba(var(--kbyg-purple-conference-rgb), 0.2);
-  --kbyg-purple-50: rgba(var(--kbyg-purple-conference-rgb), 0.5);
-  
-  --kbyg-cyan-10: rgba(var(--kbyg-cyan-revenue-rgb), 0.1);
-  --kbyg-cyan-20: rgba(var(--kbyg-cyan-revenue-rgb), 0.2);
-  --kbyg-cyan-50: rgba(var(--kbyg-cyan-revenue-rgb), 0.5);
-}
-
-/* Usage Examples */
-.btn-primary {
-  background: var(--color-primary);
-  color: var(--color-white);
-}
-
-.btn-gradient {
-  background: var(--gradient-primary);
-  color: var(--color-white);
-}
-
-.bg-brand-overlay {
-  background: var(--kbyg-blue-10);
-}
-"""
-    (colors_dir / "kbyg-colors.css").write_text(css_vars)
-    
-    # Tailwind Config
-    tailwind_config = """// KBYG.ai Brand Colors - Tailwind Config Extension
-
-module.exports = {
-  theme: {
-    extend: {
-      colors: {
-        kbyg: {
-          blue: {
-            DEFAULT: '#3b82f6',
-            50: '#eff6ff',
-            100: '#dbeafe',
-            200: '#bfdbfe',
-            300: '#93c5fd',
-            400: '#60a5fa',
-            500: '#3b82f6', // Brand primary
-            600: '#2563eb',
-            700: '#1d4ed8',
-            800: '#1e40af',
-            900: '#1e3a8a',
-          },
-          purple: {
-            DEFAULT: '#8b5cf6',
-            50: '#faf5ff',
-            100: '#f3e8ff',
-            200: '#e9d5ff',
-            300: '#d8b4fe',
-            400: '#c084fc',
-            500: '#8b5cf6', // Brand secondary
-            600: '#7c3aed',
-            700: '#6d28d9',
-            800: '#5b21b6',
-            900: '#4c1d95',
-          },
-          cyan: {
-            DEFAULT: '#06b6d4',
-            50: '#ecfeff',
-            100: '#cffafe',
-            200: '#a5f3fc',
-            300: '#67e8f9',
-            400: '#22d3ee',
-            500: '#06b6d4', // Brand accent
-            600: '#0891b2',
-            700: '#0e7490',
-            800: '#155e75',
-            900: '#164e63',
-          },
-        },
-        primary: '#3b82f6',
-        secondary: '#8b5cf6',
-        accent: '#06b6d4',
-      },
-      backgroundImage: {
-        'gradient-primary': 'linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%)',
-        'gradient-full': 'linear-gradient(135deg, #3b82f6 0%, #8b5cf6 50%, #06b6d4 100%)',
-        'gradient-command': 'linear-gradient(180deg, #3b82f6 0%, #8b5cf6 100%)',
-      },
-    },
-  },
-}
-"""
-    (colors_dir / "tailwind.config.js").write_text(tailwind_config)
-    
-    # Figma Tokens (JSON)
-    figma_tokens = {
-        "global": {
-            "kbyg": {
-                "blue": {
-                    "gtm": {
-                        "value": "#3b82f6",
-                        "type": "color",
-                        "description": "Primary brand color - GTM Blue"
-                    }
-                },
-                "purple": {
-                    "conference": {
-                        "value": "#8b5cf6",
-                        "type": "color",
-                        "description": "Secondary brand color - Conference Purple"
-                    }
-                },
-                "cyan": {
-                    "revenue": {
-                        "value": "#06b6d4",
-                        "type": "color",
-                        "description": "Accent brand color - Revenue Cyan"
-                    }
-                }
-            },
-            "semantic": {
-                "primary": {
-                    "value": "{kbyg.blue.gtm}",
-                    "type": "color"
-                },
-                "secondary": {
-                    "value": "{kbyg.purple.conference}",
-                    "type": "color"
-                },
-                "accent": {
-                    "value": "{kbyg.cyan.revenue}",
-                    "type": "color"
-                }
-            }
-        }
-    }
-    (colors_dir / "figma-tokens.json").write_text(json.dumps(figma_tokens, indent=2))
-    
-    # Sketch Palette
-    sketch_palette = {
-        "compatibleVersion": "2.0",
-        "pluginVersion": "2.22",
-        "colors": [
-            "#3b82f6",
-            "#8b5cf6",
-            "#06b6d4",
-            "#111827",
-            "#6b7280",
-            "#f3f4f6",
-            "#ffffff"
-        ],
-        "gradients": [
-            {
-                "name": "Primary Gradient",
-                "gradientType": "linear",
-                "angle": 135,
-                "stops": [
-                    {"color": "#3b82f6", "position": 0},
-                    {"color": "#8b5cf6", "position": 1}
-                ]
-            },
-            {
-                "name": "Full Gradient",
-                "gradientType": "linear",
-                "angle": 135,
-                "stops": [
-                    {"color": "#3b82f6", "position": 0},
-                    {"color": "#8b5cf6", "position": 0.5},
-                    {"color": "#06b6d4", "position": 1}
-                ]
-            }
-        ],
-        "images": []
-    }
-    (colors_dir / "sketch-palette.json").write_text(json.dumps(sketch_palette, indent=2))
-    
-    # SCSS Variables
-    scss_vars = """// KBYG.ai Brand Colors - SCSS Variables
-
-// Primary Brand Colors
-$kbyg-blue-gtm: #3b82f6;
-$kbyg-purple-conference: #8b5cf6;
-$kbyg-cyan-revenue: #06b6d4;
-
-// Semantic Names
-$color-primary: $kbyg-blue-gtm;
-$color-secondary: $kbyg-purple-conference;
-$color-accent: $kbyg-cyan-revenue;
-
-// Neutrals
-$color-dark: #111827;
-$color-gray: #6b7280;
-$color-light-gray: #f3f4f6;
-$color-white: #ffffff;
-
-// Color Map for iteration
-$brand-colors: (
-  'blue-gtm': $kbyg-blue-gtm,
-  'purple-conference': $kbyg-purple-conference,
-  'cyan-revenue': $kbyg-cyan-revenue,
-  'dark': $color-dark,
-  'gray': $color-gray,
-  'light-gray': $color-light-gray,
-  'white': $color-white,
-);
-
-// Mixins
-@mixin gradient-primary {
-  background: linear-gradient(135deg, $kbyg-blue-gtm 0%, $kbyg-purple-conference 100%);
-}
-
-@mixin gradient-full {
-  background: linear-gradient(135deg, $kbyg-blue-gtm 0%, $kbyg-purple-conference 50%, $kbyg-cyan-revenue 100%);
-}
-
-// Alpha function
-@function alpha-color($color, $opacity) {
-  @return rgba($color, $opacity);
-}
-
-// Usage example
-.btn-primary {
-  background-color: $color-primary;
-  color: $color-white;
-  
-  &:hover {
-    background-color: darken($color-primary, 10%);
-  }
-}
-
-.bg-overlay {
-  background-color: alpha-color($kbyg-blue-gtm, 0.1);
-}
-
-.gradient-bg {
-  @include gradient-primary;
-}
-"""
-    (colors_dir / "kbyg-colors.scss").write_text(scss_vars)
+    # CSS, SCSS, Tailwind, Figma, Sketch and SVG recolor maps, compiled from palette.json
+    compile_palette(output_dir=colors_dir, swatches=False)
     
     # Color README
     color_readme = """# KBYG.ai Brand Colors
@@ -1433,35 +1151,10 @@ convert -size 200x200 xc:"#06b6d4" swatch-revenue-cyan.png
     print("✅ Color files created")
 
 def generate_color_swatches():
-    """Generate PNG color swatches using ImageMagick"""
-    colors_dir = BASE_DIR / "colors"
-    
-    colors = {
-        "gtm-blue": "#3b82f6",
-        "conference-purple": "#8b5cf6",
-        "revenue-cyan": "#06b6d4",
-        "dark": "#111827",
-        "gray": "#6b7280",
-        "light-gray": "#f3f4f6"
-    }
-    
-    for name, hex_color in colors.items():
-        output = colors_dir / f"swatch-{name}.png"
-        cmd = f'convert -size 400x400 "xc:{hex_color}" "{output}"'
-        try:
-            subprocess.run(cmd, shell=True, check=True, capture_output=True)
-            print(f"✅ Generated swatch: {name}")
-        except subprocess.CalledProcessError:
-            print(f"⚠️  ImageMagick not available, skipping swatch generation")
-            break
-    
-    # Generate combined swatch
-    combined_cmd = f'convert -size 400x400 "xc:#3b82f6" "xc:#8b5cf6" "xc:#06b6d4" +append "{colors_dir / "swatch-all-colors.png"}"'
-    try:
-        subprocess.run(combined_cmd, shell=True, check=True, capture_output=True)
-        print("✅ Generated combined swatch")
-    except subprocess.CalledProcessError:
-        pass
+    """Generate PNG color swatches, the combined strip and tint/shade ramps from palette.json"""
+    results = write_palette_swatches(load_palette(), BASE_DIR / "colors")
+    for filename, changed in results.items():
+        print(f"{'✅ Generated' if changed else '   Unchanged'}: {filename}")
 
 def create_prompts_manifest():
     """Create comprehensive prompts manifest for manual generation"""
@@ -1480,6 +1173,8 @@ def create_prompts_manifest():
     
     manifest_path = BASE_DIR / "IMAGEN_PROMPTS_MANIFEST.json"
     manifest_path.write_text(json.dumps(all_prompts, indent=2))
+    # Line-per-entry copy that generate_images_with_imagen.py can stream
+    write_jsonl_manifest(all_prompts, BASE_DIR / "IMAGEN_PROMPTS_MANIFEST.jsonl")
     
     # Also create a markdown version for easy viewing
     md_manifest = "# Google Imagen 3 Generation Manifest\n\n"
@@ -1493,6 +1188,8 @@ def create_prompts_manifest():
             md_manifest += f"### {filename}\n"
             md_manifest += f"- **Size**: {data.get('size', 'N/A')}\n"
             md_manifest += f"- **Aspect Ratio**: {data['ratio']}\n"
+            if data.get("variants", 1) > 1:
+                md_manifest += f"- **Variants**: {data['variants']} (saved as `_v1`..`_v{data['variants']}`)\n"
             md_manifest += f"- **Prompt**: {data['prompt']}\n\n"
     
     md_manifest += f"\n---\n**Total Images**: {total_images}\n"
@@ -1503,8 +1200,10 @@ def create_prompts_manifest():
     print(f"✅ Created prompts manifest: {total_images} images to generate")
     return total_images
 
-def main():
+def main(argv=None):
     """Main execution"""
+    argparse.ArgumentParser(description="Create the KBYG.ai brand asset structure, docs and color files").parse_args(argv)
+    
     print("🚀 KBYG.ai Brand Assets Generator")
     print("=" * 60)
     
@@ -1541,7 +1240,7 @@ def main():
     print("   2. Set up Google Cloud Project for Imagen 3 API")
     print("   3. Run image generation (see IMAGEN_PROMPTS_MANIFEST.md)")
     print("   4. Generate logo variations (need design tool or AI)")
-    print("   5. Create platform banners using generated heroes")
+    print("   5. Compose platform banners from the generated heroes: python kbyg_assets.py compose")
     
     print("\n" + "=" * 60)
 
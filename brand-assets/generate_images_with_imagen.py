@@ -2,135 +2,476 @@
 """
 Generate KBYG.ai brand images using Google Imagen 3
 Requires: google-cloud-aiplatform, proper GCP auth
+(or --backend local for offline placeholder images)
 """
 
-import json
+import argparse
+from collections import namedtuple
 import base64
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
 from pathlib import Path
+import threading
 import time
 import sys
 
-try:
-    from google.cloud import aiplatform
-    from vertexai.preview.vision_models import ImageGenerationModel
-except ImportError:
-    print("❌ Missing required packages!")
-    print("   Run: pip install google-cloud-aiplatform")
-    sys.exit(1)
+from fileutil import atomic_write_bytes, sha256_bytes, temp_path_for
+from generation_cache import GenerationCache, cache_key
+from generation_journal import DONE, FAILED, IN_FLIGHT, GenerationJournal
+from imagen_backends import BACKENDS, create_models, vertex_available
+from manifest import CATEGORIES, ManifestReader, find_manifest, iter_prompt_dict, variant_paths
+from model_cache import TimingReport
+from rate_limiter import TokenBucket, is_quota_error
+from retry_policy import SAFETY, RetryBudget, RetryPolicy
+from scheduler import LOOKAHEAD, match_entries, schedule
 
 BASE_DIR = Path(__file__).parent
 PROJECT_ID = "heimdall-8675309"
 LOCATION = "us-central1"
+MODEL_NAME = "imagen-3.0-generate-001"
+SAFETY_SETTINGS = {
+    "safety_filter_level": "block_some",
+    "person_generation": "allow_adult",
+}
+CACHE_DIR = BASE_DIR / ".imagen-cache"
+CACHE_MAX_MB = 2048
+JOURNAL_PATH = BASE_DIR / ".imagen-journal.jsonl"
+MAX_ATTEMPTS = 3
+RETRY_BUDGET = 50
+# Imagen 3 returns at most this many samples per request
+MAX_SAMPLES_PER_REQUEST = 4
 
-def initialize_vertex_ai():
-    """Initialize Vertex AI"""
-    aiplatform.init(project=PROJECT_ID, location=LOCATION)
-    print(f"✅ Initialized Vertex AI (project: {PROJECT_ID}, location: {LOCATION})")
+# Imagen 3 has quotas - default request budget shared by all workers
+REQUESTS_PER_MINUTE = 30
+BURST = 3
 
-def generate_image(prompt, output_path, aspect_ratio="1:1", number_of_images=1):
-    """Generate image using Imagen 3"""
+Job = namedtuple("Job", "category filename prompt output_path aspect_ratio model_name cache_key variants")
+
+_print_lock = threading.Lock()
+
+def log(*lines):
+    """Print a block of lines without interleaving with other workers"""
+    with _print_lock:
+        for line in lines:
+            print(line)
+
+# Shared by generate_image() and every worker for the whole run
+MODELS = create_models("vertex")
+
+class NoImagesGenerated(Exception):
+    """Imagen returned an empty result, usually because the safety filter blocked it"""
+    error_class = SAFETY
+
+class IncompleteBatch(NoImagesGenerated):
+    """Imagen returned fewer samples than variants requested, even after asking again for the missing ones"""
+
+def render_images(prompt, output_paths, aspect_ratio="1:1", model=None, limiter=None,
+                  model_name=MODEL_NAME, models=MODELS, timings=None):
+    """Generate one sample per output path in as few requests as possible.
+
+    Samples dropped from a batch (usually by the safety filter) are
+    requested again; if a request then comes back empty, the samples
+    received are saved and IncompleteBatch is raised so the job is not
+    cached or journaled as done. Each file is written atomically; returns
+    the list of PNG bytes saved.
+    """
+    started = time.monotonic()
+    cold = False
+    # Reuse the run-wide model handle unless one was passed in
+    if model is None:
+        cold = not models.is_loaded(model_name, PROJECT_ID, LOCATION)
+        model = models.get(model_name, PROJECT_ID, LOCATION)
+    
+    variants = f" ({len(output_paths)} variants)" if len(output_paths) > 1 else ""
+    log(f"\n🎨 Generating: {output_paths[0].name}{variants}",
+        f"   Aspect: {aspect_ratio}",
+        f"   Prompt: {prompt[:80]}...")
+    
+    # Generate images, batching samples per request and asking again for any that were dropped
+    images = []
+    while len(images) < len(output_paths):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            batch = model.generate_images(
+                prompt=prompt,
+                number_of_images=min(MAX_SAMPLES_PER_REQUEST, len(output_paths) - len(images)),
+                aspect_ratio=aspect_ratio,
+                **SAFETY_SETTINGS
+            )
+        except Exception as e:
+            if limiter is not None and is_quota_error(e):
+                limiter.on_quota_error()
+            raise
+        if limiter is not None:
+            limiter.on_success()
+        if not batch:
+            break
+        images.extend(batch)
+    
+    if not images:
+        raise NoImagesGenerated("No image generated")
+    
+    # Save via temp file + rename so a crash never leaves a half-written PNG
+    saved = []
+    for image, output_path in zip(images, output_paths):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path_for(output_path)
+        try:
+            image.save(location=str(tmp_path))
+            saved.append(tmp_path.read_bytes())
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        log(f"   ✅ Saved: {output_path}")
+    
+    if len(saved) < len(output_paths):
+        raise IncompleteBatch(f"Only {len(saved)}/{len(output_paths)} variants returned for {output_paths[0].name}")
+    if timings is not None:
+        timings.record(time.monotonic() - started, cold)
+    return saved
+
+def generate_image(prompt, output_path, aspect_ratio="1:1", number_of_images=1, **kwargs):
+    """Generate image using Imagen 3 (number_of_images > 1 saves every sample as a _vN variant)"""
     try:
-        # Initialize model
-        model = ImageGenerationModel.from_pretrained("imagen-3.0-generate-001")
+        render_images(prompt, variant_paths(output_path, number_of_images), aspect_ratio, **kwargs)
+        return True
+    except Exception as e:
+        log(f"   ❌ Error ({output_path.name}): {e}")
+        return False
+
+def output_name(output_path):
+    """Stable name for an output file, relative to the brand-assets tree when possible"""
+    try:
+        return output_path.relative_to(BASE_DIR).as_posix()
+    except ValueError:
+        return str(output_path)
+
+def resolve_model(category, data, model_name=MODEL_NAME, category_models=None):
+    """Model for a manifest entry: entry "model", then per-category override, then default"""
+    return data.get("model") or (category_models or {}).get(category, model_name)
+
+def rebase_categories(output_root):
+    """CATEGORIES with output directories moved from BASE_DIR to another root"""
+    return [(key, Path(output_root) / path.relative_to(BASE_DIR)) for key, path in CATEGORIES]
+
+def iter_jobs(entries, model_name=MODEL_NAME, category_models=None, cache=None, journal=None,
+              max_attempts=MAX_ATTEMPTS, retry_failed=False, categories=None):
+    """Yield a Job for every image that still needs generating.
+
+    `entries` is an iterable of (category, filename, data) - usually a
+    streaming ManifestReader - or a whole manifest dict.
+
+    The journal is consulted first: outputs recorded as done for the same
+    key (and so the same prompt) are skipped if their files still exist,
+    and permanent or exhausted failures are not re-issued. With a cache, outputs are then
+    matched by content key: an up-to-date file is skipped, a cached key is
+    restored without an API call, and an output whose prompt changed is
+    regenerated.
+    """
+    category_models = category_models or {}
+    categories = categories or CATEGORIES
+    if isinstance(entries, dict):
+        entries = iter_prompt_dict(entries, [key for key, _ in categories])
+    output_dirs = dict(categories)
+    
+    seen_categories = set()
+    for category_key, filename, data in entries:
+        output_dir = output_dirs.get(category_key)
+        if output_dir is None:
+            log(f"⚠️  Unknown category {category_key!r}, skipping: {filename}")
+            continue
+        if category_key not in seen_categories:
+            seen_categories.add(category_key)
+            log(f"\n{'='*70}",
+                f"📁 {category_key.upper().replace('_', ' ')}",
+                f"{'='*70}")
         
-        print(f"\n🎨 Generating: {output_path.name}")
-        print(f"   Aspect: {aspect_ratio}")
-        print(f"   Prompt: {prompt[:80]}...")
+        output_path = output_dir / filename
+        name = output_name(output_path)
+        job_model = resolve_model(category_key, data, model_name, category_models)
+        variants = int(data.get("variants", 1))
+        output_paths = variant_paths(output_path, variants)
+        key = cache_key(data["prompt"], data["ratio"], job_model, SAFETY_SETTINGS, variants)
         
-        # Generate image
-        images = model.generate_images(
-            prompt=prompt,
-            number_of_images=number_of_images,
-            aspect_ratio=aspect_ratio,
-            safety_filter_level="block_some",
-            person_generation="allow_adult"
-        )
+        exists = all(path.exists() for path in output_paths)
+        interrupted = False
+        prompt_changed = False
+        if journal is not None:
+            entry = journal.get(name)
+            # The key hashes the prompt, so an edited prompt never matches an old entry
+            prompt_changed = entry is not None and entry["key"] != key
+            if entry is not None and entry["key"] == key:
+                if entry["state"] == DONE and exists:
+                    log(f"⏭️  Skipping (journal: done): {filename}")
+                    continue
+                exhausted = entry.get("permanent") or entry["attempts"] >= max_attempts
+                if entry["state"] == FAILED and exhausted and not retry_failed:
+                    log(f"⏭️  Skipping (journal: failed {entry['attempts']}x): {filename} - {entry.get('error')}")
+                    continue
+                # A run died with this entry outstanding - reissue it regardless of what is on disk
+                interrupted = entry["state"] == IN_FLIGHT
         
-        # Save image
-        if images and len(images) > 0:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            images[0].save(location=str(output_path))
-            print(f"   ✅ Saved: {output_path}")
-            return True
+        if cache is None:
+            # Skip if already exists, unless the journal saw it generated from another prompt
+            if exists and not interrupted and not prompt_changed:
+                log(f"⏭️  Skipping (exists): {filename}")
+                continue
+            if exists and prompt_changed:
+                log(f"🔁 Prompt changed: {filename}")
         else:
-            print(f"   ❌ No image generated")
-            return False
+            recorded = cache.output_key(name)
+            if exists and not interrupted:
+                if recorded == key:
+                    log(f"⏭️  Skipping (up to date): {filename}")
+                    continue
+                if recorded is None and not prompt_changed:
+                    # Pre-cache output the journal knows no other prompt for: adopt it under its current parameters
+                    cache.put(key, [path.read_bytes() for path in output_paths], {"output": name, "adopted": True})
+                    cache.record_output(name, key)
+                    log(f"⏭️  Skipping (exists, now cached): {filename}")
+                    continue
+                log(f"🔁 Prompt changed: {filename}")
             
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        return False
+            cached = cache.get(key)
+            # Entries cached before short batches were treated as failures may lack variants
+            if cached is not None and len(cached) == len(output_paths):
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                for path, blob in zip(output_paths, cached):
+                    atomic_write_bytes(path, blob)
+                cache.record_output(name, key)
+                if journal is not None:
+                    journal.mark_done(name, key, sha256_bytes(b"".join(cached)))
+                log(f"♻️  Restored from cache: {filename}")
+                continue
+        
+        if journal is not None:
+            journal.mark_pending(name, key)
+        yield Job(category_key, filename, data["prompt"], output_path, data["ratio"], job_model, key, variants)
 
-def main():
+def run_jobs(jobs, model=None, workers=4, limiter=None, models=MODELS, timings=None, cache=None, journal=None,
+             retry_policy=None, duplicates=None):
+    """Generate all jobs on a bounded worker pool, returning (generated, failed)"""
+    if limiter is None:
+        limiter = TokenBucket(REQUESTS_PER_MINUTE, BURST)
+    if retry_policy is None:
+        retry_policy = RetryPolicy(RetryBudget(RETRY_BUDGET))
+    
+    def work(job):
+        name = output_name(job.output_path)
+        if journal is not None:
+            journal.mark_in_flight(name, job.cache_key)
+        
+        def on_retry(error, error_class, attempt, delay):
+            log(f"   🔄 Retry {attempt} ({error_class}) for {job.filename} in {delay:.1f}s: {error}")
+        
+        try:
+            blobs = retry_policy.call(lambda: render_images(
+                job.prompt, variant_paths(job.output_path, job.variants), job.aspect_ratio, model=model,
+                limiter=limiter, model_name=job.model_name, models=models, timings=timings
+            ), on_retry=on_retry)
+            
+            if cache is not None:
+                cache.put(job.cache_key, blobs, {
+                    "output": name,
+                    "prompt": job.prompt,
+                    "aspect_ratio": job.aspect_ratio,
+                    "model": job.model_name,
+                    "variants": job.variants,
+                })
+                cache.record_output(name, job.cache_key)
+            if duplicates is not None:
+                for path, blob in zip(variant_paths(job.output_path, job.variants), blobs):
+                    for distance, match in duplicates.check(path, blob)[:3]:
+                        log(f"   ⚠️  {path.name} looks like {match} ({distance} bits apart)")
+            if journal is not None:
+                journal.mark_done(name, job.cache_key, sha256_bytes(b"".join(blobs)))
+        except Exception as e:
+            # Includes cache, index and journal I/O errors, so the job is recorded as failed, not lost
+            log(f"   ❌ Error ({job.filename}): {e}")
+            if journal is not None:
+                journal.mark_failed(name, job.cache_key, e, permanent=not retry_policy.is_retryable(e))
+            return False
+        return True
+    
+    total_generated = 0
+    total_failed = 0
+    workers = max(1, workers)
+    pending = set()
+    
+    def collect(done):
+        nonlocal total_generated, total_failed
+        for future in done:
+            if future.result():
+                total_generated += 1
+            else:
+                total_failed += 1
+    
+    # Submit jobs as they are produced, keeping a bounded number queued
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for job in jobs:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(work, job))
+        collect(wait(pending)[0])
+    return total_generated, total_failed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate KBYG.ai brand images with Google Imagen 3")
+    parser.add_argument("--backend", choices=BACKENDS, default="vertex",
+                        help="image backend: Vertex AI Imagen or offline placeholders (default: vertex)")
+    parser.add_argument("--output-root", type=Path, default=None,
+                        help="write images, cache and journal under this directory instead of brand-assets/")
+    parser.add_argument("--local-latency", type=float, default=0.0,
+                        help="local backend: mean simulated seconds per request")
+    parser.add_argument("--local-error-rate", type=float, default=0.0,
+                        help="local backend: fraction of requests failing with quota/timeout/unavailable errors")
+    parser.add_argument("--local-safety-rate", type=float, default=0.0,
+                        help="local backend: fraction of requests returning no images (safety block)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="local backend: seed for simulated latency and errors")
+    parser.add_argument("--manifest", type=Path, default=None,
+                        help="prompts manifest (.jsonl or .json; default: IMAGEN_PROMPTS_MANIFEST.jsonl, then .json)")
+    parser.add_argument("--only", action="append", default=[], metavar="CATEGORY",
+                        help="only generate these manifest categories, e.g. heroes_mobile (repeatable)")
+    parser.add_argument("--match", action="append", default=[], metavar="GLOB",
+                        help="only generate entries whose filename or category/filename matches (repeatable)")
+    parser.add_argument("--category-weight", action="append", default=[], metavar="CATEGORY=WEIGHT",
+                        help="favour a category when ordering and interleaving (repeatable)")
+    parser.add_argument("--interleave", choices=("model", "category"), default="model",
+                        help="round-robin between models (per-model quotas) or categories (default: model)")
+    parser.add_argument("--lookahead", type=int, default=LOOKAHEAD,
+                        help=f"most manifest entries held for priority ordering (default: {LOOKAHEAD})")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="number of requests kept in flight (default: 4)")
+    parser.add_argument("--rpm", type=float, default=REQUESTS_PER_MINUTE,
+                        help=f"requests per minute shared by all workers (default: {REQUESTS_PER_MINUTE})")
+    parser.add_argument("--burst", type=int, default=BURST,
+                        help=f"requests that may be issued back-to-back (default: {BURST})")
+    parser.add_argument("--model", default=MODEL_NAME,
+                        help=f"default Imagen model (default: {MODEL_NAME})")
+    parser.add_argument("--category-model", action="append", default=[], metavar="CATEGORY=MODEL",
+                        help="use a different Imagen model for one manifest category (repeatable)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="disable the content-addressed generation cache")
+    parser.add_argument("--cache-max-mb", type=int, default=CACHE_MAX_MB,
+                        help=f"evict least-recently-used cache entries above this size (default: {CACHE_MAX_MB})")
+    parser.add_argument("--retry-budget", type=int, default=RETRY_BUDGET,
+                        help=f"maximum retries across the whole run (default: {RETRY_BUDGET})")
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS,
+                        help=f"stop reissuing an entry after this many journaled failures (default: {MAX_ATTEMPTS})")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="reissue journaled failures, including permanent ones")
+    parser.add_argument("--optimize", action="store_true",
+                        help="losslessly recompress new PNGs afterwards (requires Pillow)")
+    parser.add_argument("--check-duplicates", action="store_true",
+                        help="warn when a new image is a near-duplicate of an existing one (requires Pillow)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("🚀 KBYG.ai Image Generation with Google Imagen 3")
     print("=" * 70)
     
+    if args.backend == "vertex" and not vertex_available():
+        print("❌ Missing required packages!")
+        print("   Run: pip install google-cloud-aiplatform")
+        sys.exit(1)
+    
     # Initialize
-    initialize_vertex_ai()
+    if args.backend == "local":
+        models = create_models("local", latency=args.local_latency, error_rate=args.local_error_rate,
+                               safety_rate=args.local_safety_rate, seed=args.seed)
+        print(f"✅ Using offline local backend (latency: {args.local_latency}s, "
+              f"error rate: {args.local_error_rate}, safety rate: {args.local_safety_rate})")
+    else:
+        models = MODELS
+        print(f"✅ Using Vertex AI (project: {PROJECT_ID}, location: {LOCATION})")
     
-    # Load prompts manifest
-    manifest_path = BASE_DIR / "IMAGEN_PROMPTS_MANIFEST.json"
-    if not manifest_path.exists():
+    output_root = args.output_root or BASE_DIR
+    categories = rebase_categories(output_root)
+    
+    # Stream prompts manifest (JSONL preferred, nested JSON parsed incrementally)
+    manifest_path = args.manifest or find_manifest()
+    if manifest_path is None or not manifest_path.exists():
         print("❌ Prompts manifest not found. Run generate_assets.py first.")
         return
     
-    with open(manifest_path) as f:
-        all_prompts = json.load(f)
-    
-    print(f"\n📋 Loaded {sum(len(p) for p in all_prompts.values())} image prompts")
-    
-    # Generate images by category
-    categories = [
-        ("heroes_desktop", BASE_DIR / "heroes" / "desktop"),
-        ("heroes_tablet", BASE_DIR / "heroes" / "tablet"),
-        ("heroes_square", BASE_DIR / "heroes" / "square"),
-        ("heroes_mobile", BASE_DIR / "heroes" / "mobile"),
-        ("conference_scenes", BASE_DIR / "clip-art" / "conference-scenes"),
-        ("networking", BASE_DIR / "clip-art" / "networking"),
-        ("tech_intelligence", BASE_DIR / "clip-art" / "tech-intelligence"),
-        ("gtm_strategy", BASE_DIR / "clip-art" / "gtm-strategy"),
-        ("patterns", BASE_DIR / "clip-art" / "patterns"),
-    ]
-    
-    total_generated = 0
-    total_failed = 0
+    manifest = ManifestReader(manifest_path, args.only)
+    print(f"\n📋 Streaming image prompts from {manifest_path.name}")
+    if args.only or args.match:
+        print(f"🔎 Filters: categories {args.only or 'all'}, globs {args.match or 'all'}")
+    print(f"⚙️  Workers: {args.workers}, rate: {args.rpm:g} rpm, burst: {args.burst}")
     
-    for category_key, output_dir in categories:
-        prompts = all_prompts.get(category_key, {})
-        if not prompts:
-            continue
+    category_models = dict(item.split("=", 1) for item in args.category_model)
+    category_weights = {key: float(value) for key, value in
+                        (item.split("=", 1) for item in args.category_weight)}
+    if args.interleave == "category":
+        group_key = lambda category, data: category
+    else:
+        group_key = lambda category, data: resolve_model(category, data, args.model, category_models)
+    # ManifestReader already applied --only; only the filename globs are left
+    entries = schedule(match_entries(manifest, args.match), args.lookahead, category_weights, group_key)
+    limiter = TokenBucket(args.rpm, args.burst)
+    timings = TimingReport()
+    cache_dir = output_root / CACHE_DIR.relative_to(BASE_DIR)
+    journal_path = output_root / JOURNAL_PATH.relative_to(BASE_DIR)
+    cache = None if args.no_cache else GenerationCache(cache_dir, args.cache_max_mb * 1024 * 1024)
+    journal = GenerationJournal(journal_path)
+    retry_policy = RetryPolicy(RetryBudget(args.retry_budget))
+    duplicates = None
+    if args.check_duplicates:
+        from phash_index import DEFAULT_ROOTS, INDEX_PATH, PerceptualIndex
         
-        print(f"\n{'='*70}")
-        print(f"📁 {category_key.upper().replace('_', ' ')} ({len(prompts)} images)")
-        print(f"{'='*70}")
-        
-        for filename, data in prompts.items():
-            output_path = output_dir / filename
-            
-            # Skip if already exists
-            if output_path.exists():
-                print(f"⏭️  Skipping (exists): {filename}")
-                continue
-            
-            # Generate
-            prompt = data["prompt"]
-            aspect_ratio = data["ratio"]
-            
-            success = generate_image(prompt, output_path, aspect_ratio)
-            
-            if success:
-                total_generated += 1
-            else:
-                total_failed += 1
-            
-            # Rate limiting - Imagen 3 has quotas
-            time.sleep(2)
+        duplicates = PerceptualIndex(output_root / INDEX_PATH.relative_to(BASE_DIR))
+        duplicates.update(DEFAULT_ROOTS + [path for _, path in categories])
+        print(f"🔍 Checking new images against {len(duplicates.records)} indexed images")
+    started = time.monotonic()
+    try:
+        total_generated, total_failed = run_jobs(
+            iter_jobs(entries, args.model, category_models, cache, journal,
+                      args.max_attempts, args.retry_failed, categories),
+            workers=args.workers, limiter=limiter, models=models, timings=timings, cache=cache,
+            journal=journal, retry_policy=retry_policy, duplicates=duplicates
+        )
+    finally:
+        journal.close()
+        if duplicates is not None:
+            duplicates.save()
+        if cache is not None:
+            cache.flush()
+            cache.evict()
+    elapsed = time.monotonic() - started
     
+    total = total_generated + total_failed
     print(f"\n{'='*70}")
     print(f"✅ GENERATION COMPLETE!")
     print(f"   Generated: {total_generated}")
     print(f"   Failed: {total_failed}")
-    print(f"   Total: {total_generated + total_failed}")
+    print(f"   Total: {total} (of {manifest.count} manifest entries)")
+    if total:
+        print(f"   Elapsed: {elapsed:.1f}s ({total / elapsed * 60:.1f} images/min)")
+    stats = limiter.stats()
+    print(f"   Throttled: {stats['throttled_seconds']:.1f} worker-seconds over {stats['throttle_waits']} waits")
+    print(f"   Quota errors: {stats['quota_errors']} (final rate: {stats['requests_per_minute']:g} rpm)")
+    print(f"   {retry_policy.summary()}")
+    counts = journal.counts()
+    print(f"   Journal: {counts.get(DONE, 0)} done, {counts.get(FAILED, 0)} failed ({journal_path.name})")
+    if cache is not None:
+        print(f"   Cache: {cache.hits} restored, {cache.evicted} evicted")
+    for line in timings.lines(models):
+        print(line)
     print(f"{'='*70}")
+    
+    if args.optimize:
+        from optimize_pngs import optimize_tree, print_report
+        
+        print("\n🗜️  Optimizing generated PNGs...")
+        output_dirs = sorted({path for _, path in categories if path.exists()})
+        print_report(optimize_tree(output_dirs))
 
 if __name__ == "__main__":
     main()
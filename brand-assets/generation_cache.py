@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for generated images
+
+Entries are keyed by a hash of everything that determines the image
+(prompt, aspect ratio, model, safety settings), so a renamed or re-filed
+output is served from the cache and an edited prompt gets a new key.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+from fileutil import atomic_write_bytes
+
+def cache_key(prompt, aspect_ratio, model_name, safety_settings, samples=1):
+    """Stable hex digest of the generation parameters"""
+    params = {
+        "prompt": prompt,
+        "aspect_ratio": aspect_ratio,
+        "model": model_name,
+        "safety": safety_settings,
+    }
+    # Single-sample keys omit the count so they match entries cached before variants existed
+    if samples != 1:
+        params["samples"] = samples
+    encoded = json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+class GenerationCache:
+    """Image bytes + metadata stored under objects/<key[:2]>/<key>.*
+
+    outputs.json remembers which key produced each output file, so a prompt
+    edit invalidates exactly the outputs whose key changed.
+    """
+
+    def __init__(self, root, max_bytes=None):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.outputs_path = self.root / "outputs.json"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._outputs = {}
+        self._dirty = False
+        if self.outputs_path.exists():
+            self._outputs = json.loads(self.outputs_path.read_text())
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def _meta_path(self, key):
+        return self.objects_dir / key[:2] / f"{key}.json"
+
+    def _blob_path(self, key, index):
+        return self.objects_dir / key[:2] / f"{key}.{index}.png"
+
+    def has(self, key):
+        return self._meta_path(key).exists()
+
+    def get(self, key):
+        """Return the list of cached image bytes for a key, or None"""
+        meta_path = self._meta_path(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            blobs = [self._blob_path(key, i).read_bytes() for i in range(meta["count"])]
+        except (FileNotFoundError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            return None
+        # Touch the metadata file so eviction sees it as recently used
+        os.utime(meta_path)
+        with self._lock:
+            self.hits += 1
+        return blobs
+
+    def put(self, key, blobs, metadata=None):
+        """Store image bytes for a key (blobs first, metadata last marks it complete)"""
+        meta_path = self._meta_path(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        for i, data in enumerate(blobs):
+            atomic_write_bytes(self._blob_path(key, i), data)
+        meta = dict(metadata or {})
+        meta.update({
+            "key": key,
+            "count": len(blobs),
+            "bytes": sum(len(data) for data in blobs),
+            "created": time.time(),
+        })
+        atomic_write_bytes(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+    def output_key(self, output_name):
+        with self._lock:
+            return self._outputs.get(output_name)
+
+    def record_output(self, output_name, key):
+        with self._lock:
+            if self._outputs.get(output_name) != key:
+                self._outputs[output_name] = key
+                self._dirty = True
+
+    def flush(self):
+        """Persist the output -> key mapping"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(self.outputs_path, json.dumps(self._outputs, indent=2, sort_keys=True).encode("utf-8"))
+            self._dirty = False
+
+    def evict(self, max_bytes=None):
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes is None or not self.objects_dir.exists():
+            return 0
+        
+        entries = []
+        total = 0
+        for meta_path in self.objects_dir.glob("*/*.json"):
+            try:
+                size = json.loads(meta_path.read_text())["bytes"]
+            except (ValueError, KeyError):
+                size = 0
+            entries.append((meta_path.stat().st_mtime, meta_path, size))
+            total += size
+        
+        evicted = 0
+        for _, meta_path, size in sorted(entries):
+            if total <= max_bytes:
+                break
+            key = meta_path.stem
+            # Remove metadata first so a half-evicted entry never looks complete
+            meta_path.unlink()
+            for blob in meta_path.parent.glob(f"{key}.*.png"):
+                blob.unlink()
+            total -= size
+            evicted += 1
+        self.evicted += evicted
+        return evicted
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal of image generation state
+
+Each line records one state change for an output:
+pending -> in_flight -> done (with checksum) | failed (with error, attempts).
+Replaying the file gives the latest state per output, so a restarted run
+only re-issues outstanding work.
+"""
+
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+from fileutil import atomic_write_text
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+class GenerationJournal:
+    """Thread-safe append-only journal, compacted to latest states on open"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = self._replay()
+        self._compact()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _replay(self):
+        entries = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn final line from a crash mid-write
+                    continue
+                entries[record["output"]] = record
+        return entries
+
+    def _compact(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, "".join(
+            json.dumps(record, sort_keys=True) + "\n" for record in self._entries.values()
+        ))
+
+    def get(self, output):
+        with self._lock:
+            return self._entries.get(output)
+
+    def _append(self, record, sync=False):
+        with self._lock:
+            previous = self._entries.get(record["output"])
+            if previous is not None and previous.get("key") == record.get("key"):
+                record.setdefault("attempts", previous.get("attempts", 0))
+            record.setdefault("attempts", 0)
+            record["ts"] = time.time()
+            self._entries[record["output"]] = record
+            self._file.write(json.dumps(record, sort_keys=True) + "\n")
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+
+    def mark_pending(self, output, key):
+        self._append({"output": output, "key": key, "state": PENDING})
+
+    def mark_in_flight(self, output, key):
+        self._append({"output": output, "key": key, "state": IN_FLIGHT})
+
+    def mark_done(self, output, key, checksum):
+        self._append({"output": output, "key": key, "state": DONE, "sha256": checksum}, sync=True)
+
+    def mark_failed(self, output, key, error, permanent=False):
+        with self._lock:
+            previous = self._entries.get(output)
+            attempts = previous.get("attempts", 0) if previous and previous.get("key") == key else 0
+        self._append({
+            "output": output,
+            "key": key,
+            "state": FAILED,
+            "error": str(error),
+            "permanent": permanent,
+            "attempts": attempts + 1,
+        }, sync=True)
+
+    def counts(self):
+        with self._lock:
+            counts = {}
+            for record in self._entries.values():
+                counts[record["state"]] = counts.get(record["state"], 0) + 1
+            return counts
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Favicon and app-icon bundle for KBYG.ai
+Requires: Pillow (cairosvg for rendering the SVG; otherwise its PNG twin is used)
+
+The icon SVG is rendered once at MASTER_SIZE and every output - the
+multi-resolution favicon.ico, favicon PNGs, apple-touch-icon and PWA
+icons - is a Lanczos downsample of that single master, so all sizes stay
+consistent. site.webmanifest is written alongside.
+"""
+
+import argparse
+import io
+import json
+from pathlib import Path
+import sys
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: the package is installed but libcairo is not
+    cairosvg = None
+
+from fileutil import atomic_write_bytes, atomic_write_text
+from palette import color_values, load_palette
+
+BASE_DIR = Path(__file__).parent
+SOURCE_SVG = BASE_DIR / "logos" / "icon-only" / "icon-square-512.svg"
+ICONS_DIR = BASE_DIR / "icons"
+MASTER_SIZE = 1024
+
+# Maskable-icon background and manifest theme color, from palette.json
+BRAND_COLOR = color_values(load_palette())["gtm-blue"]
+ICO_SIZES = (16, 32, 48, 64)
+# filename: (size, background or None for transparent, fraction of the canvas the icon fills)
+PNG_ICONS = {
+    "favicon-16x16.png": (16, None, 1.0),
+    "favicon-32x32.png": (32, None, 1.0),
+    "favicon-48x48.png": (48, None, 1.0),
+    "apple-touch-icon.png": (180, "#ffffff", 1.0),
+    "icon-192.png": (192, None, 1.0),
+    "icon-512.png": (512, None, 1.0),
+    # Maskable icons keep the logo inside the central 80% safe zone
+    "icon-maskable-512.png": (512, BRAND_COLOR, 0.8),
+}
+
+WEB_MANIFEST = {
+    "name": "KBYG.ai",
+    "short_name": "KBYG",
+    "theme_color": BRAND_COLOR,
+    "background_color": "#ffffff",
+    "display": "standalone",
+}
+
+def render_master(source, size=MASTER_SIZE):
+    """Render source once at size x size; falls back to the SVG's PNG twin without cairosvg"""
+    source = Path(source)
+    if source.suffix.lower() == ".svg" and cairosvg is not None:
+        data = cairosvg.svg2png(url=str(source), output_width=size, output_height=size)
+        return Image.open(io.BytesIO(data)).convert("RGBA")
+    if source.suffix.lower() == ".svg":
+        fallback = source.with_suffix(".png")
+        if not fallback.exists():
+            raise RuntimeError(f"cairosvg is unavailable and {fallback.name} does not exist")
+        print(f"⚠️  cairosvg not available, downsampling {fallback.name} instead")
+        source = fallback
+    with Image.open(source) as image:
+        return image.convert("RGBA").resize((size, size), Image.Resampling.LANCZOS)
+
+def downsample(master, size, background=None, fill=1.0):
+    inner = round(size * fill)
+    icon = master.resize((inner, inner), Image.Resampling.LANCZOS)
+    canvas = Image.new("RGBA", (size, size), background or (0, 0, 0, 0))
+    offset = (size - inner) // 2
+    canvas.alpha_composite(icon, (offset, offset))
+    return canvas.convert("RGB") if background else canvas
+
+def _png_bytes(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+def build_bundle(source=SOURCE_SVG, output_dir=ICONS_DIR, master_size=MASTER_SIZE):
+    """Write every icon plus site.webmanifest; returns [(filename, bytes)]"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    master = render_master(source, master_size)
+    written = []
+
+    for filename, (size, background, fill) in PNG_ICONS.items():
+        data = _png_bytes(downsample(master, size, background, fill))
+        atomic_write_bytes(output_dir / filename, data)
+        written.append((filename, len(data)))
+
+    # Hand Pillow an exact downsample for every frame instead of letting it rescale
+    frames = [downsample(master, size) for size in ICO_SIZES]
+    buffer = io.BytesIO()
+    frames[-1].save(buffer, format="ICO", sizes=[(size, size) for size in ICO_SIZES], append_images=frames[:-1])
+    atomic_write_bytes(output_dir / "favicon.ico", buffer.getvalue())
+    written.append(("favicon.ico", len(buffer.getvalue())))
+
+    manifest = dict(WEB_MANIFEST, icons=[
+        {"src": filename, "sizes": f"{size}x{size}", "type": "image/png",
+         **({"purpose": "maskable"} if "maskable" in filename else {})}
+        for filename, (size, _, _) in PNG_ICONS.items() if size >= 192
+    ])
+    text = json.dumps(manifest, indent=2) + "\n"
+    atomic_write_text(output_dir / "site.webmanifest", text)
+    written.append(("site.webmanifest", len(text)))
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the KBYG.ai favicon and app-icon bundle")
+    parser.add_argument("--source", type=Path, default=SOURCE_SVG,
+                        help="icon SVG (or PNG) to render (default: logos/icon-only/icon-square-512.svg)")
+    parser.add_argument("--output", type=Path, default=ICONS_DIR, help="output directory (default: icons/)")
+    args = parser.parse_args(argv)
+
+    print("🔖 KBYG.ai Icon Bundle")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow cairosvg")
+        sys.exit(1)
+
+    started = time.monotonic()
+    written = build_bundle(args.source, args.output)
+    for filename, size in written:
+        print(f"   ✅ {filename} ({size / 1024:.1f} KB)")
+    print(f"\n✅ {len(written)} files from one {MASTER_SIZE}px render in {time.monotonic() - started:.2f}s")
+    print("\n📋 HTML:")
+    print('   <link rel="icon" href="/favicon.ico" sizes="any">')
+    print('   <link rel="apple-touch-icon" href="/apple-touch-icon.png">')
+    print('   <link rel="manifest" href="/site.webmanifest">')
+
+if __name__ == "__main__":
+    main()
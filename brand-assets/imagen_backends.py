@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Image generation backends for the Imagen driver
+
+A backend is a model loader: loader(model_name, project, location)
+returns a model whose generate_images(prompt=..., number_of_images=...,
+aspect_ratio=..., **safety_settings) yields images with a save(location)
+method. Wrapped in a ModelCache, the same driver runs against Vertex AI
+or the deterministic offline backend below.
+"""
+
+import hashlib
+import random
+import threading
+import time
+
+from model_cache import ModelCache
+from png_writer import vertical_gradient_png
+from retry_policy import QUOTA, TIMEOUT, UNAVAILABLE
+
+BACKENDS = ("vertex", "local")
+
+def load_vertex_model(model_name, project, location):
+    """Create an Imagen model handle bound to a project/location"""
+    try:
+        from google.cloud import aiplatform
+        from vertexai.preview.vision_models import ImageGenerationModel
+    except ImportError as e:
+        raise ImportError("Missing google-cloud-aiplatform. Run: pip install google-cloud-aiplatform") from e
+    aiplatform.init(project=project, location=location)
+    return ImageGenerationModel.from_pretrained(model_name)
+
+def vertex_available():
+    try:
+        import vertexai.preview.vision_models  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+class SimulatedError(Exception):
+    """Error raised by the local backend, shaped like the Google API errors"""
+
+    def __init__(self, message, code, error_class):
+        super().__init__(message)
+        self.code = code
+        self.error_class = error_class
+
+# (error class, HTTP code, message) picked uniformly when a simulated error fires
+SIMULATED_ERRORS = [
+    (QUOTA, 429, "429 Resource exhausted (simulated)"),
+    (TIMEOUT, 504, "504 Deadline exceeded (simulated)"),
+    (UNAVAILABLE, 503, "503 Service unavailable (simulated)"),
+]
+
+def aspect_size(aspect_ratio, long_side):
+    """Pixel size for an aspect ratio like "16:9" with the longer side fixed"""
+    w, h = (int(part) for part in aspect_ratio.split(":"))
+    if w >= h:
+        return long_side, max(1, round(long_side * h / w))
+    return max(1, round(long_side * w / h)), long_side
+
+class PlaceholderImage:
+    """Generated-image stand-in with the same save(location=...) interface"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def save(self, location, include_generation_parameters=False):
+        with open(location, "wb") as f:
+            f.write(self.data)
+
+class LocalImageModel:
+    """Deterministic offline model: placeholder PNGs, simulated latency and errors.
+
+    Outcomes are seeded by (seed, prompt, call number for that prompt), so a
+    given manifest fails and succeeds the same way on every run.
+    """
+
+    def __init__(self, model_name, latency=0.0, error_rate=0.0, safety_rate=0.0, seed=0, long_side=512):
+        self.model_name = model_name
+        self.latency = latency
+        self.error_rate = error_rate
+        self.safety_rate = safety_rate
+        self.seed = seed
+        self.long_side = long_side
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def generate_images(self, prompt, number_of_images=1, aspect_ratio="1:1", **safety_settings):
+        with self._lock:
+            call = self._calls[prompt] = self._calls.get(prompt, 0) + 1
+        rng = random.Random(f"{self.seed}:{self.model_name}:{prompt}:{call}")
+        if self.latency:
+            time.sleep(self.latency * rng.uniform(0.5, 1.5))
+        if rng.random() < self.error_rate:
+            error_class, code, message = rng.choice(SIMULATED_ERRORS)
+            raise SimulatedError(message, code, error_class)
+        if rng.random() < self.safety_rate:
+            return []
+        
+        width, height = aspect_size(aspect_ratio, self.long_side)
+        images = []
+        for index in range(number_of_images):
+            digest = hashlib.sha256(f"{self.model_name}:{prompt}:{index}".encode("utf-8")).digest()
+            images.append(PlaceholderImage(vertical_gradient_png(width, height, digest[:3], digest[3:6])))
+        return images
+
+def local_loader(latency=0.0, error_rate=0.0, safety_rate=0.0, seed=0, load_latency=0.0, long_side=512):
+    """Model loader for the offline backend"""
+    def load(model_name, project, location):
+        if load_latency:
+            time.sleep(load_latency)
+        return LocalImageModel(model_name, latency, error_rate, safety_rate, seed, long_side)
+    return load
+
+def create_models(backend="vertex", **options):
+    """Run-wide model cache for a backend name ("vertex" or "local")"""
+    if backend == "vertex":
+        return ModelCache(load_vertex_model)
+    if backend == "local":
+        return ModelCache(local_loader(**options))
+    raise ValueError(f"Unknown backend {backend!r} (expected one of {', '.join(BACKENDS)})")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the KBYG.ai brand-asset toolchain
+
+    python kbyg_assets.py <command> [options]
+    python kbyg_assets.py colors + logos + banners    # several steps, one process
+
+Each command is the main() of an existing script, imported only when it
+runs, so `logos` or `banners` never pays for Pillow, fontTools or the
+Vertex AI SDK. Options after the command go to that script; use
+`<command> --help` to see them.
+"""
+
+import argparse
+import importlib
+import sys
+import time
+
+# command: (module, help)
+COMMANDS = {
+    "generate": ("generate_images_with_imagen", "generate images from the prompt manifest with Imagen 3"),
+    "assets": ("generate_assets", "create the directory READMEs, font docs, color files and prompt manifest"),
+    "logos": ("create_logo_variations", "create the primary, white, dark and icon-only logo SVGs"),
+    "matrix": ("theme_matrix", "render the logo layout x palette x size x format matrix"),
+    "banners": ("create_banners", "create the platform-specific banner SVGs"),
+    "compose": ("banner_composer", "compose platform banners from hero imagery with the logo and tagline"),
+    "colors": ("palette", "compile palette.json into every color export and swatch"),
+    "fonts": ("font_subset", "subset the Inter web fonts to the glyphs in use"),
+    "icons": ("icon_bundle", "build the favicon and app-icon bundle"),
+    "rasterize": ("rasterize_svgs", "rasterize logo and banner SVGs to PNG"),
+    "optimize": ("optimize_pngs", "losslessly recompress PNG assets"),
+    "derivatives": ("derivatives", "build responsive WebP/AVIF derivatives"),
+    "thumbs": ("contact_sheets", "build thumbnail contact sheets"),
+    "dedupe": ("phash_index", "find duplicate and near-duplicate images"),
+    "catalog": ("asset_catalog", "scan and summarize the asset catalog"),
+    "build": ("build_assets", "incrementally rebuild every generated asset whose inputs changed"),
+}
+SEPARATOR = "+"
+
+def split_steps(args):
+    """[command, *options] lists from `a --x + b --y`"""
+    steps = [[]]
+    for arg in args:
+        if arg == SEPARATOR:
+            steps.append([])
+        else:
+            steps[-1].append(arg)
+    return [step for step in steps if step]
+
+def run(command, argv):
+    module = importlib.import_module(COMMANDS[command][0])
+    # argparse takes its prog from argv[0], so usage reads "kbyg_assets.py logos"
+    saved_argv = sys.argv
+    sys.argv = [f"{sys.argv[0]} {command}", *argv]
+    try:
+        return module.main(argv)
+    finally:
+        sys.argv = saved_argv
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="KBYG.ai brand-asset toolchain",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="commands:\n" + "\n".join(f"  {name:<12} {help}" for name, (_, help) in COMMANDS.items())
+               + f"\n\nChain commands with '{SEPARATOR}' to run them in one process.",
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="options for the command")
+    args = parser.parse_args(argv)
+
+    steps = split_steps([args.command] + args.args)
+    for command, *_ in steps:
+        if command not in COMMANDS:
+            parser.error(f"unknown command: {command}")
+
+    for index, (command, *options) in enumerate(steps):
+        if index:
+            print()
+        started = time.monotonic()
+        run(command, options)
+        if len(steps) > 1:
+            print(f"⏱️  {command} finished in {time.monotonic() - started:.2f}s")
+
+if __name__ == "__main__":
+    sys.exit(main())
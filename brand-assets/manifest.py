@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Streaming readers for the Imagen prompts manifest
+
+Two formats are supported:
+- IMAGEN_PROMPTS_MANIFEST.json: {"category": {"file.png": {...}, ...}, ...}
+  parsed incrementally, one entry at a time
+- IMAGEN_PROMPTS_MANIFEST.jsonl: one {"category", "filename", ...} object per line
+
+Both yield (category, filename, data) tuples as they are read, so memory
+stays flat and the first entry is available before the file is consumed.
+"""
+
+import json
+from pathlib import Path
+import re
+
+BASE_DIR = Path(__file__).parent
+MANIFEST_PATHS = [
+    BASE_DIR / "IMAGEN_PROMPTS_MANIFEST.jsonl",
+    BASE_DIR / "IMAGEN_PROMPTS_MANIFEST.json",
+]
+
+# Manifest category -> output directory, in generation order
+CATEGORIES = [
+    ("heroes_desktop", BASE_DIR / "heroes" / "desktop"),
+    ("heroes_tablet", BASE_DIR / "heroes" / "tablet"),
+    ("heroes_square", BASE_DIR / "heroes" / "square"),
+    ("heroes_mobile", BASE_DIR / "heroes" / "mobile"),
+    ("conference_scenes", BASE_DIR / "clip-art" / "conference-scenes"),
+    ("networking", BASE_DIR / "clip-art" / "networking"),
+    ("tech_intelligence", BASE_DIR / "clip-art" / "tech-intelligence"),
+    ("gtm_strategy", BASE_DIR / "clip-art" / "gtm-strategy"),
+    ("patterns", BASE_DIR / "clip-art" / "patterns"),
+]
+
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+
+class _JSONStream:
+    """Buffered reader that decodes JSON tokens from a file one at a time"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop the consumed prefix so the buffer only holds unread text
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character (without consuming it), or "" at EOF"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Malformed manifest: expected one of {chars!r}, got {char or 'EOF'!r}")
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value (string or object)"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value ending exactly at the buffer edge may be a truncated number/literal
+            if end == len(self._buf) and self._buf[self._pos] not in '"{[' and self._fill():
+                continue
+            self._pos = end
+            return value
+
+def _iter_json_manifest(f, categories=None):
+    stream = _JSONStream(f)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        category = stream.value()
+        stream.expect(":")
+        if categories is not None and category not in categories:
+            # Consume the unwanted category as one value without yielding its entries
+            stream.value()
+            if stream.expect(",}") == "}":
+                return
+            continue
+        stream.expect("{")
+        if stream.peek() != "}":
+            while True:
+                filename = stream.value()
+                stream.expect(":")
+                yield category, filename, stream.value()
+                if stream.expect(",}") == "}":
+                    break
+        else:
+            stream.expect("}")
+        if stream.expect(",}") == "}":
+            return
+
+def _iter_jsonl_manifest(f, categories=None):
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        data = json.loads(line)
+        try:
+            category = data.pop("category")
+            filename = data.pop("filename")
+        except KeyError as e:
+            raise ValueError(f"Manifest line {line_number} is missing {e}") from None
+        if categories is None or category in categories:
+            yield category, filename, data
+
+class ManifestReader:
+    """Iterable over (category, filename, data) entries; counts entries read.
+
+    With `categories`, entries of other categories are skipped inside the parser.
+    """
+
+    def __init__(self, path, categories=None):
+        self.path = Path(path)
+        self.categories = set(categories) if categories else None
+        self.count = 0
+
+    def __iter__(self):
+        parse = _iter_jsonl_manifest if self.path.suffix == ".jsonl" else _iter_json_manifest
+        with open(self.path, encoding="utf-8") as f:
+            for entry in parse(f, self.categories):
+                self.count += 1
+                yield entry
+
+def variant_paths(output_path, variants):
+    """Output paths for N samples of one prompt: name_v1..name_vN, keeping any trailing size tag.
+
+    hero-command-center-1920x1080.png -> hero-command-center_v1-1920x1080.png
+    """
+    if variants <= 1:
+        return [output_path]
+    base, size = re.match(r"^(.*?)([-_]\d+x\d+)?$", output_path.stem).groups()
+    return [output_path.with_name(f"{base}_v{i}{size or ''}{output_path.suffix}")
+            for i in range(1, variants + 1)]
+
+def find_manifest(paths=MANIFEST_PATHS):
+    """The first manifest that exists, or None"""
+    return next((path for path in paths if path.exists()), None)
+
+def manifest_outputs(manifest_path=None):
+    """(category, filename, output path) for every file the manifest can produce, _vN variants included"""
+    manifest_path = manifest_path or find_manifest()
+    if manifest_path is None:
+        return
+    output_dirs = dict(CATEGORIES)
+    for category, filename, data in ManifestReader(manifest_path, output_dirs):
+        for path in variant_paths(output_dirs[category] / filename, int(data.get("variants", 1))):
+            yield category, filename, path
+
+def iter_prompt_dict(all_prompts, categories=None):
+    """(category, filename, data) entries from an in-memory manifest dict"""
+    for category in categories or all_prompts:
+        for filename, data in all_prompts.get(category, {}).items():
+            yield category, filename, data
+
+def write_jsonl_manifest(all_prompts, path):
+    """Write a manifest dict in the line-per-entry format"""
+    with open(path, "w", encoding="utf-8") as f:
+        for category, filename, data in iter_prompt_dict(all_prompts):
+            f.write(json.dumps({"category": category, "filename": filename, **data}) + "\n")
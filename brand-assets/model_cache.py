@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Run-wide cache of Imagen model handles, plus cold/warm latency reporting
+"""
+
+import statistics
+import threading
+import time
+
+class ModelCache:
+    """Loads each (model, project, location) once and shares it between workers"""
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._models = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.load_times = {}
+
+    def is_loaded(self, model_name, project, location):
+        return (model_name, project, location) in self._models
+
+    def get(self, model_name, project, location):
+        key = (model_name, project, location)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another worker may have finished loading while we waited
+            if key not in self._models:
+                started = time.monotonic()
+                self._models[key] = self._loader(model_name, project, location)
+                self.load_times[key] = time.monotonic() - started
+        return self._models[key]
+
+    def __len__(self):
+        return len(self._models)
+
+class TimingReport:
+    """Per-image latencies split into cold (paid a model load) and warm"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cold = []
+        self.warm = []
+
+    def record(self, seconds, cold):
+        with self._lock:
+            (self.cold if cold else self.warm).append(seconds)
+
+    @staticmethod
+    def _summary(samples):
+        if not samples:
+            return "none"
+        return (f"{len(samples)} images, mean {statistics.mean(samples):.2f}s, "
+                f"p50 {statistics.median(samples):.2f}s, max {max(samples):.2f}s")
+
+    def lines(self, models=None):
+        lines = ["⏱️  Timing report"]
+        if models is not None:
+            for (model_name, project, location), seconds in models.load_times.items():
+                lines.append(f"   Model load: {model_name} ({project}/{location}): {seconds:.2f}s")
+        lines.append(f"   Cold: {self._summary(self.cold)}")
+        lines.append(f"   Warm: {self._summary(self.warm)}")
+        return lines
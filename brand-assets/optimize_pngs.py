@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Losslessly recompress KBYG.ai PNG assets across all CPU cores
+Requires: Pillow
+
+Each file is re-encoded with maximum zlib effort, RGBA with an opaque
+alpha channel is stored as RGB, and images with 256 colors or fewer are
+tried as palette PNGs. A candidate is only kept if it is smaller AND
+decodes to identical pixels. File hashes from the last pass are kept in
+.png-optimize-state.json so unchanged files are skipped.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import io
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+try:
+    from PIL import Image
+    from PIL.PngImagePlugin import PngInfo
+except ImportError:
+    Image = None
+
+from fileutil import atomic_write_bytes, atomic_write_text, sha256_bytes
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_ROOTS = [BASE_DIR / "images", BASE_DIR / "heroes", BASE_DIR / "clip-art"]
+STATE_PATH = BASE_DIR / ".png-optimize-state.json"
+
+def _encode(image, info):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True, **info)
+    return buffer.getvalue()
+
+def _same_pixels(original, data):
+    with Image.open(io.BytesIO(data)) as candidate:
+        return candidate.convert(original.mode).tobytes() == original.tobytes()
+
+def _candidates(image):
+    """Lossless re-encodings worth trying for an image"""
+    yield image
+    if image.mode == "RGBA" and image.getchannel("A").getextrema() == (255, 255):
+        image = image.convert("RGB")
+        yield image
+    # Adaptive quantization only accepts RGB(A); grayscale PNGs are already compact
+    if image.mode in ("RGB", "RGBA") and image.getcolors(256) is not None:
+        yield image.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+
+def optimize_file(path):
+    """Recompress one PNG in place; returns (path, bytes_before, bytes_after, sha256_after)"""
+    path = Path(path)
+    data = path.read_bytes()
+    before = len(data)
+    best = data
+    
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        # Keep ancillary metadata that affects rendering or provenance
+        info = {key: image.info[key] for key in ("icc_profile", "dpi", "exif") if key in image.info}
+        text = getattr(image, "text", None)
+        if text:
+            pnginfo = PngInfo()
+            for key, value in text.items():
+                pnginfo.add_text(key, value)
+            info["pnginfo"] = pnginfo
+        
+        for candidate in _candidates(image):
+            encoded = _encode(candidate, info)
+            if len(encoded) < len(best) and _same_pixels(image, encoded):
+                best = encoded
+    
+    if best is not data:
+        atomic_write_bytes(path, best)
+    return str(path), before, len(best), sha256_bytes(best)
+
+def optimize_or_skip(path):
+    """optimize_file() that reports a failure instead of raising, so one bad file cannot stop the pool"""
+    try:
+        return optimize_file(path), None
+    except Exception as e:
+        return (str(path), None, None, None), f"{type(e).__name__}: {e}"
+
+def load_state(state_path=STATE_PATH):
+    if state_path.exists():
+        return json.loads(state_path.read_text())
+    return {}
+
+def _relative(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+def category_of(path, root):
+    """Report bucket for a file, e.g. images/ai-generated or clip-art/networking"""
+    root = Path(root)
+    parts = Path(path).relative_to(root).parts
+    return f"{root.name}/{parts[0]}" if len(parts) > 1 else root.name
+
+def find_stale(roots, state):
+    """{path: category} for PNG files whose size/mtime (then content hash) differ from the last pass"""
+    stale = {}
+    for root in roots:
+        if not Path(root).exists():
+            continue
+        for path in sorted(Path(root).rglob("*.png")):
+            if path.name.startswith("."):
+                continue
+            record = state.get(_relative(path))
+            stat = path.stat()
+            if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                continue
+            if record and record["sha256"] == sha256_bytes(path.read_bytes()):
+                # Touched but unchanged - refresh the stat fingerprint only
+                record["mtime_ns"] = stat.st_mtime_ns
+                continue
+            stale[path] = category_of(path, root)
+    return stale
+
+def optimize_tree(roots=None, workers=None, state_path=STATE_PATH, force=False):
+    """Optimize every changed PNG under roots; returns {category: [files, before, after]}"""
+    roots = roots or DEFAULT_ROOTS
+    state = {} if force else load_state(state_path)
+    stale = find_stale(roots, state)
+    print(f"🔍 {len(stale)} PNG files to optimize")
+    
+    report = {}
+    try:
+        if stale:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                for (path, before, after, digest), error in pool.map(optimize_or_skip, stale, chunksize=4):
+                    path = Path(path)
+                    if error is not None:
+                        # Not recorded, so the file is retried on the next pass
+                        print(f"   ⚠️  Skipped {_relative(path)}: {error}")
+                        continue
+                    stat = path.stat()
+                    state[_relative(path)] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                    totals = report.setdefault(stale[path], [0, 0, 0])
+                    totals[0] += 1
+                    totals[1] += before
+                    totals[2] += after
+    finally:
+        # Files already rewritten in place stay recorded even if the run is interrupted
+        atomic_write_text(state_path, json.dumps(state, indent=2, sort_keys=True))
+    return report
+
+def print_report(report):
+    saved_total = 0
+    for category, (files, before, after) in sorted(report.items()):
+        saved = before - after
+        saved_total += saved
+        print(f"   {category}: {files} files, {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB "
+              f"(saved {saved / 1e3:.0f} KB, {saved / before * 100 if before else 0:.1f}%)")
+    print(f"   Total saved: {saved_total / 1e6:.2f} MB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Losslessly recompress KBYG.ai PNG assets")
+    parser.add_argument("roots", nargs="*", type=Path,
+                        help="directories to scan (default: images/, heroes/, clip-art/)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="ignore the state file and re-check every PNG")
+    args = parser.parse_args(argv)
+    
+    print("🗜️  KBYG.ai PNG Optimizer")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+    
+    started = time.monotonic()
+    report = optimize_tree(args.roots or None, args.workers, force=args.force)
+    print(f"\n✅ Optimized in {time.monotonic() - started:.1f}s")
+    print_report(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Compile palette.json - the single source of truth for KBYG.ai colors
+
+One pass turns the token file into the CSS variables, SCSS, Tailwind
+config, Figma tokens, Sketch palette, PNG swatches and the SVG recolor
+maps used for logo themes. Each output is rendered in memory and only
+written when its bytes differ from what is on disk, so an unchanged
+palette rewrites nothing and an edit touches only the affected files.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from fileutil import write_if_changed
+from png_writer import hex_to_rgb
+from swatches import write_swatches
+
+BASE_DIR = Path(__file__).parent
+PALETTE_PATH = BASE_DIR / "palette.json"
+COLORS_DIR = BASE_DIR / "colors"
+
+def load_palette(path=PALETTE_PATH):
+    return json.loads(Path(path).read_text())
+
+def color_values(palette):
+    """{token name: hex} across brand colors and neutrals"""
+    return {name: token["value"] for section in ("brand", "neutrals") for name, token in palette[section].items()}
+
+def swatch_colors(palette):
+    """{token name: hex} for the brand colors and neutrals that get a PNG swatch"""
+    return {name: token["value"] for section in ("brand", "neutrals")
+            for name, token in palette[section].items() if token.get("swatch", True)}
+
+def write_palette_swatches(palette, output_dir):
+    """Swatches, the brand strip and brand ramps; returns {filename: changed}"""
+    brand = list(palette["brand"])
+    return write_swatches(swatch_colors(palette), output_dir, strip=brand, ramps=brand)
+
+def resolve(palette, value):
+    """A token name or a literal color"""
+    return color_values(palette).get(value, value)
+
+def recolor_maps(palette):
+    """{theme: svg_model recolor map} with token names resolved to hex"""
+    return {
+        theme: {prop: {resolve(palette, old): resolve(palette, new) for old, new in mapping.items()}
+                for prop, mapping in recolor.items()}
+        for theme, recolor in palette["themes"].items()
+    }
+
+def _css_name(token):
+    return f"kbyg-{token['group']}-{token['name']}"
+
+def _stops(palette, gradient, color):
+    stops = gradient["stops"]
+    return ", ".join(f"{color(palette['brand'][name])} {round(index * 100 / (len(stops) - 1))}%"
+                     for index, name in enumerate(stops))
+
+def _gradients(palette, target):
+    return {name: gradient for name, gradient in palette["gradients"].items() if target in gradient["exports"]}
+
+def compile_css(palette):
+    brand = palette["brand"]
+    sections = [
+        ["  /* Primary Brand Colors */"]
+        + [f"  --{_css_name(token)}: {token['value']};" for token in brand.values()],
+        ["  /* RGB Values (for rgba usage) */"]
+        + [f"  --{_css_name(token)}-rgb: {', '.join(map(str, hex_to_rgb(token['value'])))};"
+           for token in brand.values()],
+        ["  /* Semantic Naming */"]
+        + [f"  --color-{token['role']}: var(--{_css_name(token)});" for token in brand.values()],
+        ["  /* Neutrals */"]
+        + [f"  --color-{name}: {token['value']};" for name, token in palette["neutrals"].items()],
+        ["  /* Gradients */"]
+        + [f"  --gradient-{name}: linear-gradient({gradient['angle']}deg, "
+           f"{_stops(palette, gradient, lambda token: f'var(--{_css_name(token)})')});"
+           for name, gradient in _gradients(palette, "css").items()],
+    ]
+    alphas = [
+        [f"  --kbyg-{token['group']}-{round(alpha * 100)}: rgba(var(--{_css_name(token)}-rgb), {alpha});"
+         for alpha in palette["alphas"]]
+        for token in brand.values()
+    ]
+    alphas[0].insert(0, "  /* Alpha Variants */")
+    sections.extend(alphas)
+    primary = next(token for token in brand.values() if token["role"] == "primary")
+    body = "\n  \n".join("\n".join(section) for section in sections)
+    return f"""/* KBYG.ai Brand Colors - CSS Variables */
+
+:root {{
+{body}
+}}
+
+/* Usage Examples */
+.btn-primary {{
+  background: var(--color-primary);
+  color: var(--color-white);
+}}
+
+.btn-gradient {{
+  background: var(--gradient-primary);
+  color: var(--color-white);
+}}
+
+.bg-brand-overlay {{
+  background: var(--kbyg-{primary['group']}-{round(palette['alphas'][0] * 100)});
+}}
+"""
+
+def compile_scss(palette):
+    brand = palette["brand"]
+    neutrals = palette["neutrals"]
+    primary = next(token for token in brand.values() if token["role"] == "primary")
+    color_map = [f"  '{token['group']}-{token['name']}': ${_css_name(token)}," for token in brand.values()]
+    color_map += [f"  '{name}': $color-{name}," for name in neutrals]
+    mixins = [
+        f"@mixin gradient-{name} {{\n  background: linear-gradient({gradient['angle']}deg, "
+        f"{_stops(palette, gradient, lambda token: '$' + _css_name(token))});\n}}"
+        for name, gradient in _gradients(palette, "scss").items()
+    ]
+    return f"""// KBYG.ai Brand Colors - SCSS Variables
+
+// Primary Brand Colors
+{chr(10).join(f"${_css_name(token)}: {token['value']};" for token in brand.values())}
+
+// Semantic Names
+{chr(10).join(f"$color-{token['role']}: ${_css_name(token)};" for token in brand.values())}
+
+// Neutrals
+{chr(10).join(f"$color-{name}: {token['value']};" for name, token in neutrals.items())}
+
+// Color Map for iteration
+$brand-colors: (
+{chr(10).join(color_map)}
+);
+
+// Mixins
+{(chr(10) * 2).join(mixins)}
+
+// Alpha function
+@function alpha-color($color, $opacity) {{
+  @return rgba($color, $opacity);
+}}
+
+// Usage example
+.btn-primary {{
+  background-color: $color-primary;
+  color: $color-white;
+  
+  &:hover {{
+    background-color: darken($color-primary, 10%);
+  }}
+}}
+
+.bg-overlay {{
+  background-color: alpha-color(${_css_name(primary)}, {palette['alphas'][0]});
+}}
+
+.gradient-bg {{
+  @include gradient-primary;
+}}
+"""
+
+def compile_tailwind(palette):
+    groups = []
+    for token in palette["brand"].values():
+        lines = [f"          {token['group']}: {{", f"            DEFAULT: '{token['value']}',"]
+        for step, value in token["scale"].items():
+            note = f" // Brand {token['role']}" if value == token["value"] else ""
+            lines.append(f"            {step}: '{value}',{note}")
+        lines.append("          },")
+        groups.append("\n".join(lines))
+    roles = "\n".join(f"        {token['role']}: '{token['value']}'," for token in palette["brand"].values())
+    gradients = "\n".join(
+        f"        'gradient-{name}': 'linear-gradient({gradient['angle']}deg, "
+        f"{_stops(palette, gradient, lambda token: token['value'])})',"
+        for name, gradient in _gradients(palette, "tailwind").items()
+    )
+    return f"""// KBYG.ai Brand Colors - Tailwind Config Extension
+
+module.exports = {{
+  theme: {{
+    extend: {{
+      colors: {{
+        kbyg: {{
+{chr(10).join(groups)}
+        }},
+{roles}
+      }},
+      backgroundImage: {{
+{gradients}
+      }},
+    }},
+  }},
+}}
+"""
+
+def compile_figma(palette):
+    kbyg = {}
+    semantic = {}
+    for token in palette["brand"].values():
+        kbyg.setdefault(token["group"], {})[token["name"]] = {
+            "value": token["value"], "type": "color", "description": token["description"],
+        }
+        semantic[token["role"]] = {"value": f"{{kbyg.{token['group']}.{token['name']}}}", "type": "color"}
+    return json.dumps({"global": {"kbyg": kbyg, "semantic": semantic}}, indent=2)
+
+def _position(index, count):
+    position = index / max(1, count - 1)
+    return int(position) if position.is_integer() else position
+
+def compile_sketch(palette):
+    gradients = []
+    for gradient in _gradients(palette, "sketch").values():
+        stops = gradient["stops"]
+        gradients.append({
+            "name": gradient["label"],
+            "gradientType": "linear",
+            "angle": gradient["angle"],
+            "stops": [{"color": resolve(palette, name), "position": _position(index, len(stops))}
+                      for index, name in enumerate(stops)],
+        })
+    return json.dumps({
+        "compatibleVersion": "2.0",
+        "pluginVersion": "2.22",
+        "colors": list(color_values(palette).values()),
+        "gradients": gradients,
+        "images": [],
+    }, indent=2)
+
+COMPILERS = {
+    "kbyg-colors.css": compile_css,
+    "kbyg-colors.scss": compile_scss,
+    "tailwind.config.js": compile_tailwind,
+    "figma-tokens.json": compile_figma,
+    "sketch-palette.json": compile_sketch,
+    "recolor-maps.json": lambda palette: json.dumps(recolor_maps(palette), indent=2) + "\n",
+}
+
+def compile_palette(palette_path=PALETTE_PATH, output_dir=COLORS_DIR, swatches=True):
+    """Render every export and write the ones that changed; returns {filename: changed}"""
+    palette = load_palette(palette_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results = {filename: write_if_changed(output_dir / filename, compile_format(palette).encode("utf-8"))
+               for filename, compile_format in COMPILERS.items()}
+    if swatches:
+        results.update(write_palette_swatches(palette, output_dir))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile palette.json into every KBYG.ai color export")
+    parser.add_argument("--palette", type=Path, default=PALETTE_PATH, help="token file (default: palette.json)")
+    parser.add_argument("--output", type=Path, default=COLORS_DIR, help="output directory (default: colors/)")
+    parser.add_argument("--no-swatches", action="store_true", help="skip the PNG swatches")
+    args = parser.parse_args(argv)
+
+    print("🎨 KBYG.ai Palette Compiler")
+    print("=" * 70)
+    results = compile_palette(args.palette, args.output, not args.no_swatches)
+    for filename, changed in results.items():
+        print(f"{'   ✅ Updated' if changed else '   Unchanged'}: {filename}")
+    print(f"\n✅ {sum(results.values())} of {len(results)} outputs changed")
+
+if __name__ == "__main__":
+    main()
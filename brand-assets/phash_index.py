@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Perceptual-hash index for finding duplicate and near-duplicate images
+Requires: Pillow
+
+Each image gets a 64-bit dHash (9x8 grayscale, adjacent-pixel gradient).
+Hashes live in a compact binary file (.phash-index.bin: 8-byte hash plus
+stat fingerprint and path per record) and are searched with a BK-tree, so
+a lookup touches a small fraction of the library instead of every pair.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
+from pathlib import Path
+import struct
+import sys
+import threading
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from fileutil import atomic_write_bytes
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_ROOTS = [BASE_DIR / "images", BASE_DIR / "heroes", BASE_DIR / "clip-art", BASE_DIR.parent / "src" / "assets"]
+INDEX_PATH = BASE_DIR / ".phash-index.bin"
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+# Max differing bits (of 64) to call two images near-duplicates
+THRESHOLD = 6
+
+_MAGIC = b"KPH1"
+_RECORD = struct.Struct("<QQqH")
+
+def dhash(image):
+    """64-bit difference hash of a PIL image"""
+    image.draft("L", (64, 64))
+    small = image.convert("L").resize((9, 8), Image.Resampling.BILINEAR)
+    pixels = small.tobytes()
+    value = 0
+    for row in range(8):
+        offset = row * 9
+        for col in range(8):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+def dhash_file(path):
+    with Image.open(path) as image:
+        return str(path), dhash(image)
+
+def dhash_bytes(data):
+    with Image.open(io.BytesIO(data)) as image:
+        return dhash(image)
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+class BKTree:
+    """Burkhard-Keller tree over Hamming distance"""
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, value, item):
+        self.size += 1
+        if self.root is None:
+            self.root = (value, [item], {})
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (value, [item], {})
+                return
+            node = child
+
+    def query(self, value, radius):
+        """[(distance, item)] for every item within radius of value"""
+        results = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node_value, items, children = stack.pop()
+            distance = hamming(value, node_value)
+            if distance <= radius:
+                results.extend((distance, item) for item in items)
+            # Triangle inequality: only subtrees in [d - r, d + r] can match
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return sorted(results)
+
+def _relative(path):
+    try:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve().parent).as_posix()
+    except ValueError:
+        return str(path)
+
+class PerceptualIndex:
+    """Persistent {path: (hash, size, mtime_ns)} with a BK-tree for lookups"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.records = {}
+        self._tree = None
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        data = self.path.read_bytes()
+        if data[:4] != _MAGIC:
+            return
+        offset = 4
+        while offset < len(data):
+            value, size, mtime_ns, length = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            name = data[offset:offset + length].decode("utf-8")
+            offset += length
+            self.records[name] = (value, size, mtime_ns)
+
+    def save(self):
+        parts = [_MAGIC]
+        for name, (value, size, mtime_ns) in sorted(self.records.items()):
+            encoded = name.encode("utf-8")
+            parts.append(_RECORD.pack(value, size, mtime_ns, len(encoded)))
+            parts.append(encoded)
+        atomic_write_bytes(self.path, b"".join(parts))
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = BKTree()
+            for name, (value, _, _) in self.records.items():
+                self._tree.add(value, name)
+        return self._tree
+
+    def add(self, name, value, size=0, mtime_ns=0):
+        with self._lock:
+            previous = self.records.get(name)
+            self.records[name] = (value, size, mtime_ns)
+            if previous is not None and previous[0] != value:
+                self._tree = None
+            elif self._tree is not None and previous is None:
+                self._tree.add(value, name)
+
+    def nearest(self, value, radius=THRESHOLD, exclude=None):
+        with self._lock:
+            return [(d, name) for d, name in self.tree.query(value, radius) if name != exclude]
+
+    def check(self, path, data, radius=THRESHOLD):
+        """Hash freshly generated bytes for path, return near-duplicates already indexed, then index it"""
+        name = _relative(path)
+        value = dhash_bytes(data)
+        matches = self.nearest(value, radius, exclude=name)
+        stat = Path(path).stat() if Path(path).exists() else None
+        self.add(name, value, stat.st_size if stat else 0, stat.st_mtime_ns if stat else 0)
+        return matches
+
+    def update(self, roots, workers=None):
+        """Hash new or changed images under roots in parallel; drops vanished files under those roots only"""
+        seen = set()
+        stale = []
+        prefixes = [_relative(root).rstrip("/") + "/" for root in roots]
+        for root in roots:
+            if not Path(root).exists():
+                continue
+            for path in sorted(Path(root).rglob("*")):
+                if path.suffix.lower() not in IMAGE_SUFFIXES or path.name.startswith("."):
+                    continue
+                name = _relative(path)
+                seen.add(name)
+                stat = path.stat()
+                record = self.records.get(name)
+                if record is None or record[1:] != (stat.st_size, stat.st_mtime_ns):
+                    stale.append(path)
+
+        # Records under other roots belong to earlier runs over those roots and are kept
+        for name in set(self.records) - seen:
+            if name.startswith(tuple(prefixes)):
+                del self.records[name]
+                self._tree = None
+        if stale:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                for path, value in pool.map(dhash_file, stale, chunksize=8):
+                    stat = Path(path).stat()
+                    self.add(_relative(path), value, stat.st_size, stat.st_mtime_ns)
+        return len(stale)
+
+    def duplicate_groups(self, radius=THRESHOLD):
+        """Groups of paths connected by near-duplicate links (union-find over BK-tree hits)"""
+        parent = {}
+
+        def find(name):
+            parent.setdefault(name, name)
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]
+                name = parent[name]
+            return name
+
+        for name, (value, _, _) in self.records.items():
+            for _, other in self.tree.query(value, radius):
+                if other != name:
+                    parent[find(other)] = find(name)
+
+        groups = {}
+        for name in parent:
+            groups.setdefault(find(name), []).append(name)
+        return sorted((sorted(group) for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find duplicate and near-duplicate KBYG.ai images")
+    parser.add_argument("roots", nargs="*", type=Path,
+                        help="directories to index (default: images/, heroes/, clip-art/, ../src/assets)")
+    parser.add_argument("--threshold", type=int, default=THRESHOLD,
+                        help=f"max differing bits of 64 for a near-duplicate (default: {THRESHOLD})")
+    parser.add_argument("--query", type=Path, help="only report near-duplicates of this image")
+    parser.add_argument("--workers", type=int, default=None, help="hashing processes (default: all cores)")
+    args = parser.parse_args(argv)
+    
+    print("🔍 KBYG.ai Perceptual Duplicate Finder")
+    print("=" * 70)
+    if Image is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install Pillow")
+        sys.exit(1)
+    
+    index = PerceptualIndex()
+    started = time.monotonic()
+    hashed = index.update(args.roots or DEFAULT_ROOTS, args.workers)
+    index.save()
+    print(f"📋 Indexed {len(index.records)} images ({hashed} hashed) in {time.monotonic() - started:.1f}s")
+    
+    started = time.monotonic()
+    if args.query:
+        _, value = dhash_file(args.query)
+        matches = index.nearest(value, args.threshold, exclude=_relative(args.query))
+        for distance, name in matches:
+            print(f"   {distance:2d} bits  {name}")
+        print(f"\n✅ {len(matches)} near-duplicates of {args.query.name}")
+    else:
+        groups = index.duplicate_groups(args.threshold)
+        for group in groups:
+            print(f"\n   {len(group)} similar images:")
+            for name in group:
+                print(f"      {name}")
+        print(f"\n✅ {len(groups)} duplicate groups found in {time.monotonic() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
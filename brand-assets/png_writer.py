@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Minimal dependency-free PNG encoder (8-bit RGB / RGBA)
+"""
+
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+def encode_png(width, height, rows, alpha=False, compress_level=9):
+    """Encode an image given as an iterable of `height` raw rows of packed RGB(A) bytes"""
+    channels = 4 if alpha else 3
+    row_size = width * channels
+    compressor = zlib.compressobj(compress_level)
+    parts = []
+    count = 0
+    for row in rows:
+        if len(row) != row_size:
+            raise ValueError(f"row {count} is {len(row)} bytes, expected {row_size}")
+        # Filter type 0 (None) per scanline
+        parts.append(compressor.compress(b"\x00" + bytes(row)))
+        count += 1
+    if count != height:
+        raise ValueError(f"got {count} rows, expected {height}")
+    parts.append(compressor.flush())
+    
+    color_type = 6 if alpha else 2
+    header = struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)
+    return PNG_SIGNATURE + _chunk(b"IHDR", header) + _chunk(b"IDAT", b"".join(parts)) + _chunk(b"IEND", b"")
+
+def hex_to_rgb(hex_color):
+    value = hex_color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+def solid_png(width, height, rgb):
+    """PNG filled with a single color"""
+    row = bytes(rgb) * width
+    return encode_png(width, height, (row for _ in range(height)))
+
+def vertical_gradient_png(width, height, top_rgb, bottom_rgb):
+    """PNG with a linear top-to-bottom gradient"""
+    def rows():
+        for y in range(height):
+            t = y / max(1, height - 1)
+            color = bytes(round(a + (b - a) * t) for a, b in zip(top_rgb, bottom_rgb))
+            yield color * width
+    return encode_png(width, height, rows())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Rasterize KBYG.ai logo and banner SVGs to PNG at 1x/2x/3x
+Requires: cairosvg (and the cairo system library)
+
+Every SVG under logos/ and banners/ becomes name@1x.png, name@2x.png
+and name@3x.png next to it, so the hand-exported name.png twins are left
+alone. Renders run across all CPU cores. .rasterize-state.json records
+the SVG content hash (from the asset catalog) each PNG was rendered
+from, so only PNGs whose SVG actually changed are redrawn - rewriting an
+SVG with the same bytes costs nothing - and PNGs this script did not
+create are never overwritten.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: the package is installed but libcairo is not
+    cairosvg = None
+
+from asset_catalog import AssetCatalog, catalog_name
+from fileutil import atomic_write_text, temp_path_for
+
+BASE_DIR = Path(__file__).parent
+DEFAULT_ROOTS = [BASE_DIR / "logos", BASE_DIR / "banners"]
+STATE_PATH = BASE_DIR / ".rasterize-state.json"
+SCALES = (1, 2, 3)
+
+def output_path(svg_path, scale):
+    svg_path = Path(svg_path)
+    return svg_path.with_name(f"{svg_path.stem}@{scale:g}x.png")
+
+def load_state(state_path=STATE_PATH):
+    """{png catalog name: sha256 of the SVG it was rendered from}"""
+    if state_path.exists():
+        return json.loads(state_path.read_text())
+    return {}
+
+def rasterize_file(svg_path, out_path, scale):
+    """Render one SVG at scale; returns (out_path, seconds)"""
+    started = time.perf_counter()
+    tmp_path = temp_path_for(out_path)
+    try:
+        cairosvg.svg2png(url=str(svg_path), write_to=str(tmp_path), scale=scale)
+        os.replace(tmp_path, out_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return out_path, time.perf_counter() - started
+
+def find_stale(roots, state, scales=SCALES, force=False, rescan=False):
+    """([(svg, png, scale, svg sha256)] to render, [png] left alone because this script did not create them)"""
+    with AssetCatalog() as catalog:
+        if rescan:
+            catalog.scan(roots)
+        else:
+            catalog.refresh(roots)
+        # current() re-hashes an SVG edited in place, which leaves its directory mtime alone
+        sources = [(svg, catalog.current(svg)["sha256"]) for root in roots for svg in catalog.files(root, ".svg")]
+    stale, foreign = [], []
+    for svg_path, digest in sources:
+        for scale in scales:
+            out_path = output_path(svg_path, scale)
+            name = catalog_name(out_path)
+            if out_path.exists() and name not in state:
+                foreign.append(out_path)
+            elif force or not out_path.exists() or state[name] != digest:
+                stale.append((svg_path, out_path, scale, digest))
+    return stale, foreign
+
+def rasterize_tree(roots=None, scales=SCALES, workers=None, force=False, state_path=STATE_PATH, rescan=False):
+    """Render stale PNGs in parallel; returns [(png, seconds)] in completion order"""
+    state = load_state(state_path)
+    stale, foreign = find_stale(roots or DEFAULT_ROOTS, state, scales, force, rescan)
+    for out_path in foreign:
+        print(f"   ⚠️  Not overwriting {catalog_name(out_path)}: it was not rendered by this script")
+    print(f"🔍 {len(stale)} PNG renders needed")
+    digests = {out_path: digest for _, out_path, _, digest in stale}
+    timings = []
+    try:
+        if stale:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                svgs, outputs, render_scales, _ = zip(*stale)
+                for out_path, seconds in pool.map(rasterize_file, svgs, outputs, render_scales):
+                    print(f"   ✅ {catalog_name(out_path)} ({seconds * 1000:.0f} ms)")
+                    state[catalog_name(out_path)] = digests[out_path]
+                    timings.append((out_path, seconds))
+    finally:
+        if timings:
+            atomic_write_text(state_path, json.dumps(state, indent=2, sort_keys=True))
+    return timings
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rasterize KBYG.ai logo and banner SVGs to PNG")
+    parser.add_argument("roots", nargs="*", type=Path, help="directories to scan (default: logos/, banners/)")
+    parser.add_argument("--scales", default=",".join(map(str, SCALES)),
+                        help="comma-separated scale factors (default: 1,2,3)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render even when PNGs are up to date (PNGs it did not create are still left alone)")
+    parser.add_argument("--rescan", action="store_true", help="walk the roots instead of trusting the asset catalog")
+    parser.add_argument("--regenerate", action="store_true",
+                        help="rewrite the logo and banner SVGs first (create_logo_variations, create_banners)")
+    args = parser.parse_args(argv)
+
+    print("🖼️  KBYG.ai SVG Rasterizer")
+    print("=" * 70)
+    if cairosvg is None:
+        print("❌ Missing required packages!")
+        print("   Run: pip install cairosvg (and install the cairo library, e.g. apt install libcairo2)")
+        sys.exit(1)
+
+    if args.regenerate:
+        import create_banners
+        import create_logo_variations
+
+        create_logo_variations.main()
+        create_banners.main()
+        print()
+
+    started = time.monotonic()
+    scales = tuple(float(scale) for scale in args.scales.split(","))
+    timings = rasterize_tree(args.roots or None, scales, args.workers, args.force, rescan=args.rescan)
+    elapsed = time.monotonic() - started
+    print(f"\n✅ Rendered {len(timings)} PNGs in {elapsed:.1f}s")
+    if timings:
+        slowest = sorted(timings, key=lambda item: item[1], reverse=True)[:5]
+        print(f"   Render time: {sum(seconds for _, seconds in timings):.1f}s total, slowest:")
+        for out_path, seconds in slowest:
+            print(f"      {catalog_name(out_path)} ({seconds * 1000:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiter shared by the KBYG.ai generation workers
+"""
+
+import threading
+import time
+
+def is_quota_error(error):
+    """True if an exception looks like a quota / HTTP 429 rejection"""
+    if getattr(error, "code", None) == 429 or type(error).__name__ == "ResourceExhausted":
+        return True
+    message = str(error).lower()
+    return "429" in message or "quota" in message or "resource exhausted" in message
+
+class TokenBucket:
+    """Thread-safe token bucket with requests-per-minute and burst settings.
+    
+    Quota errors halve the effective rate and drain the bucket; each success
+    recovers a fraction of the configured rate until it is reached again.
+    """
+
+    def __init__(self, requests_per_minute, burst=1, min_requests_per_minute=1.0,
+                 recovery_step=0.1, clock=time.monotonic, sleep=time.sleep):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.max_rate = requests_per_minute / 60.0
+        self.min_rate = min(min_requests_per_minute, requests_per_minute) / 60.0
+        self.rate = self.max_rate
+        self.burst = max(1, burst)
+        self.recovery_step = recovery_step * self.max_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        
+        # Counters
+        self.acquired = 0
+        self.throttle_waits = 0
+        self.throttled_seconds = 0.0
+        self.quota_errors = 0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be issued; returns seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    if waited:
+                        self.throttle_waits += 1
+                        self.throttled_seconds += waited
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def on_success(self):
+        """Additively recover towards the configured rate"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def on_quota_error(self):
+        """Back off multiplicatively after a quota / 429 rejection"""
+        with self._lock:
+            self._refill(self._clock())
+            self.quota_errors += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def requests_per_minute(self):
+        return self.rate * 60.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "throttle_waits": self.throttle_waits,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "quota_errors": self.quota_errors,
+                "requests_per_minute": round(self.rate * 60.0, 2),
+            }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Retry policy for transient image-generation failures
+
+Errors are classified (quota, timeout, unavailable, safety block, bad
+request, unknown); each class has its own attempt limit and backoff base.
+Retries use capped exponential backoff with full jitter and draw from a
+run-wide retry budget. Safety blocks and bad requests are never retried.
+"""
+
+import random
+import threading
+import time
+
+from rate_limiter import is_quota_error
+
+QUOTA = "quota"
+TIMEOUT = "timeout"
+UNAVAILABLE = "unavailable"
+SAFETY = "safety"
+BAD_REQUEST = "bad_request"
+UNKNOWN = "unknown"
+
+# Maximum retries per error class (0 = never retry)
+RETRY_LIMITS = {
+    QUOTA: 5,
+    TIMEOUT: 3,
+    UNAVAILABLE: 3,
+    UNKNOWN: 1,
+    SAFETY: 0,
+    BAD_REQUEST: 0,
+}
+
+# First backoff step per error class, in seconds
+BACKOFF_BASE = {
+    QUOTA: 10.0,
+    TIMEOUT: 2.0,
+    UNAVAILABLE: 2.0,
+    UNKNOWN: 2.0,
+}
+
+def classify(error):
+    """Map an exception to one of the error classes above"""
+    declared = getattr(error, "error_class", None)
+    if declared:
+        return declared
+    if is_quota_error(error):
+        return QUOTA
+    
+    code = getattr(error, "code", None)
+    name = type(error).__name__
+    message = str(error).lower()
+    if (isinstance(error, TimeoutError) or code in (408, 504) or name == "DeadlineExceeded"
+            or "timed out" in message or "deadline" in message):
+        return TIMEOUT
+    if code in (500, 502, 503) or name in ("ServiceUnavailable", "InternalServerError", "BadGateway"):
+        return UNAVAILABLE
+    if "safety" in message or "responsible ai" in message or "blocked" in message:
+        return SAFETY
+    if code == 400 or name in ("InvalidArgument", "BadRequest", "ValueError"):
+        return BAD_REQUEST
+    return UNKNOWN
+
+class RetryBudget:
+    """Run-wide cap on the total number of retries"""
+
+    def __init__(self, max_retries):
+        self.remaining = max_retries
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+class RetryPolicy:
+    """Runs a callable, retrying classified transient errors with jittered backoff"""
+
+    def __init__(self, budget=None, limits=RETRY_LIMITS, backoff_base=BACKOFF_BASE, backoff_cap=120.0,
+                 rng=None, sleep=time.sleep):
+        self.budget = budget or RetryBudget(50)
+        self.limits = limits
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._rng = rng or random.Random()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.retries = {}
+        self.give_ups = {}
+
+    def is_retryable(self, error):
+        return self.limits.get(classify(error), 0) > 0
+
+    def backoff(self, error_class, retry):
+        """Full-jitter delay before retry number `retry` (0-based)"""
+        ceiling = min(self.backoff_cap, self.backoff_base.get(error_class, 2.0) * (2 ** retry))
+        with self._lock:
+            return self._rng.uniform(0, ceiling)
+
+    def _count(self, counter, error_class):
+        with self._lock:
+            counter[error_class] = counter.get(error_class, 0) + 1
+
+    def call(self, fn, on_retry=None):
+        """Call fn() until it succeeds or its error is out of retries; re-raises the last error"""
+        retry = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                error_class = classify(e)
+                if retry >= self.limits.get(error_class, 0) or not self.budget.take():
+                    self._count(self.give_ups, error_class)
+                    raise
+                delay = self.backoff(error_class, retry)
+                self._count(self.retries, error_class)
+                if on_retry is not None:
+                    on_retry(e, error_class, retry + 1, delay)
+                self._sleep(delay)
+                retry += 1
+
+    @staticmethod
+    def _format(counter):
+        total = sum(counter.values())
+        if not total:
+            return "0"
+        return f"{total} (" + ", ".join(f"{k} {v}" for k, v in sorted(counter.items())) + ")"
+
+    def summary(self):
+        return f"Retries: {self._format(self.retries)}; give-ups: {self._format(self.give_ups)}"
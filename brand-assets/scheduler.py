@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Filename matching and priority scheduling for manifest entries
+
+Entries are (category, filename, data) tuples. Manifest data may declare
+"priority" (higher first) and "deadline" (ISO date/time, earlier first).
+The scheduler reads a bounded lookahead window from the (streaming)
+manifest, orders each group by priority, deadline, category weight and
+manifest order, and interleaves groups - by default one group per model,
+so per-model quotas are used side by side. The window starts small and
+grows by one entry per entry yielded, so the first job is not held back
+while the whole window is read.
+
+Category filtering (--only) happens in ManifestReader, before parsing.
+"""
+
+from datetime import datetime
+from fnmatch import fnmatchcase
+import heapq
+from itertools import count
+
+LOOKAHEAD = 256
+INITIAL_WINDOW = 8
+
+def match_entries(entries, patterns=None):
+    """Keep entries whose filename (or category/filename) matches a glob"""
+    patterns = list(patterns or ())
+    for category, filename, data in entries:
+        if patterns and not any(fnmatchcase(filename, p) or fnmatchcase(f"{category}/{filename}", p)
+                                for p in patterns):
+            continue
+        yield category, filename, data
+
+def _deadline(value):
+    if not value:
+        return float("inf")
+    return datetime.fromisoformat(str(value)).timestamp()
+
+class _Group:
+    """Heap of entries for one interleaving group plus its round-robin state"""
+
+    def __init__(self, weight):
+        self.heap = []
+        self.weight = weight
+        self.current = 0
+
+def schedule(entries, lookahead=LOOKAHEAD, category_weights=None, group_key=None, initial_window=INITIAL_WINDOW):
+    """Yield entries in scheduled order while holding at most `lookahead` of them.
+
+    The first entry is yielded after reading `initial_window` entries;
+    the window then grows by one per entry yielded up to `lookahead`.
+
+    group_key(category, data) picks the interleaving group (default: the
+    whole stream is one group). Groups are served by smooth weighted
+    round-robin; a group's weight is the highest category weight in it.
+    """
+    category_weights = category_weights or {}
+    group_key = group_key or (lambda category, data: None)
+    entries = iter(entries)
+    groups = {}
+    sequence = count()
+    held = 0
+    window = max(1, min(initial_window, lookahead))
+    
+    def admit(entry):
+        category, _, data = entry
+        weight = category_weights.get(category, 1)
+        key = group_key(category, data)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = _Group(weight)
+        group.weight = max(group.weight, weight)
+        heapq.heappush(group.heap, (
+            -float(data.get("priority", 0)),
+            _deadline(data.get("deadline")),
+            -weight,
+            next(sequence),
+            entry,
+        ))
+    
+    exhausted = False
+    while True:
+        # Keep the window full
+        while not exhausted and held < window:
+            entry = next(entries, None)
+            if entry is None:
+                exhausted = True
+                break
+            admit(entry)
+            held += 1
+        if not held:
+            return
+        
+        # Strictly higher priority wins across groups; ties share by weighted round-robin
+        active = [g for g in groups.values() if g.heap]
+        top = min(g.heap[0][0] for g in active)
+        candidates = [g for g in active if g.heap[0][0] == top]
+        total = sum(g.weight for g in candidates)
+        for g in candidates:
+            g.current += g.weight
+        chosen = max(candidates, key=lambda g: g.current)
+        chosen.current -= total
+        
+        held -= 1
+        window = min(window + 1, lookahead)
+        yield heapq.heappop(chosen.heap)[-1]
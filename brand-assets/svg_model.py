@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Minimal SVG document model for recoloring brand artwork
+
+A template is parsed once into a small element tree that keeps what the
+templates care about verbatim - attribute order, comments, whitespace and
+self-closing tag spelling - so an unmodified document serializes back to
+its input (only line breaks between attributes are collapsed). Every paint value (fill, stroke and stop-color, as an
+attribute or inside style="") becomes a slot, and the tree is serialized
+once with the slots left open: rendering a variant is just joining the
+fixed text with each slot's original or recolored value.
+
+Recolor maps are {property: {color: replacement}}. Colors are matched in
+normalized form, so #3B82F6, #38f-style shorthand, rgb(59, 130, 246) and
+named colors all match their #rrggbb key.
+"""
+
+import re
+from xml.parsers import expat
+
+PAINT_PROPERTIES = ("fill", "stroke", "stop-color")
+SIZE_ATTRIBUTES = ("width", "height")
+
+NAMED_COLORS = {
+    "white": "#ffffff", "black": "#000000", "red": "#ff0000", "lime": "#00ff00", "blue": "#0000ff",
+    "yellow": "#ffff00", "cyan": "#00ffff", "aqua": "#00ffff", "magenta": "#ff00ff", "fuchsia": "#ff00ff",
+    "gray": "#808080", "grey": "#808080", "silver": "#c0c0c0", "maroon": "#800000", "olive": "#808000",
+    "green": "#008000", "purple": "#800080", "teal": "#008080", "navy": "#000080", "orange": "#ffa500",
+}
+
+_RGB = re.compile(r"rgba?\(\s*(\d+%?)\s*,?\s*(\d+%?)\s*,?\s*(\d+%?)")
+_SLOT = "\x00{}\x00"
+_SLOT_SPLIT = re.compile("\x00(\\d+)\x00")
+_EMPTY_TAG_END = re.compile(rb"\s*/>$")
+
+def normalize_color(value):
+    """Canonical form for comparing paint values: #rrggbb for colors, compacted text otherwise"""
+    value = value.strip().lower()
+    if value.startswith("#") and len(value) in (4, 5):
+        return "#" + "".join(char * 2 for char in value[1:4])
+    if value.startswith("#") and len(value) in (7, 9):
+        return value[:7]
+    match = _RGB.match(value)
+    if match:
+        channels = [round(int(part[:-1]) * 2.55) if part.endswith("%") else int(part) for part in match.groups()]
+        return "#" + "".join(f"{min(channel, 255):02x}" for channel in channels)
+    return NAMED_COLORS.get(value, re.sub(r"\s+", "", value))
+
+def normalize_recolor(recolor):
+    return {prop: {normalize_color(old): new for old, new in mapping.items()} for prop, mapping in recolor.items()}
+
+def _scale_length(value, scale):
+    match = re.match(r"\s*([\d.]+)(.*)$", value)
+    if scale == 1 or not match:
+        return _escape_attribute(value)
+    return f"{float(match.group(1)) * scale:g}{_escape_attribute(match.group(2))}"
+
+def _escape_text(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def _escape_attribute(value):
+    return _escape_text(value).replace('"', "&quot;").replace("\n", "&#10;")
+
+class Element:
+    """SVG element: ordered attributes, children, and the text/tail around them (ElementTree-style)"""
+
+    def __init__(self, tag, attrib):
+        self.tag = tag
+        self.attrib = attrib
+        self.children = []
+        self.text = ""
+        self.tail = ""
+        self.empty_tag_end = None  # e.g. " />" when written as an empty-element tag
+
+    def iter(self):
+        yield self
+        for child in self.children:
+            if isinstance(child, Element):
+                yield from child.iter()
+
+    def serialize(self, out):
+        out.append(f"<{self.tag}")
+        for name, value in self.attrib.items():
+            out.append(f' {name}="{_escape_attribute(value)}"')
+        if self.empty_tag_end is not None and not self.children and not self.text:
+            out.append(self.empty_tag_end)
+        else:
+            out.append(">" + _escape_text(self.text))
+            for child in self.children:
+                child.serialize(out)
+            out.append(f"</{self.tag}>")
+        out.append(_escape_text(self.tail))
+
+class Comment:
+    def __init__(self, text):
+        self.text = text
+        self.tail = ""
+
+    def serialize(self, out):
+        out.append(f"<!--{self.text}-->{_escape_text(self.tail)}")
+
+def parse_tree(text):
+    """(prolog, root Element, epilogue) - the text around the root element is kept verbatim"""
+    data = text.encode("utf-8")
+    parser = expat.ParserCreate()
+    stack = []
+    root = None
+    last = None  # node whose text/tail receives the next character data
+    starts = []
+    root_end = len(data)
+
+    def start(tag, attrib):
+        nonlocal root, last
+        element = Element(tag, attrib)
+        if stack:
+            stack[-1].children.append(element)
+        else:
+            root = element
+        stack.append(element)
+        starts.append(parser.CurrentByteIndex)
+        last = None
+
+    def end(tag):
+        nonlocal last, root_end
+        element = stack.pop()
+        begin = starts.pop()
+        index = parser.CurrentByteIndex
+        if data[index:index + 2] != b"</":
+            # Empty-element tag (expat reports its end just past the tag): keep its "/>" spelling
+            element.empty_tag_end = _EMPTY_TAG_END.search(data[begin:index]).group(0).decode()
+            root_end = index
+        else:
+            root_end = data.index(b">", index) + 1
+        last = element
+
+    def characters(chunk):
+        if last is not None:
+            last.tail += chunk
+        elif stack:
+            stack[-1].text += chunk
+
+    def comment(chunk):
+        nonlocal last
+        if stack:
+            node = Comment(chunk)
+            stack[-1].children.append(node)
+            last = node
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+    parser.CommentHandler = comment
+    parser.Parse(data, True)
+    prolog = text[:text.index(f"<{root.tag}")]
+    return prolog, root, data[root_end:].decode("utf-8")
+
+class SVGDocument:
+    """Parsed SVG with its paint values exposed as recolorable slots"""
+
+    def __init__(self, root, slots, chunks):
+        self.root = root
+        self.slots = slots  # [(property, original text, normalized color)]
+        self._chunks = chunks
+
+    @classmethod
+    def parse(cls, text):
+        prolog, root, epilogue = parse_tree(text)
+        slots = []
+
+        def open_slot(prop, value):
+            slots.append((prop, value, normalize_color(value)))
+            return _SLOT.format(len(slots) - 1)
+
+        # Outer size is a slot too, so variants can be scaled (the viewBox is left alone)
+        for prop in SIZE_ATTRIBUTES:
+            if prop in root.attrib:
+                root.attrib[prop] = open_slot(prop, root.attrib[prop])
+
+        for element in root.iter():
+            for prop in PAINT_PROPERTIES:
+                if prop in element.attrib:
+                    element.attrib[prop] = open_slot(prop, element.attrib[prop])
+            style = element.attrib.get("style")
+            if style:
+                declarations = []
+                for declaration in style.split(";"):
+                    name, sep, value = declaration.partition(":")
+                    if sep and name.strip() in PAINT_PROPERTIES:
+                        stripped = value.strip()
+                        value = value.replace(stripped, open_slot(name.strip(), stripped), 1)
+                    declarations.append(name + sep + value)
+                element.attrib["style"] = ";".join(declarations)
+
+        out = [prolog]
+        root.serialize(out)
+        out.append(epilogue)
+        # Alternates fixed text and slot indexes: [text, index, text, ..., text]
+        return cls(root, slots, _SLOT_SPLIT.split("".join(out)))
+
+    def colors(self, prop=None):
+        """Normalized paint values in the document (optionally for one property)"""
+        return {color for slot_prop, _, color in self.slots
+                if slot_prop in PAINT_PROPERTIES and prop in (None, slot_prop)}
+
+    def render(self, recolor=None, scale=1):
+        """Serialize with a recolor map applied ({property: {color: replacement}}), optionally scaled"""
+        mapping = normalize_recolor(recolor) if recolor else {}
+        parts = []
+        for index, chunk in enumerate(self._chunks):
+            if index % 2 == 0:
+                parts.append(chunk)
+                continue
+            prop, original, color = self.slots[int(chunk)]
+            if prop in SIZE_ATTRIBUTES:
+                parts.append(_scale_length(original, scale))
+            else:
+                parts.append(_escape_attribute(mapping.get(prop, {}).get(color, original)))
+        return "".join(parts)
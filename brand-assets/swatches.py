@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+In-process color swatch renderer (no ImageMagick, no Pillow)
+
+Solid swatches, combined strips for any number of colors, and tint/shade
+ramps are encoded straight from packed rows with png_writer. A solid
+image is one repeated row, so a 400x400 swatch costs a few milliseconds.
+Files whose bytes would not change are left untouched.
+"""
+
+from pathlib import Path
+
+from fileutil import write_if_changed
+from png_writer import encode_png, hex_to_rgb, solid_png
+
+SWATCH_SIZE = 400
+RAMP_STEPS = (0.8, 0.6, 0.4, 0.2, 0.0, -0.2, -0.4, -0.6)  # + mixes toward white, - toward black
+
+def rgb_to_hex(rgb):
+    return "#" + "".join(f"{channel:02x}" for channel in rgb)
+
+def mix(hex_color, amount):
+    """Tint (amount > 0, toward white) or shade (amount < 0, toward black) a color"""
+    target = 255 if amount > 0 else 0
+    return rgb_to_hex(round(channel + (target - channel) * abs(amount)) for channel in hex_to_rgb(hex_color))
+
+def ramp(hex_color, steps=RAMP_STEPS):
+    """Colors from lightest tint to darkest shade, the base color included at 0.0"""
+    return [mix(hex_color, amount) for amount in steps]
+
+def swatch_png(hex_color, size=SWATCH_SIZE):
+    return solid_png(size, size, hex_to_rgb(hex_color))
+
+def strip_png(hex_colors, size=SWATCH_SIZE):
+    """Square swatches side by side, left to right"""
+    row = b"".join(bytes(hex_to_rgb(color)) * size for color in hex_colors)
+    return encode_png(size * len(hex_colors), size, (row for _ in range(size)))
+
+def write_swatches(colors, output_dir, strip=None, ramps=(), size=SWATCH_SIZE):
+    """Write swatch-<name>.png per color, swatch-all-colors.png for `strip` and
+    swatch-<name>-ramp.png per name in `ramps`; returns {filename: changed}"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+    for name, hex_color in colors.items():
+        filename = f"swatch-{name}.png"
+        results[filename] = write_if_changed(output_dir / filename, swatch_png(hex_color, size))
+    strip_colors = [colors[name] for name in strip] if strip is not None else list(colors.values())
+    if strip_colors:
+        results["swatch-all-colors.png"] = write_if_changed(output_dir / "swatch-all-colors.png",
+                                                            strip_png(strip_colors, size))
+    for name in ramps:
+        filename = f"swatch-{name}-ramp.png"
+        results[filename] = write_if_changed(output_dir / filename, strip_png(ramp(colors[name]), size // 4))
+    return results
@@ -0,0 +1,6 @@
+"""The brand-assets scripts are flat modules, so make them importable from the tests"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
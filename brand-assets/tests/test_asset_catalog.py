@@ -0,0 +1,81 @@
+import os
+
+import asset_catalog
+from asset_catalog import AssetCatalog
+from fileutil import atomic_write_bytes
+
+SVG = b'<svg width="10" height="20" xmlns="http://www.w3.org/2000/svg"/>'
+
+
+def _bump_mtime(path):
+    # Directory mtimes can have coarse resolution; make the change unambiguous
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_refresh_rescans_only_changed_directories(tmp_path):
+    root = tmp_path / "logos"
+    (root / "dark").mkdir(parents=True)
+    (root / "primary").mkdir()
+    (root / "dark" / "a.svg").write_bytes(SVG)
+    (root / "primary" / "b.svg").write_bytes(SVG)
+
+    with AssetCatalog(tmp_path / "catalog.sqlite") as catalog:
+        assert catalog.refresh([root]) == 3
+        assert catalog.count(root, ".svg") == 2
+        assert catalog.refresh([root]) == 0
+
+        (root / "dark" / "c.svg").write_bytes(SVG)
+        _bump_mtime(root / "dark")
+        assert catalog.refresh([root]) == 1
+        assert catalog.count(root / "dark", ".svg") == 2
+
+        (root / "primary" / "b.svg").unlink()
+        (root / "primary").rmdir()
+        _bump_mtime(root)
+        catalog.refresh([root])
+        assert [path.name for path in catalog.files(root, ".svg")] == ["a.svg", "c.svg"]
+
+
+def test_atomic_replace_is_picked_up_and_current_rehashes_in_place_edits(tmp_path):
+    root = tmp_path / "banners"
+    root.mkdir()
+    path = root / "a.svg"
+    path.write_bytes(SVG)
+
+    with AssetCatalog(tmp_path / "catalog.sqlite") as catalog:
+        catalog.refresh([root])
+        first = catalog.get(path)["sha256"]
+
+        atomic_write_bytes(path, SVG.replace(b"10", b"30"))
+        _bump_mtime(root)
+        catalog.refresh([root])
+        assert catalog.get(path)["width"] == 30
+
+        with open(path, "wb") as handle:
+            handle.write(SVG)
+        _bump_mtime(path)
+        assert catalog.current(path)["sha256"] == first
+
+
+def test_brand_assets_root_refreshes_once_and_lists_its_own_files(tmp_path, monkeypatch):
+    base = tmp_path / "brand-assets"
+    (base / "logos").mkdir(parents=True)
+    (base / "top.svg").write_bytes(SVG)
+    (base / "logos" / "a.svg").write_bytes(SVG)
+    outside = tmp_path / "src"
+    outside.mkdir()
+    (outside / "b.svg").write_bytes(SVG)
+    monkeypatch.setattr(asset_catalog, "BASE_DIR", base)
+
+    with AssetCatalog(tmp_path / "catalog.sqlite") as catalog:
+        assert catalog.refresh([outside]) == 1
+        assert catalog.refresh([base]) == 2
+        assert catalog.refresh([base]) == 0
+        assert catalog.files(base, ".svg", recursive=False) == [base / "top.svg"]
+        assert catalog.count(base, ".svg") == 2
+
+        catalog.scan([base])
+        assert catalog.refresh([base]) == 0
+        # Files cataloged outside brand-assets/ are not part of its subtree
+        assert catalog.count(outside, ".svg") == 1
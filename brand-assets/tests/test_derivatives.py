@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+import derivatives
+
+
+def test_one_bad_source_is_skipped_and_the_index_is_still_written(tmp_path):
+    good = tmp_path / "good.png"
+    Image.new("RGB", (64, 32), (59, 130, 246)).save(good)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not a png")
+    index_path = tmp_path / "index.json"
+
+    encoded, skipped, failed = derivatives.build_derivatives([good, broken, good], ["webp"], widths=(32,),
+                                                             workers=1, index_path=index_path,
+                                                             output_dir=tmp_path / "derivatives")
+
+    assert (encoded, skipped, failed) == (1, 0, 1)
+    entries = json.loads(index_path.read_text())["sources"]
+    assert list(entries) == [derivatives.relative_name(good)]
+    assert [d["width"] for d in entries[derivatives.relative_name(good)]["derivatives"]] == [32]
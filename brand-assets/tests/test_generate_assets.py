@@ -0,0 +1,11 @@
+import generate_assets
+
+
+def test_repeated_calls_reuse_one_loaded_model(tmp_path):
+    for index in range(3):
+        assert generate_assets.generate_image_with_imagen(f"prompt {index}", tmp_path / f"image-{index}.png",
+                                                          backend="local", load_latency=0.01)
+
+    models = generate_assets.backend_models("local", load_latency=0.01)
+    assert len(models.load_times) == 1
+    assert all((tmp_path / f"image-{index}.png").exists() for index in range(3))
@@ -0,0 +1,61 @@
+import generate_images_with_imagen as imagen
+from generation_cache import GenerationCache
+from generation_journal import GenerationJournal
+from imagen_backends import create_models
+
+
+def _manifest(prompt):
+    return {"patterns": {"pattern.png": {"prompt": prompt, "ratio": "1:1"}}}
+
+
+def _generate(tmp_path, journal, prompt, cache=None):
+    """Run the one-entry manifest through iter_jobs/run_jobs, returning the jobs issued"""
+    jobs = list(imagen.iter_jobs(_manifest(prompt), cache=cache, journal=journal,
+                                 categories=[("patterns", tmp_path)]))
+    imagen.run_jobs(jobs, workers=1, models=create_models("local"), cache=cache, journal=journal)
+    return jobs
+
+
+def test_done_entry_is_skipped_while_its_output_exists(tmp_path):
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+
+    assert len(_generate(tmp_path, journal, "grid")) == 1
+    assert _generate(tmp_path, journal, "grid") == []
+    journal.close()
+
+
+def test_deleted_output_is_regenerated_despite_done_entry(tmp_path):
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+    _generate(tmp_path, journal, "grid")
+
+    (tmp_path / "pattern.png").unlink()
+
+    assert len(_generate(tmp_path, journal, "grid")) == 1
+    assert (tmp_path / "pattern.png").exists()
+    journal.close()
+
+
+def test_edited_prompt_is_regenerated_without_a_cache(tmp_path):
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+    _generate(tmp_path, journal, "grid")
+    before = (tmp_path / "pattern.png").read_bytes()
+
+    jobs = _generate(tmp_path, journal, "dots")
+
+    assert [job.prompt for job in jobs] == ["dots"]
+    assert (tmp_path / "pattern.png").read_bytes() != before
+    journal.close()
+
+
+def test_output_from_an_edited_prompt_is_not_adopted_into_the_cache(tmp_path):
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+    _generate(tmp_path, journal, "grid")
+    before = (tmp_path / "pattern.png").read_bytes()
+    cache = GenerationCache(tmp_path / "cache")
+
+    jobs = _generate(tmp_path, journal, "dots", cache=cache)
+
+    assert [job.prompt for job in jobs] == ["dots"]
+    assert cache.get(jobs[0].cache_key) != [before]
+    assert (tmp_path / "pattern.png").read_bytes() != before
+    journal.close()
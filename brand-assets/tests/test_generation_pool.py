@@ -0,0 +1,214 @@
+"""Worker pool, rate limiter and retry behaviour of the Imagen driver, run against the offline backend"""
+
+import threading
+
+import pytest
+
+import generate_images_with_imagen as imagen
+from generation_cache import GenerationCache
+from generation_journal import FAILED, GenerationJournal
+from imagen_backends import LocalImageModel, SimulatedError
+from rate_limiter import TokenBucket
+from retry_policy import QUOTA, RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class GatedModel(LocalImageModel):
+    """Local model that holds every request until `gate_at` are in flight at once, counting the peak.
+
+    A pool that never overlaps that many requests fails on the gate timeout
+    instead of depending on wall-clock timing.
+    """
+
+    def __init__(self, gate_at):
+        super().__init__("gated")
+        self.gate_at = gate_at
+        self.gate = threading.Event()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.count_lock = threading.Lock()
+
+    def generate_images(self, **kwargs):
+        with self.count_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.in_flight >= self.gate_at:
+                self.gate.set()
+        try:
+            if not self.gate.wait(timeout=10):
+                raise AssertionError(f"never reached {self.gate_at} concurrent requests")
+            return super().generate_images(**kwargs)
+        finally:
+            with self.count_lock:
+                self.in_flight -= 1
+
+
+class QuotaThenOk(LocalImageModel):
+    """Fails every prompt with a 429 `failures` times, then succeeds"""
+
+    def __init__(self, failures):
+        super().__init__("quota")
+        self.failures = failures
+        self.attempts = {}
+
+    def generate_images(self, prompt, **kwargs):
+        attempt = self.attempts[prompt] = self.attempts.get(prompt, 0) + 1
+        if attempt <= self.failures:
+            raise SimulatedError("429 Resource exhausted (test)", 429, QUOTA)
+        return super().generate_images(prompt=prompt, **kwargs)
+
+
+class FullDiskCache(GenerationCache):
+    def put(self, key, blobs, metadata=None):
+        raise OSError(28, "No space left on device")
+
+
+def _jobs(tmp_path, count):
+    return [imagen.Job("patterns", f"image-{index}.png", f"prompt {index}", tmp_path / f"image-{index}.png",
+                       "1:1", "local", f"key-{index}", 1)
+            for index in range(count)]
+
+
+def _fast_limiter():
+    return TokenBucket(requests_per_minute=60_000, burst=100)
+
+
+def _no_sleep_policy(retries):
+    return RetryPolicy(RetryBudget(retries), sleep=lambda seconds: None)
+
+
+@pytest.mark.parametrize("workers", [1, 4, 8])
+def test_pool_keeps_exactly_workers_requests_in_flight(tmp_path, workers):
+    model = GatedModel(gate_at=workers)
+    jobs = workers * 3
+
+    generated, failed = imagen.run_jobs(_jobs(tmp_path, jobs), model=model, workers=workers,
+                                        limiter=_fast_limiter(), retry_policy=_no_sleep_policy(0))
+
+    assert (generated, failed) == (jobs, 0)
+    assert model.max_in_flight == workers
+    assert all((tmp_path / f"image-{index}.png").exists() for index in range(jobs))
+
+
+def test_quota_errors_back_off_and_then_succeed(tmp_path):
+    limiter = _fast_limiter()
+    policy = _no_sleep_policy(10)
+
+    generated, failed = imagen.run_jobs(_jobs(tmp_path, 2), model=QuotaThenOk(failures=2), workers=2,
+                                        limiter=limiter, retry_policy=policy)
+
+    assert (generated, failed) == (2, 0)
+    assert policy.retries == {QUOTA: 4}
+    assert limiter.quota_errors == 4
+    assert limiter.requests_per_minute < 60_000
+
+
+def test_token_bucket_halves_rate_and_waits_after_a_429():
+    clock = FakeClock()
+    bucket = TokenBucket(60, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    bucket.on_quota_error()
+    assert bucket.requests_per_minute == 30
+    # Drained bucket at 0.5 requests/s: the next request waits two seconds
+    assert bucket.acquire() == pytest.approx(2.0)
+    bucket.on_success()
+    assert bucket.requests_per_minute == pytest.approx(36)
+
+
+def test_quota_backoff_is_capped_exponential_with_jitter():
+    policy = RetryPolicy(RetryBudget(10))
+
+    for retry in range(6):
+        delay = policy.backoff(QUOTA, retry)
+        assert 0 <= delay <= min(policy.backoff_cap, 10.0 * 2 ** retry)
+
+
+def test_exhausted_retry_budget_fails_remaining_jobs(tmp_path):
+    policy = _no_sleep_policy(3)
+
+    generated, failed = imagen.run_jobs(_jobs(tmp_path, 5), model=QuotaThenOk(failures=100), workers=2,
+                                        limiter=_fast_limiter(), retry_policy=policy)
+
+    assert (generated, failed) == (0, 5)
+    assert policy.retries == {QUOTA: 3}
+    assert policy.give_ups == {QUOTA: 5}
+    assert policy.budget.remaining == 0
+
+
+def test_cache_write_error_is_recorded_as_a_failed_job(tmp_path):
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+    jobs = _jobs(tmp_path, 2)
+
+    generated, failed = imagen.run_jobs(jobs, model=LocalImageModel("local"), workers=2, limiter=_fast_limiter(),
+                                        retry_policy=_no_sleep_policy(0), cache=FullDiskCache(tmp_path / "cache"),
+                                        journal=journal)
+
+    assert (generated, failed) == (0, 2)
+    states = {journal.get(imagen.output_name(job.output_path))["state"] for job in jobs}
+    assert states == {FAILED}
+    journal.close()
+
+
+class ShortBatches(LocalImageModel):
+    """Drops one sample from the first batch; later requests return `later` (None: a full batch)"""
+
+    def __init__(self, later=None):
+        super().__init__("short")
+        self.later = later
+        self.requests = []
+
+    def generate_images(self, number_of_images=1, **kwargs):
+        self.requests.append(number_of_images)
+        images = super().generate_images(number_of_images=number_of_images, **kwargs)
+        if len(self.requests) == 1:
+            return images[:-1]
+        return images if self.later is None else self.later
+
+
+def _variant_jobs(tmp_path, cache, journal, **options):
+    manifest = {"patterns": {"pattern.png": {"prompt": "grid", "ratio": "1:1", "variants": 3}}}
+    return list(imagen.iter_jobs(manifest, cache=cache, journal=journal, categories=[("patterns", tmp_path)],
+                                 **options))
+
+
+def test_dropped_samples_are_requested_again(tmp_path):
+    cache = GenerationCache(tmp_path / "cache")
+    model = ShortBatches()
+    jobs = _variant_jobs(tmp_path, cache, None)
+
+    generated, failed = imagen.run_jobs(jobs, model=model, workers=1, limiter=_fast_limiter(),
+                                        retry_policy=_no_sleep_policy(0), cache=cache)
+
+    assert (generated, failed) == (1, 0)
+    assert model.requests == [3, 1]
+    assert len(cache.get(jobs[0].cache_key)) == 3
+    assert all(path.exists() for path in imagen.variant_paths(jobs[0].output_path, 3))
+
+
+def test_incomplete_variant_set_is_not_cached_or_journaled_done(tmp_path):
+    cache = GenerationCache(tmp_path / "cache")
+    journal = GenerationJournal(tmp_path / "journal.jsonl")
+    jobs = _variant_jobs(tmp_path, cache, journal)
+
+    generated, failed = imagen.run_jobs(jobs, model=ShortBatches(later=[]), workers=1, limiter=_fast_limiter(),
+                                        retry_policy=_no_sleep_policy(0), cache=cache, journal=journal)
+
+    assert (generated, failed) == (0, 1)
+    assert not cache.has(jobs[0].cache_key)
+    assert journal.get(imagen.output_name(jobs[0].output_path))["state"] == FAILED
+    # Safety failures are permanent; --retry-failed issues the job again instead of restoring a short set
+    assert [job.filename for job in _variant_jobs(tmp_path, cache, journal, retry_failed=True)] == ["pattern.png"]
+    journal.close()
@@ -0,0 +1,55 @@
+import importlib
+
+import pytest
+
+import create_banners
+import create_logo_variations
+import palette
+
+OLD_BLUE, NEW_BLUE = "#3b82f6", "#2563eb"
+
+
+def _render(module):
+    primary = module.create_horizontal_primary()
+    return {
+        "primary": primary,
+        "white": module.make_white_version(primary),
+        "dark": module.make_dark_version(primary),
+        "icon": module.create_icon_svgs()["icon-square-512.svg"],
+    }
+
+
+@pytest.fixture
+def edit_palette(monkeypatch):
+    """Callable that reloads the template modules against a palette.json whose gtm-blue is NEW_BLUE"""
+    def edit():
+        edited = palette.load_palette()
+        edited["brand"]["gtm-blue"]["value"] = NEW_BLUE
+        monkeypatch.setattr(palette, "load_palette", lambda path=palette.PALETTE_PATH: edited)
+        importlib.reload(create_logo_variations)
+        importlib.reload(create_banners)
+
+    yield edit
+    monkeypatch.undo()
+    importlib.reload(create_logo_variations)
+    importlib.reload(create_banners)
+
+
+def test_logos_and_themes_follow_an_edited_brand_color(edit_palette):
+    original = _render(create_logo_variations)
+    assert all(OLD_BLUE in svg for svg in original.values())
+
+    edit_palette()
+    edited = _render(create_logo_variations)
+
+    for name, svg in edited.items():
+        assert OLD_BLUE not in svg, name
+        assert svg == original[name].replace(OLD_BLUE, NEW_BLUE), name
+
+
+def test_banners_follow_an_edited_brand_color(edit_palette):
+    original = create_banners.create_banner_svg(1584, 396, "LinkedIn")
+
+    edit_palette()
+
+    assert create_banners.create_banner_svg(1584, 396, "LinkedIn") == original.replace(OLD_BLUE, NEW_BLUE)
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+import optimize_pngs
+
+
+def _la_png(path):
+    image = Image.new("LA", (32, 32), (0, 0))
+    for x in range(16):
+        image.putpixel((x, x), (255, 128))
+    image.save(path, format="PNG", compress_level=0)
+    return path
+
+
+def test_la_png_is_optimized_without_quantizing(tmp_path):
+    path = _la_png(tmp_path / "icon-minimal.png")
+    with Image.open(path) as original:
+        pixels = original.tobytes()
+
+    _, before, after, _ = optimize_pngs.optimize_file(path)
+
+    assert after <= before
+    with Image.open(path) as optimized:
+        assert optimized.mode == "LA"
+        assert optimized.tobytes() == pixels
+
+
+def test_one_bad_file_is_skipped_and_state_is_saved(tmp_path):
+    root = tmp_path / "images"
+    root.mkdir()
+    good = _la_png(root / "good.png")
+    (root / "broken.png").write_bytes(b"not a png")
+    state_path = tmp_path / "state.json"
+
+    report = optimize_pngs.optimize_tree([root], workers=1, state_path=state_path)
+
+    state = json.loads(state_path.read_text())
+    assert optimize_pngs._relative(good) in state
+    assert optimize_pngs._relative(root / "broken.png") not in state
+    assert report["images"][0] == 1
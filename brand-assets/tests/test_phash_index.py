@@ -0,0 +1,38 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+import phash_index
+
+
+def _images(root, count):
+    root.mkdir()
+    for index in range(count):
+        Image.new("RGB", (16, 16), (index * 40, 0, 0)).save(root / f"image-{index}.png")
+    return root
+
+
+def test_update_of_one_root_keeps_records_under_other_roots(tmp_path):
+    heroes = _images(tmp_path / "heroes", 2)
+    patterns = _images(tmp_path / "patterns", 3)
+    index = phash_index.PerceptualIndex(tmp_path / "index.bin")
+    index.update([heroes, patterns], workers=1)
+
+    index.update([heroes], workers=1)
+
+    assert len(index.records) == 5
+
+
+def test_update_drops_vanished_files_under_the_scanned_root(tmp_path):
+    heroes = _images(tmp_path / "heroes", 2)
+    patterns = _images(tmp_path / "patterns", 3)
+    index = phash_index.PerceptualIndex(tmp_path / "index.bin")
+    index.update([heroes, patterns], workers=1)
+
+    (heroes / "image-0.png").unlink()
+    index.update([heroes], workers=1)
+
+    assert sorted(index.records) == sorted(
+        [phash_index._relative(heroes / "image-1.png")]
+        + [phash_index._relative(patterns / f"image-{index}.png") for index in range(3)]
+    )
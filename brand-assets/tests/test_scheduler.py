@@ -0,0 +1,48 @@
+from scheduler import match_entries, schedule
+
+
+def _entries(count, read=None):
+    for index in range(count):
+        if read is not None:
+            read.append(index)
+        yield "patterns", f"pattern-{index}.png", {"priority": index % 3}
+
+
+def test_first_entry_is_yielded_after_the_initial_window():
+    read = []
+    scheduled = schedule(_entries(1000, read), lookahead=256, initial_window=8)
+
+    next(scheduled)
+
+    assert len(read) == 8
+
+
+def test_window_grows_to_the_lookahead():
+    read = []
+    scheduled = schedule(_entries(1000, read), lookahead=32, initial_window=4)
+
+    for _ in range(100):
+        next(scheduled)
+
+    # 100 yielded plus a full window held
+    assert len(read) == 100 + 32 - 1
+
+
+def test_priority_is_respected_within_the_window():
+    order = [data["priority"] for _, _, data in schedule(_entries(9), lookahead=9, initial_window=9)]
+
+    assert order == [2, 2, 2, 1, 1, 1, 0, 0, 0]
+
+
+def test_every_entry_is_yielded_once():
+    names = [filename for _, filename, _ in schedule(_entries(50), lookahead=16, initial_window=2)]
+
+    assert sorted(names) == sorted(f"pattern-{index}.png" for index in range(50))
+
+
+def test_match_entries_filters_by_filename_or_category_path():
+    entries = list(_entries(3)) + [("icons", "pattern-0.png", {})]
+
+    assert [filename for _, filename, _ in match_entries(entries, ["pattern-1.*"])] == ["pattern-1.png"]
+    assert [category for category, _, _ in match_entries(entries, ["icons/*"])] == ["icons"]
+    assert len(list(match_entries(entries))) == 4
@@ -0,0 +1,46 @@
+import json
+
+import theme_matrix
+from theme_matrix import Combination
+
+
+def _rendered(output_dir):
+    return sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob("*.svg"))
+
+
+def _run(tmp_path, *options):
+    palette_file = tmp_path / "seasonal.json"
+    palette_file.write_text(json.dumps({"seasonal": {"fill": {"#111827": "#7f1d1d"}}}))
+    output_dir = tmp_path / "logos"
+    theme_matrix.main(["--layouts", "horizontal", "--palette-file", str(palette_file), "--output", str(output_dir),
+                       "--workers", "1", *options])
+    return _rendered(output_dir)
+
+
+def test_png_outputs_never_take_the_hand_exported_names():
+    for palette in ("primary", "white", "dark"):
+        svg = theme_matrix.output_path(Combination("horizontal", palette, 1, "svg"))
+        png = theme_matrix.output_path(Combination("horizontal", palette, 1, "png"))
+
+        assert png.name == f"{svg.stem}@1x.png"
+        assert png != svg.with_suffix(".png")
+
+
+def test_palettes_option_selects_only_the_named_palettes(tmp_path, capsys):
+    assert _run(tmp_path, "--palettes", "white,seasonal,white") == [
+        "seasonal/logo-horizontal-seasonal.svg",
+        "white/logo-horizontal-white.svg",
+    ]
+    assert "1 layouts x 2 palettes" in capsys.readouterr().out
+
+
+def test_default_palettes_include_file_palettes_once(tmp_path, capsys):
+    rendered = _run(tmp_path)
+
+    assert "1 layouts x 4 palettes" in capsys.readouterr().out
+    assert rendered == [
+        "dark/logo-horizontal-dark.svg",
+        "primary/logo-horizontal.svg",
+        "seasonal/logo-horizontal-seasonal.svg",
+        "white/logo-horizontal-white.svg",
+    ]
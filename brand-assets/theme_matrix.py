@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Render every KBYG.ai logo layout x palette x size x format in one pass
+
+The matrix is declarative: layouts are the create_*_primary templates,
+palettes are svg_model recolor maps (extra seasonal or co-brand palettes
+can be loaded from JSON), sizes are scale factors and formats are svg
+and/or png. Combinations are expanded lazily and rendered on a process
+pool, each worker parsing a layout once and reusing it for every palette
+and size. Outputs with identical bytes are written once and hardlinked
+(copied where links are unsupported); files already up to date are not
+touched.
+"""
+
+import argparse
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+import itertools
+import json
+import os
+from pathlib import Path
+import shutil
+import sys
+import time
+
+import create_logo_variations
+from fileutil import atomic_write_bytes, sha256_bytes, sha256_file
+from svg_model import SVGDocument
+
+BASE_DIR = Path(__file__).parent
+LOGOS_DIR = BASE_DIR / "logos"
+
+LAYOUTS = {
+    "horizontal": create_logo_variations.create_horizontal_primary,
+    "vertical": create_logo_variations.create_vertical_primary,
+    "stacked": create_logo_variations.create_stacked_primary,
+    "compact": create_logo_variations.create_compact_primary,
+    "full": create_logo_variations.create_full_primary,
+}
+PALETTES = {
+    "primary": {},
+    "white": create_logo_variations.WHITE_RECOLOR,
+    "dark": create_logo_variations.DARK_RECOLOR,
+}
+SIZES = (1,)
+FORMATS = ("svg",)
+
+Combination = namedtuple("Combination", "layout palette scale fmt")
+
+def output_path(combination, output_dir=LOGOS_DIR):
+    """logos/<palette>/logo-<layout>[-<palette>][@<scale>x].<fmt> - matches the hand-made layout.
+
+    PNGs always carry the scale, like rasterize_svgs, so the hand-exported
+    logo-*.png twins are never overwritten.
+    """
+    layout, palette, scale, fmt = combination
+    suffix = "" if palette == "primary" else f"-{palette}"
+    scale_suffix = "" if scale == 1 and fmt == "svg" else f"@{scale:g}x"
+    return Path(output_dir) / palette / f"logo-{layout}{suffix}{scale_suffix}.{fmt}"
+
+def expand(layouts, palettes, sizes, formats):
+    """Lazily yield every Combination"""
+    return itertools.starmap(Combination, itertools.product(layouts, palettes, sizes, formats))
+
+@lru_cache(maxsize=None)
+def _document(layout):
+    return SVGDocument.parse(LAYOUTS[layout]())
+
+def png_available():
+    """cairosvg is imported only when PNG output is requested; the SVG-only path never pays for it"""
+    try:
+        import cairosvg  # noqa: F401
+    except (ImportError, OSError):
+        # OSError: the package is installed but libcairo is not
+        return False
+    return True
+
+def render_combination(combination, recolor):
+    """Bytes for one combination (runs in a worker process)"""
+    svg = _document(combination.layout).render(recolor, combination.scale)
+    if combination.fmt == "png":
+        import cairosvg
+
+        return combination, cairosvg.svg2png(bytestring=svg.encode("utf-8"))
+    return combination, svg.encode("utf-8")
+
+def _place(path, data, digest, written):
+    """Write path unless it already holds data; identical outputs become hardlinks. Returns the action"""
+    if path.exists() and path.stat().st_size == len(data) and sha256_file(path) == digest:
+        written.setdefault(digest, path)
+        return "unchanged"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    first = written.get(digest)
+    if first is not None:
+        tmp_path = path.with_name(f".{path.name}.link")
+        try:
+            os.link(first, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            shutil.copyfile(first, path)
+        return "linked"
+    atomic_write_bytes(path, data)
+    written[digest] = path
+    return "written"
+
+def render_matrix(combinations, palettes=PALETTES, output_dir=LOGOS_DIR, workers=None):
+    """Render combinations in parallel; returns {"written"|"linked"|"unchanged": count}"""
+    counts = {"written": 0, "linked": 0, "unchanged": 0}
+    written = {}  # sha256 -> first path holding those bytes
+    workers = workers or os.cpu_count()
+    pending = set()
+
+    def collect(done):
+        for future in done:
+            combination, data = future.result()
+            counts[_place(output_path(combination, output_dir), data, sha256_bytes(data), written)] += 1
+
+    # Bounded submission keeps the expansion lazy however large the matrix is
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for combination in combinations:
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(pool.submit(render_combination, combination, palettes[combination.palette]))
+        collect(wait(pending)[0])
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the KBYG.ai logo theme matrix")
+    parser.add_argument("--layouts", default=",".join(LAYOUTS), help="comma-separated layouts (default: all)")
+    parser.add_argument("--palettes", default=None,
+                        help="comma-separated palettes (default: all, including those from --palette-file)")
+    parser.add_argument("--palette-file", type=Path, action="append", default=[],
+                        help="JSON file of extra palettes: {name: {property: {color: replacement}}} (repeatable)")
+    parser.add_argument("--sizes", default="1", help="comma-separated scale factors (default: 1)")
+    parser.add_argument("--formats", default="svg", help="comma-separated formats: svg, png (default: svg)")
+    parser.add_argument("--output", type=Path, default=LOGOS_DIR, help="output directory (default: logos/)")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    args = parser.parse_args(argv)
+
+    print("🎨 KBYG.ai Logo Theme Matrix")
+    print("=" * 70)
+
+    palettes = dict(PALETTES)
+    for palette_file in args.palette_file:
+        palettes.update(json.loads(palette_file.read_text()))
+    selected = list(dict.fromkeys(args.palettes.split(","))) if args.palettes else list(palettes)
+    layouts = args.layouts.split(",")
+    sizes = [float(size) for size in args.sizes.split(",")]
+    formats = args.formats.split(",")
+    if "png" in formats and not png_available():
+        print("⚠️  cairosvg not available, skipping PNG output")
+        formats.remove("png")
+    unknown = [name for name in layouts if name not in LAYOUTS] + [name for name in selected if name not in palettes]
+    if unknown:
+        print(f"❌ Unknown layouts/palettes: {', '.join(unknown)}")
+        sys.exit(1)
+
+    total = len(layouts) * len(selected) * len(sizes) * len(formats)
+    print(f"📋 {len(layouts)} layouts x {len(selected)} palettes x {len(sizes)} sizes x {len(formats)} formats "
+          f"= {total} outputs")
+    started = time.monotonic()
+    counts = render_matrix(expand(layouts, selected, sizes, formats), palettes, args.output, args.workers)
+    print(f"\n✅ Rendered {total} outputs in {time.monotonic() - started:.1f}s")
+    print(f"   Written: {counts['written']}, hardlinked duplicates: {counts['linked']}, "
+          f"unchanged: {counts['unchanged']}")
+
+if __name__ == "__main__":
+    main()